@@ -0,0 +1,80 @@
+"""Benchmark of the CSS compiler over the stylesheet of the catalog.
+
+Usage:
+
+    python benchmarks/styles.py
+"""
+
+import importlib
+import pkgutil
+import timeit
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import ludic.catalog
+from ludic.styles import GlobalStyles, from_loaded, get_default_theme
+from ludic.styles.compiler import compile_styles, flatten_styles, merge_rules
+
+
+def legacy_format_styles(styles: GlobalStyles, separator: str = "\n") -> str:
+    """The formatter replaced by the compiler, kept as the baseline."""
+    result: list[str] = []
+    nodes_to_parse: list[
+        tuple[list[str], str | Mapping[str | tuple[str, ...], Any]]
+    ] = [([], styles)]
+
+    while nodes_to_parse:
+        parents, node = nodes_to_parse.pop(0)
+
+        content = []
+        if isinstance(node, str):
+            content.append(node)
+        else:
+            for key, value in node.items():
+                if isinstance(value, str | int | float):
+                    content.append(f"{key}: {value};")
+                elif isinstance(value, Mapping):
+                    keys = (key,) if isinstance(key, str | int | float) else key
+                    for key in keys:
+                        if key.startswith("@"):
+                            value = legacy_format_styles(value, separator=" ")
+                        nodes_to_parse.append(([*parents, key], value))
+
+        if content:
+            result.append(f"{' '.join(parents)} {{ {' '.join(content)} }}")
+
+    return separator.join(result)
+
+
+def main() -> None:
+    for module in pkgutil.iter_modules(ludic.catalog.__path__):
+        importlib.import_module(f"{ludic.catalog.__name__}.{module.name}")
+    styles = from_loaded(theme=get_default_theme())
+    rules = flatten_styles(styles)
+
+    benchmarks: dict[str, Callable[[], object]] = {
+        "legacy format_styles": lambda: legacy_format_styles(styles),
+        "flatten": lambda: flatten_styles(styles),
+        "merge": lambda: merge_rules(rules),
+        "compile (pretty)": lambda: compile_styles(styles),
+        "compile (minified)": lambda: compile_styles(styles, minify=True),
+        "compile (merged)": lambda: compile_styles(styles, merge=True),
+    }
+    print(f"{len(rules)} rules in the catalog stylesheet\n")
+    for name, benchmark in benchmarks.items():
+        runs, total = timeit.Timer(benchmark).autorange()
+        print(f"{name:<24}{total / runs * 1000:>10.3f} ms")
+
+    print()
+    outputs = {
+        "legacy": legacy_format_styles(styles),
+        "pretty": compile_styles(styles),
+        "minified": compile_styles(styles, minify=True),
+        "merged, minified": compile_styles(styles, minify=True, merge=True),
+    }
+    for name, output in outputs.items():
+        print(f"{name:<24}{len(output.encode()):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
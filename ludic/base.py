@@ -86,6 +86,30 @@ class BaseElement(metaclass=ABCMeta):
         """Check if the element is simple (i.e. contains only one primitive type)."""
         return len(self) == 1 and isinstance(self.children[0], str | int | float | bool)
 
+    def get_element_by_id(self, id: str) -> BaseElement | None:
+        """Find an element with the given ``id`` attribute in the element tree.
+
+        Components are rendered only as deep as needed to reach the element,
+        nothing is converted to HTML. Within
+        :func:`ludic.components.reuse_rendered_components`, the components
+        rendered by the search are not rendered again with the result.
+
+        Args:
+            id (str): The id of the element to find.
+
+        Returns:
+            BaseElement | None: The found element or :obj:`None`.
+        """
+        if self.attrs.get("id") == id:
+            return self
+        for child in self.children:
+            if isinstance(child, BaseElement):
+                if self.context:
+                    child.context.update(self.context)
+                if (found := child.get_element_by_id(id)) is not None:
+                    return found
+        return None
+
     def has_attributes(self) -> bool:
         """Check if the element has any attributes."""
         return bool(self.attrs)
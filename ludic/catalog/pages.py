@@ -13,6 +13,8 @@ class HtmlHeadAttrs(Attrs, total=False):
     favicon: str
     charset: str
     load_styles: bool
+    critical_styles: bool
+    inline_style_classes: bool
     htmx_config: dict[str, str]
 
 
@@ -23,6 +25,24 @@ class HtmlBodyAttrs(Attrs, total=False):
 
 
 class Head(Component[AnyChildren, HtmlHeadAttrs]):
+    """The head of an HTML page.
+
+    Unless ``load_styles`` is False, the styles of the loaded components are
+    included. When rendered in a response of :class:`ludic.web.LudicApp`
+    created with ``serve_styles``, the head links the cacheable stylesheet
+    served by the application, otherwise the styles are inlined in a
+    ``<style>`` element.
+
+    With ``critical_styles``, only the styles of the components rendered in
+    the page are inlined, see :meth:`ludic.html.style.critical`. When the
+    application is created with ``css_variables``, the custom properties of
+    the theme are inlined next to the link.
+
+    With ``inline_style_classes``, identical inline styles of the elements in
+    the page are moved to generated classes, see
+    :meth:`ludic.html.style.inline_classes`.
+    """
+
     @override
     def render(self) -> head:
         elements: list[BaseElement] = [title(self.attrs.get("title", "Ludic App"))]
@@ -34,10 +54,28 @@ class Head(Component[AnyChildren, HtmlHeadAttrs]):
         if config := self.attrs.get("htmx_config", {"defaultSwapStyle": "outerHTML"}):
             elements.append(meta(name="htmx-config", content=json.dumps(config)))
         if self.attrs.get("load_styles", True):
-            elements.append(style.load(cache=True))
+            elements.extend(self._load_styles())
 
+        if self.attrs.get("inline_style_classes", False):
+            return head(*elements, *self.children, style.inline_classes())
         return head(*elements, *self.children)
 
+    def _load_styles(self) -> list[BaseElement]:
+        if self.attrs.get("critical_styles", False):
+            return [style.critical()]
+
+        request = self.context.get("request")
+        stylesheets = getattr(getattr(request, "app", None), "stylesheets", None)
+        if stylesheets is None:
+            return [style.load(cache=True, theme=self.theme)]
+
+        elements: list[BaseElement] = [
+            link(rel="stylesheet", href=stylesheets.url_path(request, self.theme))
+        ]
+        if variables := stylesheets.format_variables(self.theme):
+            elements.append(style(variables))
+        return elements
+
 
 class Body(Component[AnyChildren, HtmlBodyAttrs]):
     @override
@@ -210,7 +248,8 @@ class HtmlPage(ComponentStrict[Head, Body, NoAttrs]):
 
     @override
     def render(self) -> html:
-        return html(
-            self.children[0].render(),
-            self.children[1].render(),
-        )
+        page_head, page_body = self.children
+        # The head needs the request to link the stylesheet of the application.
+        page_head.context.update(self.context)
+        page_body.context.update(self.context)
+        return html(page_head.render(), page_body.render())
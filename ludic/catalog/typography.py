@@ -1,13 +1,6 @@
-from typing import NotRequired, override
-
-try:
-    from pygments import highlight
-    from pygments.formatters import HtmlFormatter
-    from pygments.lexers import get_lexer_by_name
-
-    pygments_loaded = True
-except ImportError:
-    pygments_loaded = False
+import importlib.util
+from functools import lru_cache
+from typing import Any, NotRequired, override
 
 from ludic.attrs import Attrs, GlobalAttrs, HyperlinkAttrs
 from ludic.components import Component, ComponentStrict
@@ -20,6 +13,60 @@ from ludic.types import (
 
 from .utils import add_line_numbers, remove_whitespaces
 
+# Pygments is imported only when a code block with a language is rendered.
+pygments_loaded = importlib.util.find_spec("pygments") is not None
+
+# Number of highlighted code blocks kept, least recently used are evicted first.
+HIGHLIGHT_CACHE_SIZE = 256
+
+
+@lru_cache
+def _get_lexer(language: str) -> Any:
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name(language)
+
+
+@lru_cache
+def _get_formatter(code_style: str | type) -> Any:
+    from pygments.formatters import HtmlFormatter
+
+    return HtmlFormatter(
+        noclasses=True, nobackground=True, nowrap=True, style=code_style
+    )
+
+
+@lru_cache(maxsize=HIGHLIGHT_CACHE_SIZE)
+def highlight_code(
+    content: str,
+    language: str,
+    code_style: str | type,
+    line_number_color: str | None = None,
+) -> str:
+    """Highlight code with pygments, the results are cached.
+
+    Args:
+        content (str): The code to highlight.
+        language (str): The name of the language of the code.
+        code_style (str | type): The pygments style, or its name.
+        line_number_color (str | None): The color of line numbers, if any.
+
+    Returns:
+        str: The highlighted HTML.
+    """
+    from pygments import highlight
+
+    highlighted = highlight(content, _get_lexer(language), _get_formatter(code_style))
+    if line_number_color is None:
+        return highlighted
+
+    def line_number_span(line: str) -> str:
+        return str(
+            span(line, style={"color": line_number_color, "user-select": "none"})
+        )
+
+    return add_line_numbers(highlighted, apply_fun=line_number_span)
+
 
 class LinkAttrs(Attrs):
     to: str
@@ -111,6 +158,9 @@ class CodeBlockAttrs(GlobalAttrs, total=False):
 class CodeBlock(Component[str, CodeBlockAttrs]):
     """Simple component simulating a code block.
 
+    Highlighted code is cached by its content, language and the code style
+    and line numbers of the theme, see :func:`precompute_highlighting`.
+
     Example usage:
 
         CodeBlock("print('Hello, World!')")
@@ -134,17 +184,6 @@ class CodeBlock(Component[str, CodeBlockAttrs]):
         }
     )
 
-    def _get_line_number_span(self, line: str) -> str:
-        return str(
-            span(
-                line,
-                style={
-                    "color": self.theme.code.line_number_color,
-                    "user-select": "none",
-                },
-            )
-        )
-
     @override
     def render(self) -> pre:
         content = "".join(self.children)
@@ -156,20 +195,34 @@ class CodeBlock(Component[str, CodeBlockAttrs]):
             content = remove_whitespaces(content)
 
         if pygments_loaded and (language := self.attrs.get("language")):
-            lexer = get_lexer_by_name(language)
-            formatter = HtmlFormatter(
-                noclasses=True,
-                nobackground=True,
-                nowrap=True,
-                style=self.theme.code.style,
+            highlighted_content = highlight_code(
+                content,
+                language,
+                self.theme.code.resolve_style(),
+                self.theme.code.line_number_color if append_line_numbers else None,
             )
-            highlighted_content = highlight(content, lexer, formatter)
-
-            if append_line_numbers:
-                highlighted_content = add_line_numbers(
-                    highlighted_content, apply_fun=self._get_line_number_span
-                )
-
             return pre(Safe(highlighted_content), **self.attrs_for(pre))
         else:
             return pre(content, **self.attrs_for(pre))
+
+
+def precompute_highlighting(*blocks: CodeBlock) -> None:
+    """Highlight code blocks ahead of time.
+
+    Highlighted code blocks are cached, so highlighting known snippets, e.g.
+    when the application starts, avoids doing it in the first requests.
+
+    Example:
+
+        @asynccontextmanager
+        async def lifespan(app: LudicApp) -> AsyncIterator[None]:
+            precompute_highlighting(CodeBlock(EXAMPLE, language="python"))
+            yield
+
+        app = LudicApp(lifespan=lifespan)
+
+    Args:
+        *blocks (CodeBlock): The code blocks to highlight.
+    """
+    for block in blocks:
+        block.render()
@@ -1,5 +1,8 @@
+import weakref
 from abc import ABCMeta, abstractmethod
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, ClassVar, override
 
 from .attrs import GlobalAttrs
@@ -8,11 +11,127 @@ from .elements import Blank as Blank
 from .elements import Element, ElementStrict
 from .html import div, span
 from .styles import Theme, get_default_theme
+from .styles.collect import (
+    is_recording_components,
+    record_component,
+    render_with_critical_styles,
+)
 from .styles.types import GlobalStyles
 from .types import AnyChildren, TAttrs, TChildren, TChildrenArgs
 from .utils import get_element_attrs_annotations
 
-COMPONENT_REGISTRY: MutableMapping[str, list[type[BaseComponent]]] = {}
+_RenderedComponent = tuple["BaseComponent", BaseElement, list[type["BaseComponent"]]]
+
+# Components rendered within :func:`reuse_rendered_components` by their ids.
+_rendered_components: ContextVar[dict[int, _RenderedComponent] | None] = ContextVar(
+    "rendered_components", default=None
+)
+
+
+@contextmanager
+def reuse_rendered_components() -> Iterator[None]:
+    """Render each component at most once within the context.
+
+    Used when an element tree is searched before it is rendered, e.g. with
+    :meth:`BaseElement.get_element_by_id`, so the components rendered by the
+    search are not rendered again.
+    """
+    token = _rendered_components.set({})
+    try:
+        yield
+    finally:
+        _rendered_components.reset(token)
+
+
+class ComponentRegistry(Mapping[str, list[type["BaseComponent"]]]):
+    """Registry of loaded components, mapping class names to the classes.
+
+    Components are registered when their class is created. The registry holds
+    weak references, so classes created dynamically, e.g. in tests or by
+    factories, are removed once they are garbage collected. The generation
+    increases whenever the set of registered components changes, the styled
+    generation only when a component with styles is registered or removed.
+    Caches derived from the registry compare them, e.g. the collected styles
+    are kept when components without styles come and go.
+
+    Example:
+
+        with COMPONENT_REGISTRY.scope():
+            class Temporary(Component[AnyChildren, NoAttrs]):
+                ...
+
+        assert "Temporary" not in COMPONENT_REGISTRY
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.styled_generation = 0
+        self._components: dict[int, weakref.ref[type[BaseComponent]]] = {}
+        self._styled: set[int] = set()
+
+    def __getitem__(self, name: str) -> list[type[BaseComponent]]:
+        if found := [cls for cls in self.components() if cls.__name__ == name]:
+            return found
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(cls.__name__ for cls in self.components()))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def components(self) -> list[type[BaseComponent]]:
+        """Get the registered components in the order of registration."""
+        return [
+            cls for ref in list(self._components.values()) if (cls := ref()) is not None
+        ]
+
+    def register(self, component: type[BaseComponent]) -> None:
+        """Register a component.
+
+        Args:
+            component (type[BaseComponent]): The component class.
+        """
+        key = id(component)
+
+        def discard(ref: weakref.ref[type[BaseComponent]]) -> None:
+            if self._components.get(key) is ref:
+                self._remove(key)
+
+        self._components[key] = weakref.ref(component, discard)
+        self.generation += 1
+        if isinstance(component.styles, BaseElement) or component.styles:
+            self._styled.add(key)
+            self.styled_generation += 1
+
+    def unregister(self, component: type[BaseComponent]) -> None:
+        """Unregister a component, e.g. a plugin being unloaded.
+
+        Args:
+            component (type[BaseComponent]): The component class.
+        """
+        if id(component) in self._components:
+            self._remove(id(component))
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Unregister the components registered within the context."""
+        registered = set(self._components)
+        try:
+            yield
+        finally:
+            for key in [key for key in self._components if key not in registered]:
+                self._remove(key)
+
+    def _remove(self, key: int) -> None:
+        del self._components[key]
+        self.generation += 1
+        if key in self._styled:
+            self._styled.discard(key)
+            self.styled_generation += 1
+
+
+COMPONENT_REGISTRY = ComponentRegistry()
 
 
 class BaseComponent(BaseElement, metaclass=ABCMeta):
@@ -28,8 +147,7 @@ class BaseComponent(BaseElement, metaclass=ABCMeta):
         return get_default_theme()
 
     def __init_subclass__(cls) -> None:
-        COMPONENT_REGISTRY.setdefault(cls.__name__, [])
-        COMPONENT_REGISTRY[cls.__name__].append(cls)
+        COMPONENT_REGISTRY.register(cls)
 
     def _add_classes(self, classes: list[str], element: BaseElement) -> None:
         if classes:
@@ -52,18 +170,56 @@ class BaseComponent(BaseElement, metaclass=ABCMeta):
             if key in get_element_attrs_annotations(cls)
         }
 
-    def to_html(self) -> str:
+    def get_element_by_id(self, id: str) -> BaseElement | None:
+        if self.attrs.get("id") == id:
+            return self
+
+        dom = self.render_dom()
+        if dom.attrs.get("id") == id:
+            return dom
+        return dom.get_element_by_id(id)
+
+    def render_dom(self) -> BaseElement:
+        """Render the component until the result is not a component.
+
+        The classes of all the rendered components are added to the result,
+        the rendered component classes are recorded for critical styles.
+
+        Returns:
+            BaseElement: The rendered element.
+        """
+        rendered = _rendered_components.get()
+        if rendered is not None and (entry := rendered.get(id(self))) is not None:
+            component, result, components = entry
+            if component is self:
+                for cls in components:
+                    record_component(cls)
+                return result
+
         dom: BaseElement | BaseComponent = self
         classes: list[str] = []
+        components: list[type[BaseComponent]] = []
 
         while isinstance(dom, BaseComponent):
+            record_component(type(dom))
+            components.append(type(dom))
             classes += dom.classes
             context = dom.context
             dom = dom.render()
             dom.context.update(context)
 
         self._add_classes(classes, dom)
-        return dom.to_html()
+        if rendered is not None:
+            rendered[id(self)] = (self, dom, components)
+        return dom
+
+    def to_html(self) -> str:
+        if is_recording_components():
+            return self.render_dom().to_html()
+        # The outermost element fills in the critical styles of the page.
+        return render_with_critical_styles(
+            lambda: self.render_dom().to_html(), self.theme
+        )
 
     @abstractmethod
     def render(self) -> BaseElement:
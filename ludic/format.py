@@ -1,7 +1,9 @@
+import hashlib
 import html
 import inspect
 import itertools
 from collections.abc import Mapping
+from contextvars import ContextVar, Token
 from functools import lru_cache
 from string.templatelib import Interpolation
 from string.templatelib import Template as Template
@@ -9,6 +11,12 @@ from typing import Any, TypeVar, get_type_hints
 
 T = TypeVar("T")
 
+# Inline styles moved to generated classes while rendering a page, mapping the
+# class names to the declarations, see :meth:`ludic.html.style.inline_classes`.
+_style_classes: ContextVar[dict[str, dict[str, Any]] | None] = ContextVar(
+    "style_classes", default=None
+)
+
 
 @lru_cache
 def _load_attrs_aliases() -> Mapping[str, str]:
@@ -29,6 +37,54 @@ def _load_attrs_aliases() -> Mapping[str, str]:
     return result
 
 
+def enable_style_classes() -> Token[dict[str, dict[str, Any]] | None]:
+    """Move inline styles formatted from now on to generated classes.
+
+    Returns:
+        Token: The token to pass to :func:`disable_style_classes`.
+    """
+    return _style_classes.set({})
+
+
+def disable_style_classes(
+    token: Token[dict[str, dict[str, Any]] | None],
+) -> dict[str, dict[str, Any]]:
+    """Stop moving inline styles to generated classes.
+
+    Args:
+        token (Token): The token returned by :func:`enable_style_classes`.
+
+    Returns:
+        dict[str, dict[str, Any]]: The declarations of the generated classes.
+    """
+    collected = _style_classes.get() or {}
+    _style_classes.reset(token)
+    return collected
+
+
+@lru_cache(maxsize=4096)
+def _style_class_name(items: tuple[tuple[str, Any], ...]) -> str | None:
+    declarations = ";".join(f"{key}:{value}" for key, value in items)
+    if "<" in declarations:
+        # Kept inline, the value could close the style element.
+        return None
+    digest = hashlib.blake2b(declarations.encode("utf-8"), digest_size=6).hexdigest()
+    return f"s-{digest}"
+
+
+def _format_style_class(
+    style_classes: dict[str, dict[str, Any]], value: dict[str, Any]
+) -> str | None:
+    try:
+        class_name = _style_class_name(tuple(value.items()))
+    except TypeError:
+        # Unhashable values are kept inline.
+        return None
+    if class_name is not None:
+        style_classes.setdefault(class_name, value)
+    return class_name
+
+
 def format_attr_value(key: str, value: Any, is_html: bool = False) -> str:
     """Format an HTML attribute with the given key and value.
 
@@ -135,10 +191,18 @@ def format_attrs(attrs: Mapping[str, Any], is_html: bool = False) -> dict[str, A
     result: dict[str, str] = {}
     dataset_attrs = extract_dataset_attrs(attrs)
     raw_attrs = extract_raw_attrs(attrs)
+    style_classes = _style_classes.get() if is_html else None
 
     for key, value in itertools.chain(attrs.items(), dataset_attrs.items()):
         if key in ("dataset", "attrs"):
             continue
+        if (
+            key == "style"
+            and style_classes is not None
+            and isinstance(value, dict)
+            and (class_name := _format_style_class(style_classes, value))
+        ):
+            key, value = "class_", class_name
         if formatted_value := format_attr_value(key, value, is_html=is_html):
             if key in aliases:
                 alias = aliases[key]
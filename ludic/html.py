@@ -1,5 +1,5 @@
 from collections.abc import Callable, Iterator
-from typing import Generic, Self, Unpack
+from typing import Generic, Literal, Self, Unpack
 
 from .attrs import (
     AreaAttrs,
@@ -59,9 +59,18 @@ from .base import BaseElement
 from .elements import Element, ElementStrict
 from .styles import (
     format_styles,
+    format_variables,
     from_components,
     from_loaded,
 )
+from .styles.collect import (
+    CRITICAL_STYLES_MARKER,
+    STYLE_CLASSES_MARKER,
+    is_recording_components,
+    render_with_critical_styles,
+    request_critical_styles,
+    request_style_classes,
+)
 from .styles.types import TTheme
 from .types import (
     AnyChildren,
@@ -533,12 +542,22 @@ class link(Element[NoChildren, HeadLinkAttrs]):
         super().__init__(*children, **attrs)
 
 
+# The number of themes the evaluated styles of one style element are kept for.
+_EVALUATED_STYLES_LIMIT = 16
+
+
 class style(Generic[TTheme], BaseElement, GlobalStyles):
     html_name = "style"
 
     children: tuple[GlobalStyles | Callable[[TTheme], GlobalStyles] | str]
     attrs: StyleAttrs
 
+    _critical_components: tuple[type[BaseElement], ...] = ()
+    # The styles filled in after the page is rendered, see :meth:`critical` and
+    # :meth:`inline_classes`. Unlike the markers, the attribute is the same in
+    # worker processes rendering the element.
+    _placeholder: Literal["critical", "style_classes"] | None = None
+
     def __init__(
         self,
         styles: GlobalStyles | Callable[[TTheme], GlobalStyles] | str,
@@ -546,6 +565,7 @@ class style(Generic[TTheme], BaseElement, GlobalStyles):
         **attrs: Unpack[StyleAttrs],
     ) -> None:
         super().__init__(styles, **attrs)
+        self._evaluated: dict[str, GlobalStyles] = {}
 
         if theme:
             self.context["theme"] = theme
@@ -564,6 +584,58 @@ class style(Generic[TTheme], BaseElement, GlobalStyles):
     def load(cls, cache: bool = False, theme: TTheme | None = None) -> Self:
         return cls(from_loaded(cache=cache, theme=theme), type="text/css")
 
+    @classmethod
+    def variables(cls, theme: TTheme | None = None) -> Self:
+        """Custom properties of a theme, see :func:`ludic.styles.variables_theme`."""
+        return cls(format_variables(theme), type="text/css")
+
+    @classmethod
+    def critical(cls, *components: type[BaseElement]) -> Self:
+        """Styles of the components rendered in the page.
+
+        The styles are filled in after the whole page is rendered, so they
+        contain only the components present in the page. The result is cached
+        for each combination of components. Components loaded later, e.g. by
+        htmx, need to be included explicitly. When rendered on its own, the
+        element contains the styles of all loaded components.
+
+        Example:
+
+            html(
+                head(style.critical(Table, Button)),
+                body(...),
+            )
+
+        Args:
+            *components (type[BaseElement]): Components to always include.
+        """
+        element = cls(CRITICAL_STYLES_MARKER, type="text/css")
+        element._critical_components = components
+        element._placeholder = "critical"
+        return element
+
+    @classmethod
+    def inline_classes(cls) -> Self:
+        """Rules of the classes generated from inline styles in the page.
+
+        Elements rendered after this element have their ``style`` attribute
+        replaced by a class generated from the hash of the declarations, so
+        identical inline styles, e.g. of table cells, are formatted once. The
+        rules have the specificity of a class, unlike inline styles, so the
+        element should be placed after other styles. When rendered on its own,
+        the element is empty.
+
+        Example:
+
+            html(
+                head(style.load(), style.inline_classes()),
+                body(table(...)),
+            )
+        """
+        element = cls(STYLE_CLASSES_MARKER, type="text/css")
+        element._placeholder = "style_classes"
+        return element
+
     def __getitem__(self, key: str | tuple[str, ...]) -> CSSProperties | GlobalStyles:
         return self.styles[key]
 
@@ -575,23 +647,35 @@ class style(Generic[TTheme], BaseElement, GlobalStyles):
 
     @property
     def styles(self) -> GlobalStyles:
+        """The styles, a callable is evaluated once for each theme."""
         if isinstance(self.children[0], str):
             return {}
         elif callable(self.children[0]):
-            return self.children[0](self.context["theme"])
+            theme = self.context["theme"]
+            key = theme.content_hash
+            if (styles := self._evaluated.get(key)) is None:
+                if len(self._evaluated) >= _EVALUATED_STYLES_LIMIT:
+                    self._evaluated.pop(next(iter(self._evaluated)))
+                styles = self._evaluated[key] = self.children[0](theme)
+            return styles
         else:
             return self.children[0]
 
     @styles.setter
     def styles(self, value: GlobalStyles) -> None:
         self.children = (value,)
+        self._evaluated.clear()
 
     def to_html(self) -> str:
         attributes = ""
         if formatted_attrs := self._format_attributes():
             attributes = f" {formatted_attrs}"
 
-        if isinstance(self.children[0], str):
+        if self._placeholder == "critical":
+            css_styles = self._format_critical_styles()
+        elif self._placeholder == "style_classes":
+            css_styles = self._format_style_classes()
+        elif isinstance(self.children[0], str):
             css_styles = self.children[0]
         else:
             css_styles = format_styles(self.styles)
@@ -602,6 +686,21 @@ class style(Generic[TTheme], BaseElement, GlobalStyles):
             f"</{self.html_name}>"
         )  # fmt: off
 
+    def _format_critical_styles(self) -> str:
+        if not is_recording_components():
+            theme = self.context.get("theme")
+            return format_styles(from_loaded(cache=True, theme=theme))
+
+        request_critical_styles(self._critical_components)
+        return CRITICAL_STYLES_MARKER
+
+    def _format_style_classes(self) -> str:
+        if not is_recording_components():
+            return ""
+
+        request_style_classes()
+        return STYLE_CLASSES_MARKER
+
 
 class script(Element[PrimitiveChildren, ScriptAttrs]):
     html_name = "script"
@@ -657,6 +756,12 @@ class html(ElementStrict[head, body, HtmlTagAttrs]):
     ) -> None:
         super().__init__(*children, **attrs)
 
+    def to_html(self) -> str:
+        if is_recording_components():
+            return super().to_html()
+        # The outermost element fills in the critical styles of the page.
+        return render_with_critical_styles(super().to_html, self.context.get("theme"))
+
 
 class iframe(Element[NoChildren, IframeAttrs]):
     html_name = "iframe"
@@ -1,14 +1,27 @@
-from .collect import format_styles, from_components, from_loaded
+from .collect import (
+    format_critical_styles,
+    format_styles,
+    from_components,
+    from_loaded,
+    record_components,
+)
+from .compiler import compile_styles
 from .themes import Theme, get_default_theme, set_default_theme
 from .types import CSSProperties, GlobalStyles
+from .variables import format_variables, variables_theme
 
 __all__ = (
     "CSSProperties",
     "GlobalStyles",
     "Theme",
+    "compile_styles",
+    "format_critical_styles",
     "format_styles",
+    "format_variables",
     "from_components",
     "from_loaded",
     "get_default_theme",
+    "record_components",
     "set_default_theme",
+    "variables_theme",
 )
@@ -0,0 +1,133 @@
+import argparse
+import hashlib
+import importlib
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from .collect import format_styles, from_loaded
+from .themes import Theme, get_default_theme
+
+MANIFEST_NAME = "manifest.json"
+
+
+def build_stylesheets(
+    themes: Iterable[Theme], directory: str | Path, minify: bool = True
+) -> dict[str, dict[str, str]]:
+    """Write the global stylesheet of each theme to a directory.
+
+    The stylesheets contain the styles of the loaded components and are named
+    by the hash of their content. The manifest written next to them maps the
+    content hash of each theme to its stylesheet, see
+    :class:`ludic.web.stylesheets.Stylesheets`.
+
+    Example:
+
+        import my_app.components
+
+        build_stylesheets([LightTheme(), DarkTheme()], "static/styles")
+
+    Args:
+        themes (Iterable[Theme]): The themes to build the stylesheets for.
+        directory (str | Path): The output directory.
+        minify (bool): Whether to minify the stylesheets.
+
+    Returns:
+        dict[str, dict[str, str]]: The manifest.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    manifest = {}
+    for theme in themes:
+        styles = format_styles(from_loaded(theme=theme), minify=minify)
+        content = styles.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        path = f"styles-{digest}.css"
+
+        (directory / path).write_bytes(content)
+        manifest[theme.content_hash] = {
+            "theme": theme.name,
+            "digest": digest,
+            "path": path,
+        }
+
+    manifest_path = directory / MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+def _load_theme(spec: str) -> Theme:
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Invalid theme {spec!r}, expected 'module:attribute'.")
+
+    theme: Any = getattr(importlib.import_module(module_name), attr)
+    if isinstance(theme, type):
+        theme = theme()
+    if not isinstance(theme, Theme):
+        raise ValueError(f"The attribute {spec!r} is not a theme.")
+    return theme
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point of ``python -m ludic.styles``.
+
+    Usage:
+
+        python -m ludic.styles build my_app.web \\
+            --theme ludic.styles.themes:LightTheme \\
+            --theme ludic.styles.themes:DarkTheme \\
+            --output static/styles
+
+    Args:
+        argv (Sequence[str] | None): The command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ludic.styles", description="Ludic styles utilities."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build", help="Build the stylesheets of the components loaded by a module."
+    )
+    build.add_argument("module", help="The module to import, e.g. my_app.web.")
+    build.add_argument(
+        "-t",
+        "--theme",
+        action="append",
+        dest="themes",
+        metavar="MODULE:ATTRIBUTE",
+        help="A theme to build, defaults to the default theme of the module.",
+    )
+    build.add_argument(
+        "-o",
+        "--output",
+        default="static/styles",
+        help="The output directory, defaults to static/styles.",
+    )
+    build.add_argument(
+        "--no-minify",
+        action="store_false",
+        dest="minify",
+        help="Do not minify the stylesheets.",
+    )
+    args = parser.parse_args(argv)
+
+    # Like ASGI servers, import the module relative to the working directory.
+    sys.path.insert(0, ".")
+    try:
+        importlib.import_module(args.module)
+        themes = [_load_theme(spec) for spec in args.themes or ()]
+    except (ImportError, AttributeError, ValueError) as exc:
+        parser.error(str(exc))
+    finally:
+        sys.path.remove(".")
+
+    manifest = build_stylesheets(
+        themes or [get_default_theme()], args.output, minify=args.minify
+    )
+    for entry in manifest.values():
+        print(f"{entry['theme']}: {Path(args.output) / entry['path']}")
@@ -1,46 +1,55 @@
-from collections.abc import Mapping, MutableMapping
+import secrets
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
 from typing import Any
 
 from ludic.base import BaseElement
+from ludic.format import disable_style_classes, enable_style_classes
 
+from .compiler import compile_styles
 from .themes import Theme, get_default_theme
 from .types import CSSProperties, GlobalStyles
 
 GLOBAL_STYLES_CACHE: MutableMapping[str, GlobalStyles] = {}
+CRITICAL_STYLES_CACHE: MutableMapping[tuple[str, tuple[int, ...]], str] = {}
 
+# The styled generation of the component registry the caches were filled with.
+_cached_generation = 0
 
-def format_styles(styles: GlobalStyles, separator: str = "\n") -> str:
+# Rendered in place of the critical styles until the whole page is rendered.
+CRITICAL_STYLES_MARKER = f"/* ludic-critical-styles-{secrets.token_hex(8)} */"
+STYLE_CLASSES_MARKER = f"/* ludic-style-classes-{secrets.token_hex(8)} */"
+
+
+@dataclass
+class _Recording:
+    components: set[type[BaseElement]] = field(default_factory=set)
+    # Set when a placeholder was rendered, so pages without any are not scanned.
+    critical_styles: bool = False
+    style_classes: Token[dict[str, dict[str, Any]] | None] | None = None
+
+
+_recording: ContextVar[_Recording | None] = ContextVar("recording", default=None)
+
+
+def format_styles(
+    styles: GlobalStyles,
+    separator: str = "\n",
+    minify: bool = False,
+    merge: bool = False,
+) -> str:
     """Format styles from all registered elements.
 
     Args:
         styles (GlobalStyles): Styles to format.
+        separator (str): Separator of the top-level rules.
+        minify (bool): Whether to omit all optional whitespace.
+        merge (bool): Whether to merge identical selectors and declarations,
+            see :func:`compile_styles`.
     """
-    result: list[str] = []
-    nodes_to_parse: list[
-        tuple[list[str], str | Mapping[str | tuple[str, ...], Any]]
-    ] = [([], styles)]
-
-    while nodes_to_parse:
-        parents, node = nodes_to_parse.pop(0)
-
-        content = []
-        if isinstance(node, str):
-            content.append(node)
-        else:
-            for key, value in node.items():
-                if isinstance(value, str | int | float):
-                    content.append(f"{key}: {value};")
-                elif isinstance(value, Mapping):
-                    keys = (key,) if isinstance(key, str | int | float) else key
-                    for key in keys:
-                        if key.startswith("@"):
-                            value = format_styles(value, separator=" ")
-                        nodes_to_parse.append(([*parents, key], value))
-
-        if content:
-            result.append(f"{' '.join(parents)} {{ {' '.join(content)} }}")
-
-    return separator.join(result)
+    return compile_styles(styles, minify=minify, merge=merge, separator=separator)
 
 
 def from_components(
@@ -77,6 +86,8 @@ def from_components(
             continue
         elif hasattr(styles, "context"):
             styles.context["theme"] = theme
+            # Evaluate the styles once instead of for each key.
+            styles = getattr(styles, "styles", styles)
 
         for key, value in styles.items():
             if isinstance(value, Mapping):
@@ -85,27 +96,158 @@ def from_components(
     return all_styles
 
 
+def invalidate_caches(generation: int) -> None:
+    """Clear the caches of styles if the styled components have changed.
+
+    Args:
+        generation (int): The current styled generation of the component registry.
+    """
+    global _cached_generation
+    if generation != _cached_generation:
+        GLOBAL_STYLES_CACHE.clear()
+        CRITICAL_STYLES_CACHE.clear()
+        _cached_generation = generation
+
+
 def from_loaded(cache: bool = False, theme: Theme | None = None) -> GlobalStyles:
     """Global styles collector from loaded components.
 
     Args:
-        cache (bool): Whether to cache the result Default is False.
+        cache (bool): Whether to cache the result for the theme's configuration.
+            Default is False.
+        theme (Theme | None): The theme, defaults to the default theme.
 
     Returns:
         GlobalStyles: Collected styles from loaded components.
     """
     from ludic.components import COMPONENT_REGISTRY
 
-    global GLOBAL_STYLES_CACHE
     theme = theme or get_default_theme()
+    key = theme.content_hash
 
-    if cache and GLOBAL_STYLES_CACHE.get(theme.name):
-        return GLOBAL_STYLES_CACHE[theme.name]
+    if cache:
+        invalidate_caches(COMPONENT_REGISTRY.styled_generation)
+        if GLOBAL_STYLES_CACHE.get(key):
+            return GLOBAL_STYLES_CACHE[key]
 
-    loaded = (
-        element for elements in COMPONENT_REGISTRY.values() for element in elements
-    )
-    result = from_components(*loaded, theme=theme)
+    result = from_components(*COMPONENT_REGISTRY.components(), theme=theme)
     if cache:
-        GLOBAL_STYLES_CACHE[theme.name] = result
+        GLOBAL_STYLES_CACHE[key] = result
+    return result
+
+
+@contextmanager
+def record_components() -> Iterator[set[type[BaseElement]]]:
+    """Record the component classes rendered within the context.
+
+    Yields:
+        set[type[BaseElement]]: The recorded component classes.
+    """
+    recording = _Recording()
+    token = _recording.set(recording)
+    try:
+        yield recording.components
+    finally:
+        _recording.reset(token)
+
+
+def is_recording_components() -> bool:
+    """Check whether rendered component classes are being recorded."""
+    return _recording.get() is not None
+
+
+def record_component(component: type[BaseElement]) -> None:
+    """Record a rendered component class, if recording is active.
+
+    Args:
+        component (type[BaseElement]): The component class.
+    """
+    if (recording := _recording.get()) is not None:
+        recording.components.add(component)
+
+
+def request_critical_styles(components: Iterable[type[BaseElement]] = ()) -> None:
+    """Fill in the critical styles once the page is rendered.
+
+    Args:
+        components (Iterable[type[BaseElement]]): Component classes to include
+            even if they are not rendered.
+    """
+    if (recording := _recording.get()) is not None:
+        recording.components.update(components)
+        recording.critical_styles = True
+
+
+def request_style_classes() -> None:
+    """Move inline styles to generated classes filled in once the page is rendered."""
+    recording = _recording.get()
+    if recording is not None and recording.style_classes is None:
+        recording.style_classes = enable_style_classes()
+
+
+def format_critical_styles(
+    components: Iterable[type[BaseElement]], theme: Theme | None = None
+) -> str:
+    """Format the styles of the given components only.
+
+    The result is cached for each combination of components and theme.
+
+    Args:
+        components (Iterable[type[BaseElement]]): The component classes.
+        theme (Theme | None): The theme to format the styles with.
+
+    Returns:
+        str: The formatted styles.
+    """
+    from ludic.components import COMPONENT_REGISTRY
+
+    theme = theme or get_default_theme()
+    classes = sorted(
+        set(components), key=lambda cls: (cls.__module__, cls.__qualname__)
+    )
+    # Keyed by the ids, so the cache does not keep the classes alive.
+    key = (theme.content_hash, tuple(id(cls) for cls in classes))
+
+    invalidate_caches(COMPONENT_REGISTRY.styled_generation)
+
+    if (result := CRITICAL_STYLES_CACHE.get(key)) is None:
+        result = format_styles(from_components(*classes, theme=theme))
+        CRITICAL_STYLES_CACHE[key] = result
+    return result
+
+
+def render_with_critical_styles(
+    render: Callable[[], str], theme: Theme | None = None
+) -> str:
+    """Render HTML while recording components and fill in the critical styles.
+
+    The rules of the classes generated from inline styles are filled in too.
+
+    Args:
+        render (Callable[[], str]): Function rendering the HTML.
+        theme (Theme | None): The theme to format the styles with.
+
+    Returns:
+        str: The rendered HTML.
+    """
+    recording = _Recording()
+    token = _recording.set(recording)
+    try:
+        result = render()
+    finally:
+        _recording.reset(token)
+        style_classes = (
+            disable_style_classes(recording.style_classes)
+            if recording.style_classes is not None
+            else None
+        )
+
+    if recording.critical_styles:
+        css_styles = format_critical_styles(recording.components, theme)
+        result = result.replace(CRITICAL_STYLES_MARKER, css_styles, 1)
+    if style_classes is not None:
+        css_styles = format_styles(
+            {f".{name}": declarations for name, declarations in style_classes.items()}
+        )
+        result = result.replace(STYLE_CLASSES_MARKER, css_styles, 1)
     return result
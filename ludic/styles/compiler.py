@@ -0,0 +1,270 @@
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .types import GlobalStyles
+
+# Prefixes of longhand properties which are set by a shorthand of another name.
+_PROPERTY_GROUPS = {
+    "top": "inset",
+    "right": "inset",
+    "bottom": "inset",
+    "left": "inset",
+    "align": "place",
+    "justify": "place",
+    "line": "font",
+    "row": "gap",
+    "column": "gap",
+    "columns": "gap",
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A flat style rule, the intermediate representation of the compiler.
+
+    A rule with an empty selector holds the declarations of its innermost
+    at-rule, e.g. ``@font-face``.
+    """
+
+    selectors: tuple[str, ...]
+    declarations: tuple[tuple[str, str], ...]
+    at_rules: tuple[str, ...] = ()
+
+    @property
+    def is_block(self) -> bool:
+        return self.selectors == ("",)
+
+
+def flatten_styles(styles: GlobalStyles) -> list[Rule]:
+    """Flatten nested styles into a list of rules.
+
+    Nested selectors are joined with a space, at-rules can be nested in
+    selectors and in other at-rules. The rules are ordered level by level,
+    the rules of an at-rule are kept together.
+
+    Args:
+        styles (GlobalStyles): Styles to flatten.
+
+    Returns:
+        list[Rule]: The flat rules.
+    """
+    rules: list[Rule] = []
+    _flatten(styles, (), (), rules)
+    return rules
+
+
+def _flatten(
+    styles: Mapping[Any, Any],
+    at_rules: tuple[str, ...],
+    parents: tuple[str, ...],
+    rules: list[Rule],
+) -> None:
+    nodes: deque[tuple[tuple[str, ...], Mapping[Any, Any], str | None]] = deque(
+        [(parents, styles, None)]
+    )
+
+    while nodes:
+        parents, node, at_rule = nodes.popleft()
+        if at_rule is not None:
+            # The rules of an at-rule are kept together.
+            _flatten(node, (*at_rules, at_rule), parents, rules)
+            continue
+
+        declarations: list[tuple[str, str]] = []
+        for key, value in node.items():
+            if isinstance(value, str | int | float):
+                declarations.append((key, f"{value}"))
+            elif isinstance(value, Mapping):
+                for selector in (key,) if isinstance(key, str) else key:
+                    if selector.startswith("@"):
+                        nodes.append((parents, value, selector))
+                    else:
+                        nodes.append(((*parents, selector), value, None))
+
+        if declarations:
+            rules.append(Rule((" ".join(parents),), tuple(declarations), at_rules))
+
+
+def _property_group(name: str) -> str:
+    if name.startswith("--"):
+        return name
+    if name.startswith("-"):
+        name = name[1:].partition("-")[2]
+    prefix = name.partition("-")[0]
+    return _PROPERTY_GROUPS.get(prefix, prefix)
+
+
+def _merge(
+    rules: Iterable[Rule],
+    key: Callable[[Rule], Hashable | None],
+    combine: Callable[[list[Rule]], Rule],
+) -> list[Rule]:
+    groups: list[list[Rule]] = []
+    positions: dict[Hashable, int] = {}
+    # The position of the last rule setting a property group.
+    last_set: dict[str, int] = {}
+
+    for rule in rules:
+        properties = {_property_group(name) for name, _ in rule.declarations}
+        rule_key = None if rule.is_block else key(rule)
+        target = positions.get(rule_key) if rule_key is not None else None
+
+        # Moving the declarations before the rules in between has to keep the
+        # cascade, so none of the rules in between may set the same properties.
+        if target is not None and (
+            max(last_set.values(), default=-1) <= target
+            if "all" in properties
+            else all(
+                last_set.get(group, -1) <= target for group in (*properties, "all")
+            )
+        ):
+            groups[target].append(rule)
+        else:
+            target = len(groups)
+            groups.append([rule])
+            if rule_key is not None:
+                positions[rule_key] = target
+
+        for group in properties:
+            last_set[group] = max(last_set.get(group, -1), target)
+
+    return [group[0] if len(group) == 1 else combine(group) for group in groups]
+
+
+def _merge_declarations(rules: list[Rule]) -> Rule:
+    declarations = [item for rule in rules for item in rule.declarations]
+    # Keeps the last one of identical declarations, different values of one
+    # property are kept as they can be fallbacks.
+    deduped = reversed(dict.fromkeys(reversed(declarations)))
+    return Rule(rules[0].selectors, tuple(deduped), rules[0].at_rules)
+
+
+def _merge_selectors(rules: list[Rule]) -> Rule:
+    selectors = dict.fromkeys(selector for rule in rules for selector in rule.selectors)
+    return Rule(tuple(selectors), rules[0].declarations, rules[0].at_rules)
+
+
+def merge_rules(rules: Iterable[Rule]) -> list[Rule]:
+    """Merge rules with identical selectors and identical declarations.
+
+    Rules are merged into the first one with the same selectors or the same
+    declarations in the same at-rules, unless a rule in between sets any of
+    the properties, which would change the cascade.
+
+    Args:
+        rules (Iterable[Rule]): Rules to merge.
+
+    Returns:
+        list[Rule]: The merged rules.
+    """
+    rules = _merge(
+        rules,
+        key=lambda rule: (rule.at_rules, rule.selectors),
+        combine=_merge_declarations,
+    )
+    return _merge(
+        rules,
+        key=lambda rule: (
+            None
+            # Browsers drop a selector list with an unknown vendor pseudo-class.
+            if any(":-" in selector for selector in rule.selectors)
+            else (rule.at_rules, rule.declarations)
+        ),
+        combine=_merge_selectors,
+    )
+
+
+def _format_rule(rule: Rule, minify: bool) -> str:
+    if minify:
+        declarations = ";".join(f"{name}:{value}" for name, value in rule.declarations)
+        selectors = ",".join(rule.selectors)
+        return declarations if rule.is_block else f"{selectors}{{{declarations}}}"
+
+    declarations = " ".join(f"{name}: {value};" for name, value in rule.declarations)
+    selectors = ", ".join(rule.selectors)
+    return declarations if rule.is_block else f"{selectors} {{ {declarations} }}"
+
+
+def format_rules(
+    rules: Iterable[Rule], minify: bool = False, separator: str = "\n"
+) -> str:
+    """Format rules as CSS.
+
+    Consecutive rules in the same at-rules are formatted in one block.
+
+    Args:
+        rules (Iterable[Rule]): Rules to format.
+        minify (bool): Whether to omit all optional whitespace.
+        separator (str): Separator of the top-level rules.
+
+    Returns:
+        str: The formatted CSS.
+    """
+    inner_separator = "" if minify else " "
+    blocks: list[tuple[str, list[str]]] = [("", [])]
+
+    def close_block() -> None:
+        at_rule, parts = blocks.pop()
+        content = inner_separator.join(parts)
+        if minify:
+            blocks[-1][1].append(f"{at_rule}{{{content}}}")
+        else:
+            blocks[-1][1].append(f"{at_rule} {{ {content} }}")
+
+    for rule in rules:
+        open_at_rules = [at_rule for at_rule, _ in blocks[1:]]
+        common = 0
+        for opened, at_rule in zip(open_at_rules, rule.at_rules, strict=False):
+            if opened != at_rule:
+                break
+            common += 1
+        if rule.is_block:
+            # Declarations of an at-rule, e.g. @font-face, are not shared.
+            common = min(common, max(len(rule.at_rules) - 1, 0))
+
+        while len(blocks) - 1 > common:
+            close_block()
+        for at_rule in rule.at_rules[common:]:
+            blocks.append((at_rule, []))
+        blocks[-1][1].append(_format_rule(rule, minify))
+
+    while len(blocks) > 1:
+        close_block()
+    return separator.join(blocks[0][1])
+
+
+def compile_styles(
+    styles: GlobalStyles,
+    minify: bool = False,
+    merge: bool = False,
+    separator: str | None = None,
+) -> str:
+    """Compile nested styles to CSS.
+
+    The styles are flattened into rules, optionally merged and formatted.
+
+    Example:
+
+        >>> compile_styles({"a": {"color": "red"}, "b": {"color": "red"}}, merge=True)
+        'a, b { color: red; }'
+        >>> compile_styles({"a": {"color": "red", "b": {"margin": 0}}}, minify=True)
+        'a{color:red}a b{margin:0}'
+
+    Args:
+        styles (GlobalStyles): Styles to compile.
+        minify (bool): Whether to omit all optional whitespace.
+        merge (bool): Whether to merge identical selectors and declarations.
+        separator (str | None): Separator of the top-level rules, defaults to
+            a new line, or nothing when minifying.
+
+    Returns:
+        str: The compiled CSS.
+    """
+    rules = flatten_styles(styles)
+    if merge:
+        rules = merge_rules(rules)
+    if separator is None:
+        separator = "" if minify else "\n"
+    return format_rules(rules, minify=minify, separator=separator)
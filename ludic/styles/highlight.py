@@ -122,3 +122,25 @@ class LudicDark(Style):
         Generic.Traceback: "#518eb5",
         Error: "#bc5f54 bg:#e35d6f",
     }
+
+
+CODE_STYLES: dict[str, type[Style]] = {
+    LudicLight.name: LudicLight,
+    LudicDark.name: LudicDark,
+}
+
+
+def get_code_style(code_style: str | type) -> str | type:
+    """Resolve the name of a Ludic code style to the pygments style.
+
+    Other names are returned as they are, pygments looks them up itself.
+
+    Args:
+        code_style (str | type): The name of the style or the style class.
+
+    Returns:
+        str | type: The style class or the name of a pygments style.
+    """
+    if isinstance(code_style, str):
+        return CODE_STYLES.get(code_style, code_style)
+    return code_style
@@ -1,24 +1,31 @@
+import hashlib
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass, field
-from typing import TypeVar
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import cached_property
+from typing import Any, TypeVar
 
 from ludic.base import BaseElement
 
 from .types import BaseSize, Color, ColorRange, Size, SizeClamp
 
-highlight_light: str | type = "default"
-highlight_dark: str | type = "default"
-try:
-    from .highlight import LudicDark, LudicLight
-
-    highlight_light = LudicLight
-    highlight_dark = LudicDark
-except ImportError:
-    pass
+# Names of the code styles in :mod:`ludic.styles.highlight`, the styles depend
+# on pygments, so they are only imported by :meth:`CodeBlock.resolve_style`.
+highlight_light: str | type = "ludic-light"
+highlight_dark: str | type = "ludic-dark"
 
 _T = TypeVar("_T", bound="BaseElement")
 
 
+def _fingerprint(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return tuple(_fingerprint(getattr(value, f.name)) for f in fields(value))
+    elif isinstance(value, ColorRange):
+        return (str(value), tuple(value.variants), value.position)
+    elif isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return value
+
+
 @dataclass
 class Colors:
     """Colors for a theme."""
@@ -181,7 +188,11 @@ class Layouts:
 
 @dataclass
 class CodeBlock:
-    """Code block config for a theme."""
+    """Code block config for a theme.
+
+    The ``style`` is a pygments style class or the name of a style, see
+    :meth:`resolve_style`.
+    """
 
     color: Color = Color("#414549")
     background_color: Color = Color("#f2f2f2")
@@ -190,6 +201,22 @@ class CodeBlock:
     font_size: BaseSize = Size(0.9)
     style: str | type = highlight_light
 
+    def resolve_style(self) -> str | type:
+        """Resolve the style to the pygments style class.
+
+        Names of the styles in :mod:`ludic.styles.highlight` are resolved to
+        their classes, which imports pygments. Other names are returned as
+        they are, also when pygments is not installed.
+
+        Returns:
+            str | type: The style class or the name of a pygments style.
+        """
+        try:
+            from .highlight import get_code_style
+        except ImportError:
+            return self.style
+        return get_code_style(self.style)
+
 
 @dataclass
 class Theme(metaclass=ABCMeta):
@@ -212,12 +239,32 @@ class Theme(metaclass=ABCMeta):
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Theme) and self.name == other.name
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The cached content hash no longer matches the changed configuration.
+        self.__dict__.pop("content_hash", None)
+        super().__setattr__(name, value)
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Name of the theme."""
         raise NotImplementedError
 
+    @cached_property
+    def content_hash(self) -> str:
+        """Hash of the theme's configuration.
+
+        Themes with the same name can differ, e.g. customised instances of
+        :class:`LightTheme`, so caches of styles are keyed by the hash.
+
+        The hash is computed once per instance and recomputed after an
+        attribute of the theme is assigned. Changes of nested values, e.g.
+        ``theme.colors.primary``, are not detected, assign a new ``colors``
+        instead.
+        """
+        fingerprint = (type(self).__qualname__, self.name, _fingerprint(self))
+        return hashlib.blake2b(repr(fingerprint).encode(), digest_size=16).hexdigest()
+
     def use(self, element: _T) -> _T:
         """Apply the theme to an element.
 
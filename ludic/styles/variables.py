@@ -0,0 +1,153 @@
+from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import fields, replace
+from typing import Any, LiteralString, Self, SupportsIndex
+
+from .compiler import compile_styles
+from .themes import Theme, get_default_theme
+from .types import BaseSize, Color
+
+# Theme fields emitted as custom properties and the prefixes of their names.
+VARIABLE_GROUPS = {
+    "colors": "color",
+    "sizes": "size",
+    "fonts": "font",
+    "rounding": "rounding",
+}
+
+# Functions computing the value of each referenced custom property.
+VARIABLES: MutableMapping[str, Callable[[Theme], str]] = {}
+
+
+def _format_argument(value: float) -> str:
+    return f"{value}".replace("-", "n").replace(".", "_")
+
+
+class Variable(str):
+    """Reference to a custom property holding a value of a theme."""
+
+    name: str
+
+    def __new__(cls, name: str) -> Self:
+        self = super().__new__(cls, f"var(--{name})")
+        self.name = name
+        return self
+
+    def _derive(self, suffix: str, compute: Callable[[Any], Any]) -> Self:
+        name = f"{self.name}-{suffix}"
+        if name not in VARIABLES:
+            resolve = VARIABLES[self.name]
+            VARIABLES[name] = lambda theme: compute(resolve(theme))
+        return type(self)(name)
+
+
+class ColorVariable(Variable, Color):
+    """Reference to a color of a theme.
+
+    Derived colors reference their own custom properties, which are computed
+    from the color of the theme the variables are formatted for.
+    """
+
+    def darken(self, shift: int = 1) -> Self:
+        return self._derive(f"darken-{shift}", lambda color: color.darken(shift))
+
+    def lighten(self, shift: int = 1) -> Self:
+        return self._derive(f"lighten-{shift}", lambda color: color.lighten(shift))
+
+    def readable(self) -> Self:
+        return self._derive("readable", lambda color: color.readable())
+
+
+class SizeVariable(Variable, BaseSize):
+    """Reference to a size of a theme, see :class:`ColorVariable`."""
+
+    def __mul__(self, factor: float | int | LiteralString | SupportsIndex) -> Self:
+        if isinstance(factor, float | int):
+            suffix = f"mul-{_format_argument(factor)}"
+            return self._derive(suffix, lambda size: size * factor)
+        return self
+
+    def __add__(self, value: float | int | LiteralString | SupportsIndex) -> Self:
+        if isinstance(value, float | int):
+            suffix = f"add-{_format_argument(value)}"
+            return self._derive(suffix, lambda size: size + value)
+        return self
+
+    def __sub__(self, value: float | int | LiteralString | SupportsIndex) -> Self:
+        if isinstance(value, float | int):
+            suffix = f"sub-{_format_argument(value)}"
+            return self._derive(suffix, lambda size: size - value)
+        return self
+
+
+def _variable(group: str, field: str, value: Any) -> Variable:
+    name = f"{VARIABLE_GROUPS[group]}-{field.replace('_', '-')}"
+    VARIABLES.setdefault(name, lambda theme: getattr(getattr(theme, group), field))
+
+    if isinstance(value, Color):
+        return ColorVariable(name)
+    elif isinstance(value, BaseSize):
+        return SizeVariable(name)
+    return Variable(name)
+
+
+def variables_theme(theme: Theme | None = None) -> Theme:
+    """Copy a theme referencing custom properties instead of its values.
+
+    Styles collected with the copy do not depend on the colors, sizes, fonts
+    and rounding of a theme, the values are set by the block formatted with
+    :func:`format_variables`. So one stylesheet can be shared and cached by
+    all themes which differ only in these values.
+
+    Example:
+
+        style.load(cache=True, theme=variables_theme())
+        style.variables(DarkTheme())
+
+    Args:
+        theme (Theme | None): The theme, defaults to the default theme.
+
+    Returns:
+        Theme: The copy of the theme.
+    """
+    theme = theme or get_default_theme()
+    changes = {}
+    for group in VARIABLE_GROUPS:
+        values = getattr(theme, group)
+        changes[group] = replace(
+            values,
+            **{
+                field.name: _variable(group, field.name, getattr(values, field.name))
+                for field in fields(values)
+            },
+        )
+    return replace(theme, **changes)
+
+
+def format_variables(
+    theme: Theme | None = None,
+    selector: str = ":root",
+    minify: bool = False,
+    names: Iterable[str] | None = None,
+) -> str:
+    """Format the custom properties of a theme.
+
+    By default, the block contains all properties referenced by styles
+    collected with :func:`variables_theme`, so it should be formatted after
+    the styles.
+
+    Args:
+        theme (Theme | None): The theme, defaults to the default theme.
+        selector (str): The selector of the block.
+        minify (bool): Whether to omit all optional whitespace.
+        names (Iterable[str] | None): Names of the properties to include,
+            unknown names are skipped.
+
+    Returns:
+        str: The formatted block.
+    """
+    theme = theme or get_default_theme()
+    names = VARIABLES if names is None else names
+    properties = {
+        f"--{name}": VARIABLES[name](theme) for name in names if name in VARIABLES
+    }
+    return compile_styles({selector: properties}, minify=minify)
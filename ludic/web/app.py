@@ -1,26 +1,44 @@
 import inspect
 import warnings
+from collections import Counter
 from collections.abc import AsyncIterator, Callable, Mapping, Sequence
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from functools import wraps
+from pathlib import Path
 from typing import Any, Literal, TypeVar, cast
 
+import anyio
 from starlette._utils import is_async_callable
 from starlette.applications import AppType, Starlette
 from starlette.middleware import Middleware
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.routing import BaseRoute
+from starlette.routing import BaseRoute, get_name
+from starlette.routing import Route as StarletteRoute
 from starlette.types import Lifespan
-from starlette.websockets import WebSocket
+from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
 from ludic.attrs import Attrs
 from ludic.base import BaseElement
+from ludic.styles import Theme
 
+from .caching import CacheBackend, ResponseCache
+from .coalescing import SingleFlight
+from .concurrency import AdaptiveConcurrencyLimiter
 from .datastructures import URLPath
+from .degradation import LoadMonitor
 from .endpoints import Endpoint
-from .responses import LudicResponse, run_in_threadpool_safe
+from .ratelimit import MemoryBuckets, RateLimit, RateLimitBackend
+from .rendering import RenderPolicy
+from .responses import (
+    LudicResponse,
+    extract_from_request,
+    run_in_threadpool_safe,
+)
 from .routing import Router
+from .sse import EventSourceResponse
+from .stylesheets import STYLESHEET_PATH, STYLESHEET_ROUTE_NAME, Stylesheets
+from .websockets import send_element
 
 TCallable = TypeVar("TCallable", bound=Callable[..., Any])
 TEndpoint = TypeVar("TEndpoint", bound=Endpoint[Attrs])
@@ -47,6 +65,23 @@ def _build_lifespan(
     return lifespan
 
 
+def _with_load_monitor(
+    lifespan: Lifespan[Any] | None, load_monitor: LoadMonitor
+) -> Lifespan[Any]:
+    @asynccontextmanager
+    async def monitored_lifespan(app: Any) -> AsyncIterator[Any]:
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(load_monitor.run)
+            if lifespan is None:
+                yield None
+            else:
+                async with lifespan(app) as state:
+                    yield state
+            task_group.cancel_scope.cancel()
+
+    return monitored_lifespan
+
+
 class LudicApp(Starlette):
     """Starlette application with Ludic adoption.
 
@@ -63,6 +98,45 @@ class LudicApp(Starlette):
         @app.get("/")
         async def homepage(request: Request) -> button:
             return button(...)
+
+    With ``partial_rendering``, htmx requests sending the ``HX-Target``
+    header receive only the content of the element with that id from the
+    returned tree, much like ``hx-select`` would pick it on the client side.
+    The rest of the tree is not rendered. htmx does not tell the server how
+    the target is swapped, so ``True`` or ``"innerHTML"`` sends the children
+    of the element, the default swap style of htmx, ``"outerHTML"`` sends the
+    element itself. Endpoints can override the option with their
+    ``partial_rendering`` class attribute.
+
+    The ``render_policy`` decides whether returned elements are rendered on
+    the event loop, in a thread pool or in a process pool, see
+    :class:`RenderPolicy`. Routes and endpoints can set their own policy.
+
+    The ``concurrency_limiter`` limits concurrently handled requests of each
+    route and sheds the excess ones, see :class:`AdaptiveConcurrencyLimiter`.
+
+    The ``rate_limit_backend`` stores the token buckets of rate limited routes
+    which do not set their own backend, it defaults to in-process memory of
+    this application, see :func:`ludic.web.ratelimit.rate_limit`.
+
+    Routes decorated with :func:`ludic.web.routing.cancel_on_disconnect` are
+    cancelled when a client disconnects before the response is sent, e.g.
+    when htmx replaces a superseded request. The ``cancelled_requests``
+    counter holds the number of cancelled requests per route name.
+
+    The ``load_monitor`` measures the event loop lag and the number of
+    requests in flight, :class:`ludic.web.degradation.Degradable` components
+    use it to defer their rendering under high load.
+
+    With ``serve_styles``, the global stylesheet of the loaded components is
+    served from ``/_ludic/styles-<hash>.css`` and linked by pages instead of
+    inlining the styles, see :class:`Stylesheets`. With ``css_variables``, it
+    is shared by all themes, which only differ in the custom properties
+    inlined in each page. The ``styles_manifest`` points to stylesheets built
+    by ``python -m ludic.styles build``, which are served instead of
+    collecting the styles at runtime. Both options imply ``serve_styles``.
+    Pages rendered with other ``themes`` than the default one should list
+    them, so that every worker can serve their stylesheets.
     """
 
     router: Router
@@ -76,8 +150,31 @@ class LudicApp(Starlette):
         on_startup: Sequence[Callable[[], Any]] | None = None,
         on_shutdown: Sequence[Callable[[], Any]] | None = None,
         lifespan: Lifespan[AppType] | None = None,
+        cache_backend: CacheBackend | None = None,
+        partial_rendering: bool | Literal["innerHTML", "outerHTML"] = False,
+        render_policy: RenderPolicy | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        rate_limit_backend: RateLimitBackend | None = None,
+        load_monitor: LoadMonitor | None = None,
+        serve_styles: bool = False,
+        css_variables: bool = False,
+        styles_manifest: str | Path | None = None,
+        themes: Sequence[Theme] = (),
     ) -> None:
         super().__init__(debug, middleware=middleware)
+        self.response_cache = ResponseCache(cache_backend)
+        self.single_flight = SingleFlight()
+        self.partial_rendering = partial_rendering
+        self.render_policy = render_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.rate_limit_backend = rate_limit_backend or MemoryBuckets()
+        self.cancelled_requests: Counter[str] = Counter()
+        self.load_monitor = load_monitor
+        self.stylesheets: Stylesheets | None = None
+        if serve_styles or css_variables or styles_manifest is not None:
+            self.stylesheets = Stylesheets(
+                css_variables=css_variables, manifest=styles_manifest, themes=themes
+            )
 
         for key, value in (exception_handlers or {}).items():
             self.add_exception_handler(key, value)
@@ -96,7 +193,22 @@ class LudicApp(Starlette):
             )
             lifespan = _build_lifespan(on_startup or (), on_shutdown or ())
 
+        if load_monitor is not None:
+            lifespan = _with_load_monitor(lifespan, load_monitor)
+
         self.router = Router(routes, lifespan=lifespan)
+        if self.stylesheets is not None:
+            # Inserted first, so that catch-all routes do not shadow it.
+            self.router.routes.insert(
+                0,
+                StarletteRoute(
+                    STYLESHEET_PATH,
+                    self.stylesheets.endpoint,
+                    methods=["GET"],
+                    name=STYLESHEET_ROUTE_NAME,
+                    include_in_schema=False,
+                ),
+            )
 
     def get(self, path: str, **kwargs: Any) -> Callable[[TCallable], TCallable]:
         """Register GET endpoint to the application."""
@@ -126,6 +238,117 @@ class LudicApp(Starlette):
         """Register OPTIONS endpoint to the application."""
         return self.register_route(path, method="OPTIONS", **kwargs)
 
+    def sse(
+        self,
+        path: str,
+        name: str | None = None,
+        heartbeat: float | None = 15.0,
+        include_in_schema: bool = True,
+    ) -> Callable[[TCallable], TCallable]:
+        """Register a Server-Sent Events endpoint to the application.
+
+        The handler is an async generator yielding elements, optionally as
+        ``(event name, element)`` tuples. Each element is rendered and sent to
+        the client as one message, see :class:`EventSourceResponse`.
+
+        Example:
+
+            @app.sse("/dashboard/events")
+            async def dashboard_events(request: Request) -> AsyncIterator[Stats]:
+                async for stats in stats_updates():
+                    yield "stats", Stats(**stats)
+
+            div(hx_ext="sse", sse_connect="/dashboard/events", sse_swap="stats")
+
+        Args:
+            path: The path of the endpoint.
+            name: The name of the endpoint.
+            heartbeat: Seconds between heartbeats, None disables them.
+            include_in_schema: Whether to include the endpoint in the schema.
+        """
+
+        def register(handler: TCallable) -> TCallable:
+            async def endpoint(request: Request) -> Response:
+                exit_stack = AsyncExitStack()
+                try:
+                    handler_kw = await extract_from_request(
+                        handler, request, exit_stack
+                    )
+                except BaseException:
+                    await exit_stack.aclose()
+                    raise
+
+                async def events() -> AsyncIterator[Any]:
+                    async with exit_stack:
+                        async for event in handler(**handler_kw):
+                            yield event
+
+                return EventSourceResponse(
+                    events(),
+                    heartbeat=heartbeat,
+                    context={"request": request},
+                )
+
+            self.add_route(
+                path,
+                endpoint,
+                methods=["GET"],
+                name=name or get_name(handler),
+                include_in_schema=include_in_schema,
+            )
+            handler.route = endpoint.route  # type: ignore[attr-defined]
+            return handler
+
+        return register
+
+    def ws(
+        self, path: str, name: str | None = None
+    ) -> Callable[[TCallable], TCallable]:
+        """Register a WebSocket endpoint to the application.
+
+        The websocket is accepted before the handler is called and closed after
+        it returns. The handler can be an async generator, each yielded element
+        is then rendered and sent to the client as a text message.
+
+        Example:
+
+            hub = BroadcastHub()
+
+            @app.ws("/ws/notifications")
+            async def notifications(websocket: WebSocket) -> None:
+                await hub.serve(websocket, "notifications")
+
+        Args:
+            path: The path of the endpoint.
+            name: The name of the endpoint.
+        """
+
+        def register(handler: TCallable) -> TCallable:
+            async def endpoint(websocket: WebSocket) -> None:
+                await websocket.accept()
+                async with AsyncExitStack() as exit_stack:
+                    handler_kw = await extract_from_request(
+                        handler, websocket, exit_stack
+                    )
+                    try:
+                        if inspect.isasyncgenfunction(handler):
+                            async for element in handler(**handler_kw):
+                                await send_element(websocket, element)
+                        else:
+                            await handler(**handler_kw)
+                    except WebSocketDisconnect:
+                        return
+
+                if websocket.application_state == WebSocketState.CONNECTED:
+                    await websocket.close()
+
+            self.router.add_websocket_route(
+                path, endpoint, name=name or get_name(handler)
+            )
+            return handler
+
+        return register
+
     def register_route(
         self,
         path: str,
@@ -134,6 +357,9 @@ class LudicApp(Starlette):
         ] = "GET",
         name: str | None = None,
         include_in_schema: bool = True,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> Callable[[TCallable], TCallable]:
         """Register an endpoint to the application."""
 
@@ -144,6 +370,9 @@ class LudicApp(Starlette):
                 methods=[method],
                 name=name,
                 include_in_schema=include_in_schema,
+                render_policy=render_policy,
+                rate_limit=rate_limit,
+                timeout=timeout,
             )
             return handler
 
@@ -154,12 +383,21 @@ class LudicApp(Starlette):
         path: str,
         name: str | None = None,
         include_in_schema: bool = True,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> Callable[[type[TEndpoint]], type[TEndpoint]]:
         """Register a Ludic class endpoint to the application."""
 
         def register(endpoint: type[TEndpoint]) -> type[TEndpoint]:
             self.add_route(
-                path, endpoint, name=name, include_in_schema=include_in_schema
+                path,
+                endpoint,
+                name=name,
+                include_in_schema=include_in_schema,
+                render_policy=render_policy,
+                rate_limit=rate_limit,
+                timeout=timeout,
             )
             return endpoint
 
@@ -172,6 +410,9 @@ class LudicApp(Starlette):
         methods: list[str] | None = None,
         name: str | None = None,
         include_in_schema: bool = True,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Add a Ludic endpoint to the application.
 
@@ -182,13 +423,26 @@ class LudicApp(Starlette):
 
         It is still possible to return a regular response from the handler
         (e.g. ``JSONResponse({"hello": "world"})``).
+
+        The ``render_policy`` overrides the application's render policy for
+        this route. The ``rate_limit`` limits how often clients can call the
+        route, see :func:`ludic.web.ratelimit.rate_limit`.
+
+        With ``timeout``, the route has to respond within the given number of
+        seconds, otherwise its work is cancelled and :class:`GatewayTimeoutError`
+        is raised. Endpoints can also set the ``timeout`` class attribute.
+        Streamed responses, e.g. :class:`ludic.web.fragments.Fragments`, are
+        aborted when the deadline expires between two streamed fragments.
         """
-        super().add_route(
+        self.router.add_route(
             path,
             route,
             methods=methods,
             name=name,
             include_in_schema=include_in_schema,
+            render_policy=render_policy,
+            rate_limit=rate_limit,
+            timeout=timeout,
         )
 
     def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
@@ -245,7 +499,11 @@ class LudicApp(Starlette):
                 response = await run_in_threadpool_safe(handler, **handler_kw)
 
             if isinstance(response, BaseElement):
-                return LudicResponse(response, getattr(exc, "status_code", 500))
+                return LudicResponse(
+                    response,
+                    getattr(exc, "status_code", 500),
+                    headers=getattr(exc, "headers", None),
+                )
             return cast(Response, response)
 
         self.exception_handlers[exc_class_or_status_code] = wrapped_handler
@@ -0,0 +1,398 @@
+import base64
+import hashlib
+import json
+import time
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+T = TypeVar("T")
+
+HTMX_HEADERS = ("HX-Request", "HX-Target")
+
+
+def make_request_key(name: str, request: Request, headers: Sequence[str]) -> str:
+    """Compute a key identifying requests rendering the same response.
+
+    Args:
+        name (str): The name of the route.
+        request (Request): The request.
+        headers (Sequence[str]): The request headers the response depends on.
+
+    Returns:
+        str: The key.
+    """
+    parts = {
+        "name": name,
+        "path_params": sorted(
+            (key, str(value)) for key, value in request.path_params.items()
+        ),
+        "query": sorted(request.query_params.multi_items()),
+        "headers": [request.headers.get(header, "") for header in headers],
+    }
+    serialized = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(serialized).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    body: bytes
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    created_at: float
+    expires_at: float
+    stale_until: float
+    vary: dict[str, str] = field(default_factory=dict)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+    def to_response(self, now: float) -> Response:
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = [
+            *self.headers,
+            (b"age", str(int(max(0, now - self.created_at))).encode("latin-1")),
+        ]
+        return response
+
+    def dumps(self) -> bytes:
+        return json.dumps(
+            {
+                "body": base64.b64encode(self.body).decode("ascii"),
+                "status_code": self.status_code,
+                "headers": [
+                    [key.decode("latin-1"), value.decode("latin-1")]
+                    for key, value in self.headers
+                ],
+                "created_at": self.created_at,
+                "expires_at": self.expires_at,
+                "stale_until": self.stale_until,
+                "vary": self.vary,
+            }
+        ).encode("utf-8")
+
+    @classmethod
+    def loads(cls, data: bytes) -> CacheEntry:
+        raw = json.loads(data)
+        return cls(
+            body=base64.b64decode(raw["body"]),
+            status_code=raw["status_code"],
+            headers=[
+                (key.encode("latin-1"), value.encode("latin-1"))
+                for key, value in raw["headers"]
+            ],
+            created_at=raw["created_at"],
+            expires_at=raw["expires_at"],
+            stale_until=raw["stale_until"],
+            vary=raw["vary"],
+        )
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """Storage for cached responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under the given key."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under the given key."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the entry stored under the given key."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryCache(CacheBackend):
+    """In-memory cache backend evicting the least recently used entries.
+
+    Args:
+        max_entries (int): Maximum number of cached responses.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileCache(CacheBackend):
+    """Cache backend storing responses as files in a local directory.
+
+    Args:
+        directory (str | Path): The directory to store the responses in.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> CacheEntry | None:
+        try:
+            return CacheEntry.loads(self._path(key).read_bytes())
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path(key).with_suffix(".tmp")
+        temp_path.write_bytes(entry.dumps())
+        temp_path.replace(self._path(key))
+
+    def _clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        return await run_in_threadpool(self._read, key)
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await run_in_threadpool(self._write, key, entry)
+
+    async def delete(self, key: str) -> None:
+        await run_in_threadpool(self._path(key).unlink, missing_ok=True)
+
+    async def clear(self) -> None:
+        await run_in_threadpool(self._clear)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching configuration of a handler, see :func:`cache`."""
+
+    ttl: float
+    stale_while_revalidate: float = 0
+    vary: Sequence[str] = ()
+    backend: CacheBackend | None = None
+
+
+def cache(
+    ttl: float,
+    stale_while_revalidate: float = 0,
+    vary: Sequence[str] = (),
+    backend: CacheBackend | None = None,
+) -> Callable[[T], T]:
+    """Cache successful GET responses of a handler or an endpoint.
+
+    The cache key consists of the route name, path parameters, query
+    parameters and the ``HX-Request`` and ``HX-Target`` headers, so htmx
+    fragments and full pages are cached separately. Responses setting cookies
+    are never cached.
+
+    Example:
+
+        @app.get("/catalog/{id}")
+        @cache(ttl=60, stale_while_revalidate=30)
+        async def catalog(id: str) -> Page:
+            return Page(...)
+
+        @app.endpoint("/products/{id}")
+        @cache(ttl=60, vary=["Accept-Language"])
+        class Product(Endpoint[ProductAttrs]):
+            ...
+
+    Args:
+        ttl (float): Number of seconds a response is fresh.
+        stale_while_revalidate (float): Number of seconds after expiration
+            during which the stale response is returned while a fresh one is
+            rendered in the background.
+        vary (Sequence[str]): Additional request headers the response depends on.
+        backend (CacheBackend | None): Where to store the responses, defaults to
+            the application's ``cache_backend``.
+    """
+    policy = CachePolicy(
+        ttl=ttl,
+        stale_while_revalidate=stale_while_revalidate,
+        vary=tuple(vary),
+        backend=backend,
+    )
+
+    def decorator(handler: T) -> T:
+        handler.__ludic_cache__ = policy  # type: ignore[attr-defined]
+        return handler
+
+    return decorator
+
+
+def get_cache_policy(handler: Any) -> CachePolicy | None:
+    """Get the caching configuration of a handler or an endpoint method."""
+    return getattr(handler, "__ludic_cache__", None)
+
+
+class ResponseCache:
+    """Serves responses of handlers opted in with :func:`cache`.
+
+    Args:
+        backend (CacheBackend | None): The default storage for cached responses,
+            defaults to a :class:`MemoryCache` of this instance.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None) -> None:
+        self.backend = backend or MemoryCache()
+        self._revalidating: set[str] = set()
+
+    def make_key(self, policy: CachePolicy, name: str, request: Request) -> str:
+        """Compute the cache key of a request."""
+        return make_request_key(name, request, (*HTMX_HEADERS, *policy.vary))
+
+    async def respond(
+        self,
+        policy: CachePolicy,
+        name: str,
+        request: Request,
+        call_next: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Return the cached response or compute and store a new one.
+
+        Args:
+            policy (CachePolicy): The caching configuration of the handler.
+            name (str): The name of the route.
+            request (Request): The current request.
+            call_next: Function computing the response.
+
+        Returns:
+            Response: The response.
+        """
+        if request.method not in ("GET", "HEAD"):
+            return await call_next()
+
+        backend = policy.backend or self.backend
+        key = self.make_key(policy, name, request)
+        now = time.time()
+
+        entry = await backend.get(key)
+        if entry is not None and self._vary_matches(entry, request):
+            if entry.is_fresh(now):
+                return entry.to_response(now)
+            if entry.is_usable(now):
+                response = entry.to_response(now)
+                if key not in self._revalidating:
+                    self._revalidating.add(key)
+                    response.background = BackgroundTask(
+                        self._revalidate, policy, backend, key, request, call_next
+                    )
+                return response
+
+        response = await call_next()
+        await self._store(policy, backend, key, request, response)
+        return response
+
+    async def _revalidate(
+        self,
+        policy: CachePolicy,
+        backend: CacheBackend,
+        key: str,
+        request: Request,
+        call_next: Callable[[], Awaitable[Response]],
+    ) -> None:
+        try:
+            response = await call_next()
+            await self._store(policy, backend, key, request, response)
+        finally:
+            self._revalidating.discard(key)
+        # The response is never sent, but its background tasks still have to run.
+        if response.background is not None:
+            await response.background()
+
+    async def _store(
+        self,
+        policy: CachePolicy,
+        backend: CacheBackend,
+        key: str,
+        request: Request,
+        response: Response,
+    ) -> None:
+        vary = [
+            header.strip()
+            for header in response.headers.get("Vary", "").split(",")
+            if header.strip()
+        ]
+        for header in (*HTMX_HEADERS, *policy.vary):
+            if header.lower() not in (value.lower() for value in vary):
+                vary.append(header)
+        response.headers["Vary"] = ", ".join(vary)
+
+        if (
+            response.status_code != 200
+            or "set-cookie" in response.headers
+            or "*" in vary
+            or not isinstance(getattr(response, "body", None), bytes)
+        ):
+            return
+
+        now = time.time()
+        await backend.set(
+            key,
+            CacheEntry(
+                body=response.body,
+                status_code=response.status_code,
+                headers=list(response.raw_headers),
+                created_at=now,
+                expires_at=now + policy.ttl,
+                stale_until=now + policy.ttl + policy.stale_while_revalidate,
+                vary={header: request.headers.get(header, "") for header in vary},
+            ),
+        )
+
+    def _vary_matches(self, entry: CacheEntry, request: Request) -> bool:
+        return all(
+            request.headers.get(header, "") == value
+            for header, value in entry.vary.items()
+        )
+
+
+# Response caches of applications other than LudicApp, e.g. a plain Starlette
+# application mounting Ludic routes.
+_RESPONSE_CACHES: weakref.WeakKeyDictionary[Any, ResponseCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_response_cache(app: Any) -> ResponseCache:
+    """Get the response cache of an application."""
+    response_cache = getattr(app, "response_cache", None)
+    if isinstance(response_cache, ResponseCache):
+        return response_cache
+    if app is None:
+        return ResponseCache()
+    if (response_cache := _RESPONSE_CACHES.get(app)) is None:
+        response_cache = _RESPONSE_CACHES[app] = ResponseCache()
+    return response_cache
@@ -0,0 +1,143 @@
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .caching import HTMX_HEADERS, make_request_key
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """Coalescing configuration of a handler, see :func:`coalesce`."""
+
+    vary: Sequence[str] = ()
+
+
+def coalesce(vary: Sequence[str] = ()) -> Callable[[T], T]:
+    """Share one response between identical concurrent GET requests.
+
+    While a request is being handled, identical requests arriving in the
+    meantime wait for it and receive a copy of its response instead of
+    running the handler and rendering the same tree again. Requests are
+    identical if they have the same route, path parameters, query
+    parameters, ``HX-Request`` and ``HX-Target`` headers, and the headers
+    listed in ``vary``.
+
+    Only responses with a body rendered in memory and without cookies are
+    shared. When the first request fails or is cancelled, e.g. because the
+    client disconnected, one of the waiting requests takes over.
+
+    Example:
+
+        @app.get("/")
+        @coalesce(vary=["Accept-Language"])
+        async def homepage() -> Page:
+            return Page(...)
+
+    Args:
+        vary (Sequence[str]): Additional request headers the response depends on.
+    """
+    policy = CoalescePolicy(vary=tuple(vary))
+
+    def decorator(handler: T) -> T:
+        handler.__ludic_coalesce__ = policy  # type: ignore[attr-defined]
+        return handler
+
+    return decorator
+
+
+def get_coalesce_policy(handler: Any) -> CoalescePolicy | None:
+    """Get the coalescing configuration of a handler or an endpoint method."""
+    return getattr(handler, "__ludic_coalesce__", None)
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.completed = False
+        self.shared = False
+        self.body = b""
+        self.status_code = 200
+        self.headers: list[tuple[bytes, bytes]] = []
+
+    def complete(self, response: Response) -> None:
+        self.completed = True
+        body = getattr(response, "body", None)
+        if isinstance(body, bytes) and "set-cookie" not in response.headers:
+            self.body = body
+            self.status_code = response.status_code
+            self.headers = list(response.raw_headers)
+            self.shared = True
+
+    def to_response(self) -> Response:
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = list(self.headers)
+        return response
+
+
+class SingleFlight:
+    """Runs at most one computation of a response per key at a time."""
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def respond(
+        self,
+        policy: CoalescePolicy,
+        name: str,
+        request: Request,
+        call_next: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Return the response of an identical in-flight request or compute it.
+
+        Args:
+            policy (CoalescePolicy): The coalescing configuration of the handler.
+            name (str): The name of the route.
+            request (Request): The current request.
+            call_next: Function computing the response.
+
+        Returns:
+            Response: The response.
+        """
+        if request.method not in ("GET", "HEAD"):
+            return await call_next()
+
+        key = make_request_key(name, request, (*HTMX_HEADERS, *policy.vary))
+        while (flight := self._flights.get(key)) is not None:
+            await flight.done.wait()
+            if flight.shared:
+                return flight.to_response()
+            elif flight.completed:
+                # The response could not be shared, each request renders its own.
+                return await call_next()
+            # Otherwise the request failed or was cancelled, one of the waiting
+            # requests takes over.
+
+        flight = self._flights[key] = _Flight()
+        try:
+            response = await call_next()
+            flight.complete(response)
+            return response
+        finally:
+            del self._flights[key]
+            flight.done.set()
+
+
+_DEFAULT_SINGLE_FLIGHT = SingleFlight()
+
+
+def get_single_flight(app: Any) -> SingleFlight:
+    """Get the single flight registry of an application or the process-wide one."""
+    single_flight = getattr(app, "single_flight", None)
+    if isinstance(single_flight, SingleFlight):
+        return single_flight
+    return _DEFAULT_SINGLE_FLIGHT
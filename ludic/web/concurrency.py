@@ -0,0 +1,216 @@
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import anyio
+
+from .exceptions import ServiceUnavailableError, TooManyRequestsError
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """Statistics of one route collected by :class:`AdaptiveConcurrencyLimiter`.
+
+    Args:
+        limit (int): The currently allowed number of concurrent requests.
+        in_flight (int): The number of requests being handled.
+        queue_depth (int): The number of requests waiting for a slot.
+        shed_count (int): The number of rejected requests.
+        latency (float | None): The baseline latency in seconds.
+    """
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    shed_count: int
+    latency: float | None
+
+
+class _RouteLimit:
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        self.limiter = limiter
+        self.limit = float(limiter.initial_limit)
+        self.in_flight = 0
+        self.shed_count = 0
+        self.baseline: float | None = None
+        self.waiters: deque[anyio.Event] = deque()
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            limit=int(self.limit),
+            in_flight=self.in_flight,
+            queue_depth=len(self.waiters),
+            shed_count=self.shed_count,
+            latency=self.baseline,
+        )
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return
+
+        if len(self.waiters) >= self.limiter.queue_size:
+            self.shed_count += 1
+            raise TooManyRequestsError(
+                headers={"Retry-After": self.limiter.retry_after}
+            )
+
+        event = anyio.Event()
+        self.waiters.append(event)
+        try:
+            with anyio.move_on_after(self.limiter.queue_timeout):
+                await event.wait()
+        except BaseException:
+            # The slot might have been handed over right before cancellation.
+            if event.is_set():
+                self.release(None)
+            else:
+                self.waiters.remove(event)
+            raise
+
+        if not event.is_set():
+            self.waiters.remove(event)
+            self.shed_count += 1
+            raise ServiceUnavailableError(
+                headers={"Retry-After": self.limiter.retry_after}
+            )
+
+    def release(self, latency: float | None) -> None:
+        was_saturated = self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+        if latency is not None:
+            self.update(latency, was_saturated)
+
+        while self.waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            self.waiters.popleft().set()
+
+    def update(self, latency: float, was_saturated: bool) -> None:
+        limiter = self.limiter
+        if self.baseline is None:
+            self.baseline = latency
+        else:
+            # The baseline follows the latency slower than the limit does.
+            self.baseline += (latency - self.baseline) * limiter.smoothing / 10
+
+        # Latency above the tolerated baseline shrinks the limit proportionally,
+        # otherwise the limit grows by its square root while it is saturated.
+        gradient = max(0.5, min(1.0, limiter.tolerance * self.baseline / latency))
+        new_limit = self.limit * gradient
+        if gradient == 1.0 and (was_saturated or self.waiters):
+            new_limit += math.sqrt(self.limit)
+
+        limit = self.limit + (new_limit - self.limit) * limiter.smoothing
+        self.limit = max(limiter.min_limit, min(limiter.max_limit, limit))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit the number of concurrently handled requests of each route.
+
+    The allowed concurrency of a route adapts to its latency. While requests
+    finish within ``tolerance`` times the baseline latency (a moving average
+    of observed latencies), the limit grows. When the latency increases, the
+    limit shrinks proportionally, so the server stops accepting more work
+    than it can handle.
+
+    Requests above the limit wait in a short queue. When the queue is full,
+    the request is rejected with :class:`TooManyRequestsError`, when it waits
+    longer than ``queue_timeout`` seconds, it is rejected with
+    :class:`ServiceUnavailableError`. Both are rendered by the application's
+    exception handlers.
+
+    Usage:
+
+        limiter = AdaptiveConcurrencyLimiter(max_limit=200, queue_timeout=0.2)
+        app = LudicApp(concurrency_limiter=limiter)
+
+        @app.exception_handler(503)
+        async def overloaded(exc: ServiceUnavailableError) -> Page:
+            return Page(...)
+
+        limiter.stats()  # {"index": LimiterStats(limit=..., ...), ...}
+
+    Args:
+        initial_limit (int): The initial concurrency limit of a route.
+        min_limit (int): The lowest concurrency limit of a route.
+        max_limit (int): The highest concurrency limit of a route.
+        queue_size (int): Maximum number of requests waiting for a slot.
+        queue_timeout (float): Maximum number of seconds a request waits.
+        tolerance (float): How many times the baseline latency can be exceeded
+            before the limit decreases.
+        smoothing (float): How quickly the limit and the baseline latency
+            adapt, between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        queue_size: int = 50,
+        queue_timeout: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.retry_after = str(max(1, math.ceil(queue_timeout)))
+        self._routes: dict[str, _RouteLimit] = {}
+
+    def stats(self) -> dict[str, LimiterStats]:
+        """Get the statistics of all routes which received a request."""
+        return {name: route.stats() for name, route in self._routes.items()}
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a slot in all routes."""
+        return sum(len(route.waiters) for route in self._routes.values())
+
+    @property
+    def shed_count(self) -> int:
+        """The number of requests rejected in all routes."""
+        return sum(route.shed_count for route in self._routes.values())
+
+    @asynccontextmanager
+    async def limit(self, name: str) -> AsyncIterator[Callable[[], None]]:
+        """Wait for a slot of a route and measure the latency of the request.
+
+        The context manager yields a function releasing the slot early, e.g.
+        once a streamed response started, so long-lived connections do not
+        occupy the slot and skew the latency for their whole lifetime.
+
+        Args:
+            name (str): The name of the route.
+
+        Returns:
+            A function releasing the slot before the block exits.
+
+        Raises:
+            TooManyRequestsError: If the queue of the route is full.
+            ServiceUnavailableError: If the request waited too long.
+        """
+        if (route := self._routes.get(name)) is None:
+            route = self._routes[name] = _RouteLimit(self)
+
+        await route.acquire()
+        start = time.perf_counter()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                route.release(time.perf_counter() - start)
+
+        try:
+            yield release
+        finally:
+            release()
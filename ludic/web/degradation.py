@@ -0,0 +1,146 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, NotRequired, override
+
+import anyio
+
+from ludic.attrs import Attrs
+from ludic.base import BaseElement
+from ludic.catalog.loaders import LazyLoader
+from ludic.components import ComponentStrict
+from ludic.types import AnyChildren
+
+from .endpoints import Endpoint
+
+
+class LoadMonitor:
+    """Measures the load of an application.
+
+    The event loop lag is the delay of a periodically scheduled wake up, it
+    grows when the event loop is blocked, e.g. by rendering. It is measured
+    by :meth:`run`, which :class:`LudicApp` runs during its lifespan when it
+    is created with the ``load_monitor`` argument.
+
+    Args:
+        interval (float): Seconds between measurements of the event loop lag.
+        smoothing (float): Weight of the latest measurement, between 0 and 1.
+    """
+
+    def __init__(self, interval: float = 0.1, smoothing: float = 0.3) -> None:
+        self.interval = interval
+        self.smoothing = smoothing
+        self.loop_lag = 0.0
+        self.in_flight = 0
+
+    async def run(self) -> None:
+        """Measure the event loop lag until cancelled."""
+        while True:
+            start = time.monotonic()
+            await anyio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - start - self.interval)
+            self.loop_lag += (lag - self.loop_lag) * self.smoothing
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count a request as in flight for the duration of the context."""
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+
+def get_load_monitor(app: Any) -> LoadMonitor | None:
+    """Get the load monitor of an application, if it has one."""
+    load_monitor = getattr(app, "load_monitor", None)
+    return load_monitor if isinstance(load_monitor, LoadMonitor) else None
+
+
+@dataclass(frozen=True)
+class DegradePolicy:
+    """When :class:`Degradable` components are deferred.
+
+    A component is deferred when any of the configured thresholds is crossed.
+
+    Args:
+        max_loop_lag (float | None): Event loop lag in seconds.
+        max_in_flight (int | None): Number of requests being handled.
+        signal (Callable[[], bool] | None): Custom function returning True
+            when the application is overloaded.
+    """
+
+    max_loop_lag: float | None = 0.05
+    max_in_flight: int | None = None
+    signal: Callable[[], bool] | None = None
+
+    def is_overloaded(self, monitor: LoadMonitor | None) -> bool:
+        """Check whether any of the thresholds is crossed.
+
+        Args:
+            monitor (LoadMonitor | None): The load monitor of the application.
+
+        Returns:
+            bool: Whether the application is overloaded.
+        """
+        if monitor is not None:
+            if self.max_loop_lag is not None and monitor.loop_lag > self.max_loop_lag:
+                return True
+            if (
+                self.max_in_flight is not None
+                and monitor.in_flight > self.max_in_flight
+            ):
+                return True
+        return self.signal is not None and self.signal()
+
+
+DEFAULT_DEGRADE_POLICY = DegradePolicy()
+
+
+class DegradableAttrs(Attrs):
+    policy: NotRequired[DegradePolicy]
+    placeholder: NotRequired[AnyChildren]
+
+
+class Degradable(ComponentStrict[Endpoint[Any], DegradableAttrs]):
+    """Defer rendering of an endpoint when the application is overloaded.
+
+    Under normal load, the endpoint is rendered inline. When the load crosses
+    a threshold of the policy, a :class:`LazyLoader` is rendered instead, and
+    the browser loads the endpoint from its own route once the page is shown.
+
+    Usage:
+
+        app = LudicApp(load_monitor=LoadMonitor())
+
+        @app.endpoint("/widgets/sales/{region}")
+        class SalesChart(Endpoint[SalesChartAttrs]):
+            ...
+
+        Page(
+            Header(...),
+            Degradable(
+                SalesChart(region="eu", data=data),
+                policy=DegradePolicy(max_loop_lag=0.05, max_in_flight=200),
+            ),
+        )
+    """
+
+    @override
+    def render(self) -> BaseElement:
+        endpoint = self.children[0]
+        endpoint.context.update(self.context)
+
+        request = self.context.get("request")
+        if request is None:
+            return endpoint
+
+        policy = self.attrs.get("policy", DEFAULT_DEGRADE_POLICY)
+        if not policy.is_overloaded(get_load_monitor(request.app)):
+            return endpoint
+
+        loader = LazyLoader(load_url=endpoint.url_for(type(endpoint)).path)
+        if "placeholder" in self.attrs:
+            loader.attrs["placeholder"] = self.attrs["placeholder"]
+        return loader
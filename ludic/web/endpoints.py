@@ -1,6 +1,6 @@
 import inspect
-from collections.abc import Callable
-from typing import Any, ClassVar, Protocol
+from collections.abc import Callable, Hashable
+from typing import Any, ClassVar, Literal, Protocol, TypeVar
 
 from starlette.datastructures import URL
 from starlette.endpoints import HTTPEndpoint as BaseEndpoint
@@ -11,9 +11,14 @@ from ludic.components import Component
 from ludic.types import AnyChildren, NoChildren, TAttrs
 from ludic.utils import get_element_generic_args
 
+from .loaders import BatchFunction, DataLoader
+from .rendering import RenderPolicy
 from .requests import Request
 from .responses import prepare_response
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 
 class RoutedProtocol(Protocol):
     route: ClassVar[Route]
@@ -51,6 +56,10 @@ class Endpoint(Component[NoChildren, TAttrs]):
     """Base class for Ludic endpoints."""
 
     route: ClassVar[Route]
+    partial_rendering: ClassVar[bool | Literal["innerHTML", "outerHTML"] | None] = None
+    render_policy: ClassVar[RenderPolicy | None] = None
+    timeout: ClassVar[float | None] = None
+    """Seconds to respond within, streamed fragments stop when it expires."""
 
     @property
     def request(self) -> Request | None:
@@ -75,6 +84,26 @@ class Endpoint(Component[NoChildren, TAttrs]):
             load_url=self.url_for(endpoint, **kwargs).path,
         )
 
+    def loader(self, batch_fn: BatchFunction[K, V]) -> DataLoader[K, V]:
+        """Get the request-scoped data loader for a batch function.
+
+        Since rendering is synchronous, values can only be read with
+        :meth:`DataLoader.get` during ``render``. They are usually loaded
+        beforehand in the async handler, see :meth:`Request.loader`.
+
+        Args:
+            batch_fn: The function loading a batch of keys.
+
+        Returns:
+            The data loader.
+        """
+        if self.request is None or not isinstance(self.request, Request):
+            raise RuntimeError(
+                f"{type(self).__name__} is not bound to a request, you can only use "
+                f"the {type(self).__name__}.loader method in the context of a request."
+            )
+        return self.request.loader(batch_fn)
+
     def url_for(self, endpoint: type[RoutedProtocol] | str, **path_params: Any) -> URL:
         """Get URL for an endpoint.
 
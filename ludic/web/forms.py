@@ -0,0 +1,302 @@
+import codecs
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import Any
+from urllib.parse import unquote_plus
+
+from starlette.datastructures import Headers, UploadFile
+from starlette.requests import Request
+
+from .exceptions import BadRequestError
+
+multipart: Any
+parse_options_header: Any
+
+try:
+    try:
+        import python_multipart as multipart
+        from python_multipart.multipart import parse_options_header
+    except ModuleNotFoundError:
+        import multipart  # type: ignore[no-redef]
+        from multipart.multipart import (  # type: ignore[no-redef]
+            parse_options_header,
+        )
+except ModuleNotFoundError:
+    multipart = None
+    parse_options_header = None
+
+FormItem = tuple[str, str | UploadFile]
+
+
+@dataclass(frozen=True)
+class FormLimits:
+    """Limits applied while a request form is streamed.
+
+    Exceeding any of the limits raises :class:`BadRequestError`.
+
+    Args:
+        max_field_size (int): Maximum size of a single non-file field in bytes.
+        max_file_size (int): Maximum size of a single uploaded file in bytes.
+        max_total_size (int): Maximum size of the whole request body in bytes.
+        max_fields (int): Maximum number of non-file fields.
+        max_files (int): Maximum number of uploaded files.
+        spool_max_size (int): Size in bytes above which uploaded files are
+            rolled over from memory to a temporary file on disk.
+    """
+
+    max_field_size: int = 1024 * 1024
+    max_file_size: int = 100 * 1024 * 1024
+    max_total_size: int = 128 * 1024 * 1024
+    max_fields: int = 1000
+    max_files: int = 1000
+    spool_max_size: int = 1024 * 1024
+
+
+class _FormState:
+    def __init__(self, limits: FormLimits, charset: str = "utf-8") -> None:
+        self.limits = limits
+        self.charset = charset
+        self.completed: list[FormItem] = []
+        self.pending_writes: list[tuple[UploadFile, bytes]] = []
+        self.files: list[UploadFile] = []
+        self.fields_count = 0
+        self.files_count = 0
+
+        self.name = b""
+        self.data = bytearray()
+        self.size = 0
+        self.file: UploadFile | None = None
+        self.header_field = b""
+        self.header_value = b""
+        self.headers: list[tuple[bytes, bytes]] = []
+
+    def decode(self, value: bytes | bytearray) -> str:
+        try:
+            return value.decode(self.charset)
+        except UnicodeDecodeError:
+            return value.decode("latin-1")
+
+    def add_field_data(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.limits.max_field_size:
+            raise BadRequestError(
+                f"Form field exceeded maximum size of {self.limits.max_field_size} "
+                "bytes."
+            )
+        self.data.extend(chunk)
+
+    def count_field(self) -> None:
+        self.fields_count += 1
+        if self.fields_count > self.limits.max_fields:
+            raise BadRequestError(
+                f"Too many form fields, maximum is {self.limits.max_fields}."
+            )
+
+    # Urlencoded callbacks
+
+    def on_field_start(self) -> None:
+        self.name, self.data, self.size = b"", bytearray(), 0
+
+    def on_field_name(self, data: bytes, start: int, end: int) -> None:
+        self.name += data[start:end]
+
+    def on_field_data(self, data: bytes, start: int, end: int) -> None:
+        self.add_field_data(data[start:end])
+
+    def on_field_end(self) -> None:
+        self.count_field()
+        self.completed.append(
+            (
+                unquote_plus(self.name.decode("latin-1")),
+                unquote_plus(self.data.decode("latin-1")),
+            )
+        )
+
+    # Multipart callbacks
+
+    def on_part_begin(self) -> None:
+        self.name, self.data, self.size = b"", bytearray(), 0
+        self.file = None
+        self.headers = []
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self.header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self.headers.append((self.header_field.lower(), self.header_value))
+        self.header_field, self.header_value = b"", b""
+
+    def on_headers_finished(self) -> None:
+        disposition = dict(self.headers).get(b"content-disposition", b"")
+        _, options = parse_options_header(disposition)
+        if b"name" not in options:
+            raise BadRequestError(
+                'The Content-Disposition header field "name" must be provided.'
+            )
+        self.name = options[b"name"]
+
+        if b"filename" in options:
+            self.files_count += 1
+            if self.files_count > self.limits.max_files:
+                raise BadRequestError(
+                    f"Too many files, maximum is {self.limits.max_files}."
+                )
+            self.file = UploadFile(
+                file=SpooledTemporaryFile(max_size=self.limits.spool_max_size),  # type: ignore[arg-type]
+                size=0,
+                filename=self.decode(options[b"filename"]),
+                headers=Headers(raw=self.headers),
+            )
+            self.files.append(self.file)
+        else:
+            self.count_field()
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        if self.file is None:
+            self.add_field_data(chunk)
+            return
+
+        self.size += len(chunk)
+        if self.size > self.limits.max_file_size:
+            raise BadRequestError(
+                f"Uploaded file exceeded maximum size of {self.limits.max_file_size} "
+                "bytes."
+            )
+        self.pending_writes.append((self.file, chunk))
+
+    def on_part_end(self) -> None:
+        value: str | UploadFile = self.file or self.decode(self.data)
+        self.completed.append((self.decode(self.name), value))
+
+
+class FormStream:
+    """Form data parsed incrementally while the request body is received.
+
+    Unlike :meth:`Request.form`, the stream does not buffer the whole form.
+    Each field is yielded as soon as it has been fully received, uploaded files
+    are spooled to temporary files once they exceed
+    :attr:`FormLimits.spool_max_size`, and the :class:`FormLimits` are enforced
+    while reading.
+
+    Usage:
+
+        async for key, value in FormStream(request):
+            ...
+
+    Args:
+        request (Request): The request to read the form from.
+        limits (FormLimits | None): The limits to enforce.
+    """
+
+    def __init__(self, request: Request, limits: FormLimits | None = None) -> None:
+        self.request = request
+        self.limits = limits or FormLimits()
+        self._files: list[UploadFile] = []
+
+    async def __aiter__(self) -> AsyncIterator[FormItem]:
+        if multipart is None:
+            raise RuntimeError(
+                "The python-multipart library must be installed to stream forms. "
+                "You can also use the 'pip install \"ludic[full]\"' command."
+            )
+
+        content_type, params = parse_options_header(
+            self.request.headers.get("Content-Type", "")
+        )
+        if (created := self._create_parser(content_type, params)) is None:
+            return
+        state, parser = created
+
+        self._files = state.files
+        content_length = self.request.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > (
+            self.limits.max_total_size
+        ):
+            raise self._total_size_exceeded()
+
+        total_size = 0
+        try:
+            async for chunk in self.request.stream():
+                total_size += len(chunk)
+                if total_size > self.limits.max_total_size:
+                    raise self._total_size_exceeded()
+
+                parser.write(chunk)
+                async for item in self._drain(state):
+                    yield item
+
+            parser.finalize()
+            async for item in self._drain(state):
+                yield item
+        except BadRequestError:
+            await self.aclose()
+            raise
+        except ValueError as exc:
+            # python-multipart parser errors are subclasses of ValueError
+            await self.aclose()
+            raise BadRequestError("Invalid form data.") from exc
+
+    async def aclose(self) -> None:
+        """Close all files uploaded while streaming the form."""
+        for file in self._files:
+            await file.close()
+        self._files = []
+
+    def _create_parser(
+        self, content_type: bytes, params: dict[bytes, bytes]
+    ) -> tuple[_FormState, Any] | None:
+        charset = params.get(b"charset", b"utf-8").decode("latin-1")
+        try:
+            charset = codecs.lookup(charset).name
+        except LookupError:
+            charset = "latin-1"
+        state = _FormState(self.limits, charset=charset)
+
+        if content_type == b"multipart/form-data":
+            if b"boundary" not in params:
+                raise BadRequestError("Missing boundary in multipart.")
+            return state, multipart.MultipartParser(
+                params[b"boundary"],
+                {
+                    "on_part_begin": state.on_part_begin,
+                    "on_part_data": state.on_part_data,
+                    "on_part_end": state.on_part_end,
+                    "on_header_field": state.on_header_field,
+                    "on_header_value": state.on_header_value,
+                    "on_header_end": state.on_header_end,
+                    "on_headers_finished": state.on_headers_finished,
+                },
+            )
+        elif content_type == b"application/x-www-form-urlencoded":
+            return state, multipart.QuerystringParser(
+                {
+                    "on_field_start": state.on_field_start,
+                    "on_field_name": state.on_field_name,
+                    "on_field_data": state.on_field_data,
+                    "on_field_end": state.on_field_end,
+                }
+            )
+        return None
+
+    def _total_size_exceeded(self) -> BadRequestError:
+        return BadRequestError(
+            f"Request body exceeded maximum size of {self.limits.max_total_size} bytes."
+        )
+
+    async def _drain(self, state: _FormState) -> AsyncIterator[FormItem]:
+        # File data is written here instead of the parser callbacks, since
+        # UploadFile writes a rolled over spooled file in a thread pool.
+        for file, data in state.pending_writes:
+            await file.write(data)
+        state.pending_writes.clear()
+
+        for key, value in state.completed:
+            if isinstance(value, UploadFile):
+                await value.seek(0)
+            yield key, value
+        state.completed.clear()
@@ -0,0 +1,76 @@
+import copy
+from collections.abc import Iterator
+
+from ludic.base import BaseElement
+from ludic.components import BaseComponent
+from ludic.format import format_element
+
+
+class Oob(BaseElement):
+    """Element swapped out of band by htmx.
+
+    The ``hx-swap-oob`` attribute is added to the root of the rendered element,
+    so it can be used with components as well.
+
+    Usage:
+
+        Oob(Counter(count=10))
+        Oob(Toast("Saved"), swap="afterbegin:#messages")
+
+    Args:
+        element (BaseElement): The element to swap.
+        swap (str): The value of the ``hx-swap-oob`` attribute.
+    """
+
+    def __init__(self, element: BaseElement, swap: str = "true") -> None:
+        super().__init__(element, swap=swap)
+
+    def to_html(self) -> str:
+        element = self.children[0]
+        if self.context:
+            element.context.update(self.context)
+
+        dom = element.render_dom() if isinstance(element, BaseComponent) else element
+        # The element can also be rendered elsewhere, so it is not modified.
+        dom = copy.copy(dom)
+        dom.attrs = {**dom.attrs, "hx_swap_oob": self.attrs["swap"]}
+        return dom.to_html()
+
+
+class Fragments(BaseElement):
+    """Several fragments sent to htmx in one response.
+
+    The fragments are rendered one by one and the response is streamed while
+    they are being rendered. Fragments wrapped in :class:`Oob` are swapped out
+    of band, the rest is swapped into the target of the request as usual.
+
+    Usage:
+
+        @app.delete("/people/{id}")
+        def delete_person(id: str) -> Fragments:
+            db.people.pop(id)
+            return Fragments(
+                Oob(PeopleCounter(count=len(db.people))),
+                Oob(Toast("Person deleted"), swap="afterbegin:#messages"),
+            )
+
+    Args:
+        *fragments (BaseElement | Oob): The fragments to render.
+    """
+
+    def __init__(self, *fragments: BaseElement) -> None:
+        super().__init__(*fragments)
+
+    def iter_html(self) -> Iterator[str]:
+        """Render the fragments one by one.
+
+        Yields:
+            str: The HTML of one fragment.
+        """
+        for child in self.children:
+            if self.context and isinstance(child, BaseElement):
+                child.context.update(self.context)
+            yield format_element(child)
+
+    def to_html(self) -> str:
+        return "".join(self.iter_html())
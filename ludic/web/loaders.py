@@ -0,0 +1,223 @@
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping, Sequence
+from typing import Any, Generic, TypeVar, cast
+
+import anyio
+from anyio.lowlevel import checkpoint
+from starlette._utils import is_async_callable
+
+from .responses import run_in_threadpool_safe
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFunction = Callable[
+    [list[K]], Awaitable[Sequence[V] | Mapping[K, V]] | Sequence[V] | Mapping[K, V]
+]
+
+
+class _Entry(Generic[V]):
+    def __init__(self) -> None:
+        self.done = False
+        self.value: V | None = None
+        self.error: BaseException | None = None
+        self._event: anyio.Event | None = None
+
+    def resolve(self, value: V) -> None:
+        self.value = value
+        self._set_done()
+
+    def reject(self, error: BaseException) -> None:
+        self.error = error
+        self._set_done()
+
+    def _set_done(self) -> None:
+        self.done = True
+        if self._event is not None:
+            self._event.set()
+
+    async def wait(self) -> V:
+        if not self.done:
+            if self._event is None:
+                self._event = anyio.Event()
+            await self._event.wait()
+        if self.error is not None:
+            raise self.error
+        return cast(V, self.value)
+
+
+class DataLoader(Generic[K, V]):
+    """Batching and caching loader for data accessed while handling a request.
+
+    All keys requested during one scheduling round (e.g. from coroutines run
+    with ``asyncio.gather``) are coalesced into a single call of the batch
+    function. Results are memoized for the lifetime of the loader, which is
+    usually one request, see :meth:`ludic.web.requests.Request.loader`.
+
+    The batch function receives a list of unique keys and returns either
+    a sequence of values in the same order or a mapping of keys to values.
+    It can be synchronous (it is then run in a thread pool) or asynchronous.
+
+    Usage:
+
+        async def load_people(ids: list[str]) -> dict[str, Person]:
+            return {person.id: person for person in await db.people(ids)}
+
+        @app.get("/people")
+        async def people(request: Request, ids: QueryParams) -> PeopleTable:
+            loader = request.loader(load_people)
+            rows = await loader.load_many(ids.getlist("id"))
+            return PeopleTable(*rows)
+
+    Args:
+        batch_fn (BatchFunction): The function loading a batch of keys.
+        max_batch_size (int | None): Maximum number of keys passed to one call
+            of the batch function.
+    """
+
+    def __init__(
+        self, batch_fn: BatchFunction[K, V], max_batch_size: int | None = None
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._cache: dict[K, _Entry[V]] = {}
+        self._queue: list[K] | None = None
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._cache.get(key)
+        return entry is not None and entry.done and entry.error is None
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get an already loaded value without scheduling a batch.
+
+        This is useful in synchronous code like the ``render`` method of
+        components, which cannot await :meth:`load`.
+
+        Args:
+            key (K): The key to look up.
+            default (V | None): The value returned if the key is not loaded.
+
+        Returns:
+            V | None: The loaded value or the default.
+        """
+        return self._cache[key].value if key in self else default
+
+    def prime(self, key: K, value: V) -> None:
+        """Store a value in the cache, unless the key is already loaded.
+
+        Args:
+            key (K): The key to store.
+            value (V): The value to store.
+        """
+        if key not in self._cache:
+            entry: _Entry[V] = _Entry()
+            entry.resolve(value)
+            self._cache[key] = entry
+
+    def clear(self, key: K | None = None) -> None:
+        """Remove one key or all keys from the cache.
+
+        Args:
+            key (K | None): The key to remove, all keys are removed if not given.
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    async def load(self, key: K) -> V:
+        """Load a value, batching the key with other concurrently loaded keys.
+
+        Args:
+            key (K): The key to load.
+
+        Returns:
+            V: The loaded value.
+
+        Raises:
+            KeyError: If the batch function returned a mapping without the key.
+        """
+        if (entry := self._cache.get(key)) is not None:
+            return await entry.wait()
+
+        entry = self._cache[key] = _Entry()
+        if self._queue is not None:
+            self._queue.append(key)
+        else:
+            # The first caller collects keys requested by other tasks until
+            # they are blocked and then dispatches the batch on their behalf.
+            self._queue = queue = [key]
+            try:
+                await checkpoint()
+            except BaseException as exc:
+                self._queue = None
+                self._reject(
+                    {key: entry for key in queue if (entry := self._cache.get(key))},
+                    exc,
+                )
+                raise
+            self._queue = None
+            await self._dispatch(queue)
+
+        return await entry.wait()
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        """Load several values in a single batch.
+
+        Args:
+            keys (Iterable[K]): The keys to load.
+
+        Returns:
+            list[V]: The loaded values in the order of the keys.
+        """
+        keys = list(keys)
+        missing = list(dict.fromkeys(key for key in keys if key not in self._cache))
+        for key in missing:
+            self._cache[key] = _Entry()
+        if missing:
+            await self._dispatch(missing)
+        return [await self._cache[key].wait() for key in keys]
+
+    async def _dispatch(self, keys: list[K]) -> None:
+        entries = {key: self._cache[key] for key in keys}
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            batch = keys[start : start + size]
+            try:
+                if is_async_callable(self.batch_fn):
+                    result = await self.batch_fn(batch)  # type: ignore[misc]
+                else:
+                    result = await run_in_threadpool_safe(self.batch_fn, batch)
+                values = self._match_values(batch, cast(Any, result))
+            except BaseException as exc:
+                self._reject({key: entries[key] for key in keys[start:]}, exc)
+                raise
+
+            for key, value in zip(batch, values, strict=True):
+                if isinstance(value, BaseException):
+                    self._reject({key: entries[key]}, value)
+                else:
+                    entries[key].resolve(value)
+
+    def _reject(self, entries: Mapping[K, _Entry[V]], exc: BaseException) -> None:
+        # Failed keys are not memoized, so they can be loaded again later.
+        if not isinstance(exc, Exception):
+            exc = RuntimeError(f"Loading of {list(entries)!r} was cancelled.")
+        for key, entry in entries.items():
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+            entry.reject(exc)
+
+    def _match_values(
+        self, keys: list[K], result: Sequence[V] | Mapping[K, V]
+    ) -> list[V | BaseException]:
+        if isinstance(result, Mapping):
+            return [
+                result[key] if key in result else KeyError(key)  # type: ignore[misc]
+                for key in keys
+            ]
+        if len(result) != len(keys):
+            raise ValueError(
+                f"The batch function {self.batch_fn!r} returned {len(result)} "
+                f"values for {len(keys)} keys."
+            )
+        return list(result)
@@ -1,7 +1,16 @@
 import warnings
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable
-from typing import Any, Generic, Protocol, TypeVar, get_args, get_type_hints, override
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Protocol,
+    TypeVar,
+    get_args,
+    get_type_hints,
+    override,
+)
 
 from starlette.datastructures import FormData
 
@@ -9,6 +18,7 @@ from ludic.types import TAttrs
 from ludic.utils import get_annotations_metadata_of_type
 
 from .exceptions import BadRequestError
+from .forms import FormItem, FormLimits, FormStream
 
 T = TypeVar("T")
 
@@ -48,7 +58,12 @@ class ValidationError(BadRequestError):
 
 
 class BaseParser(Generic[TAttrs], metaclass=ABCMeta):
+    limits: ClassVar[FormLimits] = FormLimits()
+
     _form_data: FormData
+    _form_stream: FormStream | None = None
+    _parsed: Any = None
+    _parse_error: ValidationError | None = None
     _parsers: Parsers
     _spec: type[TAttrs]
 
@@ -68,11 +83,72 @@ class BaseParser(Generic[TAttrs], metaclass=ABCMeta):
             self._load_meta()
         return self._spec
 
-    def __init__(self, data: FormData, spec: type[TAttrs] | None = None) -> None:
-        self._form_data = data
+    def __init__(
+        self, data: FormData | FormStream, spec: type[TAttrs] | None = None
+    ) -> None:
+        if isinstance(data, FormStream):
+            self._form_data = FormData()
+            self._form_stream = data
+        else:
+            self._form_data = data
         if spec is not None:
             self._spec = spec
 
+    async def load(self) -> None:
+        """Consume the form stream the parser was created with.
+
+        Parsers created from a :class:`FormData` instance do not need to be
+        loaded. The streamed fields are also kept in :attr:`form_data`, so the
+        values of all non-file fields stay in memory, bounded by the parser's
+        :attr:`limits`, while uploaded files are spooled to disk. Subclasses
+        can override :meth:`_parse_stream` to convert the fields as they
+        arrive. To process large forms item by item without keeping them,
+        iterate a :class:`FormStream` in the handler instead.
+
+        Uploaded files stay open until :meth:`aclose` is awaited, which
+        happens when the handler returns or raises when the parser is a
+        handler parameter.
+
+        Raises:
+            BadRequestError: If the form exceeds the parser's :attr:`limits`.
+        """
+        if self._form_stream is None:
+            return
+
+        items: list[FormItem] = []
+
+        async def collect(stream: FormStream) -> AsyncIterator[FormItem]:
+            async for item in stream:
+                items.append(item)
+                yield item
+
+        try:
+            self._parsed = await self._parse_stream(collect(self._form_stream))
+        except ValidationError as err:
+            # Conversion errors are raised once the handler parses the data.
+            self._parse_error = err
+        finally:
+            self._form_data = FormData(items)
+
+    async def aclose(self) -> None:
+        """Close the files uploaded while loading the form stream."""
+        if self._form_stream is not None:
+            await self._form_stream.aclose()
+            self._form_stream = None
+
+    async def _parse_stream(self, stream: AsyncIterable[FormItem]) -> Any:
+        async for _ in stream:
+            pass
+        return None
+
+    def _parse_value(self, key: str, value: Any) -> Any:
+        try:
+            return self.parsers[key](value)
+        except Exception as e:
+            raise ValidationError(
+                f"Could not parse value {value!r} with parser {self.parsers[key]!r}."
+            ) from e
+
     def _load_meta(self) -> None:
         # This method cannot be part of __init__ as the __orig_class__
         # is not present at that time.
@@ -120,7 +196,9 @@ class Parser(BaseParser[TAttrs]):
             return form(...)
 
     Args:
-        data (FormData): Form data to be parsed and validated.
+        data (FormData | FormStream): Form data to be parsed and validated. When
+            a :class:`FormStream` is given, the fields are converted as they
+            arrive once :meth:`load` is awaited.
 
     Raises:
         TypeError: The class can raise a TypeError when it was not passible
@@ -139,18 +217,27 @@ class Parser(BaseParser[TAttrs]):
         Returns:
             dict[str, Any]: The parsed attributes.
         """
-        result = {}
+        if self._parse_error is not None:
+            raise self._parse_error
+        if self._parsed is not None:
+            return dict(self._parsed)
+
+        result: dict[str, Any] = {}
         for key, value in self.form_data.items():
-            if key in self.parsers:
-                try:
-                    result[key] = self.parsers[key](value)
-                except Exception as e:
-                    raise ValidationError(
-                        f"Could not parse value {value!r} with parser "
-                        f"{self.parsers[key]!r}."
-                    ) from e
+            self._parse_item(result, key, value)
         return result
 
+    @override
+    async def _parse_stream(self, stream: AsyncIterable[FormItem]) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        async for key, value in stream:
+            self._parse_item(result, key, value)
+        return result
+
+    def _parse_item(self, result: dict[str, Any], key: str, value: Any) -> None:
+        if key in self.parsers:
+            result[key] = self._parse_value(key, value)
+
     @override
     def validate(self) -> TAttrs:
         """Parse, validate and return attributes.
@@ -176,32 +263,45 @@ class ListParser(BaseParser[TAttrs]):
         Returns:
             list[dict[str, Any]]: The parsed attributes.
         """
+        if self._parse_error is not None:
+            raise self._parse_error
+        if self._parsed is not None:
+            return list(self._parsed.values())
+
         result: dict[str, dict[str, Any]] = {}
         for compound_key, value in self.form_data.items():
-            try:
-                key, id_name, id_value = compound_key.split(":", 2)
-            except ValueError:
-                raise ValidationError(
-                    "All keys in a list must contain a unique identifier."
-                )
-            if key not in self.parsers:
-                continue
-
-            result.setdefault(
-                id_value,
-                {id_name: self.parsers.get(id_name, str)(id_value)}
-                if not id_name.startswith("_")
-                else {},
-            )
-            try:
-                result[id_value][key] = self.parsers[key](value)
-            except Exception as e:
-                raise ValidationError(
-                    f"Could not parse value {value!r} with parser "
-                    f"{self.parsers[key]!r}."
-                ) from e
+            self._parse_item(result, compound_key, value)
         return list(result.values())
 
+    @override
+    async def _parse_stream(
+        self, stream: AsyncIterable[FormItem]
+    ) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        async for compound_key, value in stream:
+            self._parse_item(result, compound_key, value)
+        return result
+
+    def _parse_item(
+        self, result: dict[str, dict[str, Any]], compound_key: str, value: Any
+    ) -> None:
+        try:
+            key, id_name, id_value = compound_key.split(":", 2)
+        except ValueError:
+            raise ValidationError(
+                "All keys in a list must contain a unique identifier."
+            )
+        if key not in self.parsers:
+            return
+
+        result.setdefault(
+            id_value,
+            {id_name: self.parsers.get(id_name, str)(id_value)}
+            if not id_name.startswith("_")
+            else {},
+        )
+        result[id_value][key] = self._parse_value(key, value)
+
     @override
     def validate(self) -> list[TAttrs]:
         """Parse, validate and return attributes in a list.
@@ -0,0 +1,334 @@
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import threading
+import time
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, TypeVar
+
+from starlette.requests import Request
+
+from .exceptions import TooManyRequestsError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+KeyFunction = Callable[[Request], str]
+
+
+def client_address(request: Request) -> str:
+    """Key requests by the address of the client."""
+    return request.client.host if request.client else ""
+
+
+def header(name: str) -> KeyFunction:
+    """Key requests by the value of a request header, e.g. an API key.
+
+    Args:
+        name (str): The name of the header.
+    """
+
+    def key(request: Request) -> str:
+        return request.headers.get(name, "")
+
+    return key
+
+
+class RateLimitBackend(metaclass=ABCMeta):
+    """Storage of token buckets."""
+
+    @abstractmethod
+    def consume(self, key: str, rate: float, burst: float, now: float) -> float:
+        """Take one token from a bucket.
+
+        Args:
+            key (str): The key of the bucket.
+            rate (float): The number of tokens added per second.
+            burst (float): The capacity of the bucket.
+            now (float): The current time in seconds.
+
+        Returns:
+            float: Zero if the token was taken, otherwise the number of seconds
+                until a token is available.
+        """
+
+
+def _take(
+    tokens: float, updated: float, rate: float, burst: float, now: float
+) -> tuple[float, float]:
+    tokens = min(burst, tokens + (now - updated) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBuckets(RateLimitBackend):
+    """In-process token buckets split into independently locked shards.
+
+    Keys whose buckets have been idle long enough to refill completely carry
+    no information and are evicted. One shard is swept every
+    ``eviction_interval`` seconds, so the cost is spread over the requests.
+
+    Args:
+        shards (int): The number of shards.
+        eviction_interval (float): Seconds between sweeps of a shard.
+    """
+
+    def __init__(self, shards: int = 16, eviction_interval: float = 10.0) -> None:
+        self.eviction_interval = eviction_interval
+        self._shards: list[dict[str, tuple[float, float, float]]] = [
+            {} for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._next_sweep = 0
+        self._next_sweep_at = time.monotonic() + eviction_interval
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def consume(self, key: str, rate: float, burst: float, now: float) -> float:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            shard = self._shards[index]
+            tokens, updated, _ = shard.get(key, (burst, now, 0))
+            tokens, wait = _take(tokens, updated, rate, burst, now)
+            # The time when the bucket is full again, after that it is idle.
+            shard[key] = (tokens, now, now + (burst - tokens) / rate)
+
+        if now >= self._next_sweep_at:
+            self._next_sweep_at = now + self.eviction_interval
+            self._next_sweep = (self._next_sweep + 1) % len(self._shards)
+            self.evict(self._next_sweep, now)
+        return wait
+
+    def evict(self, index: int, now: float) -> None:
+        """Remove idle keys from a shard.
+
+        Args:
+            index (int): The index of the shard.
+            now (float): The current time in seconds.
+        """
+        with self._locks[index]:
+            shard = self._shards[index]
+            for key in [
+                key for key, (_, _, full_at) in shard.items() if full_at <= now
+            ]:
+                del shard[key]
+
+
+class SharedMemoryBuckets(RateLimitBackend):
+    """Token buckets in shared memory, shared by all workers of one host.
+
+    Buckets are stored in a fixed-size open addressing table in a named
+    shared memory block, which is created by the first worker and attached
+    to by the others. When all slots probed for a new key are taken, the
+    least recently updated one is reused. Access is serialized with a file
+    lock, so the backend is only available on POSIX systems.
+
+    All workers have to use the same ``name`` and ``slots``, and they have to
+    use the wall clock as the time, since the monotonic clock is not shared.
+
+    Args:
+        name (str): The name of the shared memory block.
+        slots (int): The number of buckets the table can hold.
+        probes (int): The number of slots probed for a key.
+        lock_path (str | Path | None): The lock file, defaults to a file named
+            after the block and the current user in the temporary directory.
+    """
+
+    _slot = struct.Struct("<Qdd")
+
+    def __init__(
+        self,
+        name: str = "ludic-rate-limit",
+        slots: int = 65536,
+        probes: int = 8,
+        lock_path: str | Path | None = None,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryBuckets require a POSIX system.")
+
+        self.slots = slots
+        self.probes = probes
+        size = slots * self._slot.size
+        # The block outlives single workers, so it is not tracked by them.
+        try:
+            self._memory = shared_memory.SharedMemory(
+                name, create=True, size=size, track=False
+            )
+        except FileExistsError:
+            self._memory = shared_memory.SharedMemory(name, track=False)
+        self._lock_path = Path(
+            lock_path or Path(tempfile.gettempdir()) / f"{name}-{os.getuid()}.lock"
+        )
+        # Refuse to follow a symlink planted in place of the lock file.
+        self._lock_file = os.fdopen(
+            os.open(self._lock_path, os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600),
+            "a",
+        )
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._lock_file.close()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block, call once for all workers."""
+        self._memory.unlink()
+        self._lock_path.unlink(missing_ok=True)
+
+    def consume(self, key: str, rate: float, burst: float, now: float) -> float:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        key_hash = int.from_bytes(digest, "little") or 1
+        buffer = self._memory.buf
+        assert buffer is not None
+
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            slot, tokens, updated = self._find(buffer, key_hash, burst, now)
+            tokens, wait = _take(tokens, updated, rate, burst, now)
+            self._slot.pack_into(buffer, slot * self._slot.size, key_hash, tokens, now)
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        return wait
+
+    def _find(
+        self, buffer: memoryview, key_hash: int, burst: float, now: float
+    ) -> tuple[int, float, float]:
+        oldest, oldest_updated = 0, math.inf
+        for probe in range(self.probes):
+            slot = (key_hash + probe) % self.slots
+            stored_hash, tokens, updated = self._slot.unpack_from(
+                buffer, slot * self._slot.size
+            )
+            if stored_hash == key_hash:
+                return slot, tokens, updated
+            if stored_hash == 0:
+                return slot, burst, now
+            if updated < oldest_updated:
+                oldest, oldest_updated = slot, updated
+        return oldest, burst, now
+
+
+# Rate limit backends of applications other than LudicApp, e.g. a plain
+# Starlette application mounting Ludic routes.
+_RATE_LIMIT_BACKENDS: weakref.WeakKeyDictionary[Any, RateLimitBackend] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rate_limit_backend(app: Any) -> RateLimitBackend:
+    """Get the rate limit backend of an application."""
+    backend = getattr(app, "rate_limit_backend", None)
+    if isinstance(backend, RateLimitBackend):
+        return backend
+    if app is None:
+        return MemoryBuckets()
+    if (backend := _RATE_LIMIT_BACKENDS.get(app)) is None:
+        backend = _RATE_LIMIT_BACKENDS[app] = MemoryBuckets()
+    return backend
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate limit of a handler, see :func:`rate_limit`."""
+
+    rate: float
+    burst: float = 1
+    key: KeyFunction = client_address
+    backend: RateLimitBackend | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("The rate must be greater than zero.")
+        if self.burst < 1:
+            raise ValueError("The burst must be at least one.")
+
+    def check(self, name: str, request: Request) -> None:
+        """Take a token for the request from its bucket.
+
+        Args:
+            name (str): The name of the route.
+            request (Request): The current request.
+
+        Raises:
+            TooManyRequestsError: If the bucket is empty.
+        """
+        backend = self.backend or get_rate_limit_backend(request.scope.get("app"))
+        now = (
+            time.time()
+            if isinstance(backend, SharedMemoryBuckets)
+            else time.monotonic()
+        )
+        wait = backend.consume(
+            f"{name}:{self.key(request)}", self.rate, self.burst, now
+        )
+        if wait > 0:
+            raise TooManyRequestsError(headers={"Retry-After": str(math.ceil(wait))})
+
+
+def rate_limit(
+    rate: float,
+    burst: float | None = None,
+    key: KeyFunction = client_address,
+    backend: RateLimitBackend | None = None,
+) -> Callable[[T], T]:
+    """Limit how often clients can call a handler or an endpoint.
+
+    Each client has a token bucket per route holding up to ``burst`` tokens
+    and refilled with ``rate`` tokens per second. A request takes one token,
+    when the bucket is empty, :class:`TooManyRequestsError` with the
+    ``Retry-After`` header is raised.
+
+    Example:
+
+        @app.get("/search")
+        @rate_limit(rate=2, burst=5)
+        async def search(q: str | None) -> SearchResults:
+            ...
+
+        @app.endpoint("/api/items/{id}")
+        @rate_limit(rate=10, key=header("X-API-Key"))
+        class Item(Endpoint[ItemAttrs]):
+            ...
+
+    Args:
+        rate (float): The number of requests per second allowed on average.
+        burst (float | None): The number of requests allowed at once, defaults
+            to the rate rounded up.
+        key (KeyFunction): Function returning the client's key for a request,
+            defaults to the client's address.
+        backend (RateLimitBackend | None): Where to store the buckets, defaults
+            to the in-process memory of the application.
+
+    Raises:
+        ValueError: If the rate is not positive or the burst is below one.
+    """
+    limit = RateLimit(
+        rate=rate,
+        burst=burst if burst is not None else max(1, math.ceil(rate)),
+        key=key,
+        backend=backend,
+    )
+
+    def decorator(handler: T) -> T:
+        handler.__ludic_rate_limit__ = limit  # type: ignore[attr-defined]
+        return handler
+
+    return decorator
+
+
+def get_rate_limit(handler: Any) -> RateLimit | None:
+    """Get the rate limit of a handler, an endpoint method or an endpoint."""
+    return getattr(handler, "__ludic_rate_limit__", None)
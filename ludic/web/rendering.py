@@ -0,0 +1,202 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal, ParamSpec, TypeVar
+
+import anyio
+import anyio.to_process
+import anyio.to_thread
+from starlette.requests import Request
+
+from ludic.base import BaseElement
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+RenderMode = Literal["inline", "thread", "process", "auto"]
+
+# Context keys which cannot be pickled and are not sent to worker processes.
+UNPICKLABLE_CONTEXT_KEYS = ("request",)
+
+
+def count_elements(element: BaseElement, limit: int) -> int:
+    """Count elements of a tree without rendering it.
+
+    Components are counted together with their children, but the elements
+    they render are not, since that would require rendering them. The
+    counting stops once the ``limit`` is reached.
+
+    Args:
+        element (BaseElement): The root of the tree.
+        limit (int): The maximum number to count to.
+
+    Returns:
+        int: The number of elements, at most ``limit``.
+    """
+    count = 0
+    stack: list[Any] = [element]
+    while stack and count < limit:
+        node = stack.pop()
+        if isinstance(node, BaseElement):
+            count += 1
+            stack.extend(node.children)
+    return min(count, limit)
+
+
+def _render(element: BaseElement) -> str:
+    return element.to_html()
+
+
+@dataclass
+class RenderPolicy:
+    """Where the HTML of an element returned by a handler is rendered.
+
+    Rendering is synchronous, so large pages rendered on the event loop block
+    all other requests handled by the worker. The policy moves rendering to a
+    thread pool or a process pool:
+
+    * ``inline`` renders on the event loop, the cheapest for small fragments,
+    * ``thread`` renders in a thread pool,
+    * ``process`` renders in a process pool, the element is pickled and the
+      request is not available in its context,
+    * ``auto`` picks one of the above based on the number of elements in the
+      tree, see :func:`count_elements`.
+
+    The policy can be set for the whole application, a route or an endpoint:
+
+        app = LudicApp(render_policy=RenderPolicy("auto"))
+
+        @app.get("/report", render_policy=RenderPolicy("thread", max_concurrency=4))
+        async def report() -> Report:
+            ...
+
+        class Dashboard(Endpoint[DashboardAttrs]):
+            render_policy = RenderPolicy("process")
+
+    Each policy with ``max_concurrency`` has its own limiter used for both
+    rendering and running synchronous handlers, so a slow route cannot
+    exhaust the limiter shared by all the other routes.
+
+    Args:
+        mode (RenderMode): Where to render the elements.
+        thread_threshold (int): Number of elements from which the ``auto``
+            mode renders in a thread pool.
+        process_threshold (int | None): Number of elements from which the
+            ``auto`` mode renders in a process pool, None disables it.
+        max_concurrency (int | None): Maximum number of concurrently rendered
+            elements or running synchronous handlers using this policy, None
+            uses the anyio default limiters.
+    """
+
+    mode: RenderMode = "inline"
+    thread_threshold: int = 1000
+    process_threshold: int | None = None
+    max_concurrency: int | None = None
+    _limiter: anyio.CapacityLimiter | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter | None:
+        """The limiter of the policy, created on first use."""
+        if self.max_concurrency is not None and self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_concurrency)
+        return self._limiter
+
+    def choose_mode(
+        self, element: BaseElement
+    ) -> Literal["inline", "thread", "process"]:
+        """Decide where to render the given element.
+
+        Args:
+            element (BaseElement): The element to render.
+
+        Returns:
+            str: One of ``inline``, ``thread`` or ``process``.
+        """
+        if self.mode != "auto":
+            return self.mode
+
+        limit = max(self.thread_threshold, self.process_threshold or 0)
+        size = count_elements(element, limit)
+        if self.process_threshold is not None and size >= self.process_threshold:
+            return "process"
+        elif size >= self.thread_threshold:
+            return "thread"
+        return "inline"
+
+    async def run_sync(
+        self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a synchronous function in a thread pool using the policy's limiter.
+
+        Args:
+            func: The function to run.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The return value of the function.
+        """
+        return await anyio.to_thread.run_sync(
+            lambda: func(*args, **kwargs), limiter=self.limiter
+        )
+
+    async def render(self, element: BaseElement) -> str:
+        """Render an element to HTML according to the policy.
+
+        Args:
+            element (BaseElement): The element to render.
+
+        Returns:
+            str: The rendered HTML.
+        """
+        match self.choose_mode(element):
+            case "thread":
+                return await self.run_sync(_render, element)
+            case "process":
+                return await self._render_in_process(element)
+            case _:
+                return _render(element)
+
+    async def _render_in_process(self, element: BaseElement) -> str:
+        context = element.context
+        element.context = {
+            key: value
+            for key, value in context.items()
+            if key not in UNPICKLABLE_CONTEXT_KEYS
+        }
+        try:
+            return await anyio.to_process.run_sync(
+                _render, element, limiter=self.limiter
+            )
+        finally:
+            element.context = context
+
+
+DEFAULT_RENDER_POLICY = RenderPolicy()
+
+
+def get_render_policy(
+    handler: Callable[..., Any],
+    request: Request,
+    policy: RenderPolicy | None = None,
+) -> RenderPolicy:
+    """Get the render policy of a handler.
+
+    The policy passed when registering the route takes precedence over the
+    ``render_policy`` attribute of an endpoint class, which takes precedence
+    over the option of the application.
+
+    Args:
+        handler: The handler to get the policy for.
+        request: The current request.
+        policy: The policy set for the route.
+
+    Returns:
+        RenderPolicy: The render policy.
+    """
+    if policy is None:
+        policy = getattr(getattr(handler, "__self__", None), "render_policy", None)
+    if policy is None:
+        policy = getattr(request.scope.get("app"), "render_policy", None)
+    return policy or DEFAULT_RENDER_POLICY
@@ -1,11 +1,17 @@
 import itertools
-from collections.abc import Callable
-from typing import Any
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
 
 import starlette
 from starlette.datastructures import URL, URLPath
 from starlette.routing import NoMatchFound, Route, Router
 
+from .loaders import BatchFunction, DataLoader
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 
 def join_mounts(prefix: str, suffix: str) -> str:
     """Join mount prefixes and suffixes.
@@ -25,6 +31,22 @@ def join_mounts(prefix: str, suffix: str) -> str:
 
 
 class Request(starlette.requests.Request):
+    @property
+    def deadline(self) -> float | None:
+        """The :func:`time.monotonic` time when the route's timeout expires."""
+        return self.scope.get("ludic.deadline")
+
+    @property
+    def time_remaining(self) -> float | None:
+        """Seconds left until the route's timeout expires, None without timeout.
+
+        Components can use it to render a cheaper variant of their content,
+        e.g. a lazy loader, when there is not enough time left.
+        """
+        if (deadline := self.deadline) is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
     def url_path_for(
         self, endpoint: str | Callable[..., Any], /, **path_params: Any
     ) -> URLPath:
@@ -71,3 +93,27 @@ class Request(starlette.requests.Request):
         """
         url_path = self.url_path_for(endpoint, **path_params)
         return url_path.make_absolute_url(base_url=self.base_url)
+
+    def loader(
+        self, batch_fn: BatchFunction[K, V], max_batch_size: int | None = None
+    ) -> DataLoader[K, V]:
+        """Get a request-scoped data loader for the given batch function.
+
+        The same loader instance is returned for the same batch function for the
+        whole lifetime of the request, so values are loaded at most once per
+        request and concurrent loads are coalesced into a single batch.
+
+        Args:
+            batch_fn: The function loading a batch of keys.
+            max_batch_size: Maximum number of keys passed to one call of the
+                batch function.
+
+        Returns:
+            The data loader.
+        """
+        loaders: dict[Any, DataLoader[Any, Any]] = self.scope.setdefault(
+            "ludic.loaders", {}
+        )
+        if batch_fn not in loaders:
+            loaders[batch_fn] = DataLoader(batch_fn, max_batch_size=max_batch_size)
+        return loaders[batch_fn]
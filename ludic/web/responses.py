@@ -1,11 +1,23 @@
 import inspect
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AsyncExitStack
 from types import NoneType, UnionType
-from typing import Any, ParamSpec, TypeVar, get_args, get_origin, get_type_hints
+from typing import (
+    Any,
+    Literal,
+    ParamSpec,
+    TypeVar,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from starlette._utils import is_async_callable
+from starlette.background import BackgroundTask, BackgroundTasks
 from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, Headers, QueryParams
+from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.responses import (
     FileResponse,
@@ -19,8 +31,12 @@ from starlette.responses import (
 from starlette.websockets import WebSocket
 
 from ludic.base import BaseElement
+from ludic.components import BaseComponent, reuse_rendered_components
 from ludic.web import datastructures as ds
+from ludic.web.forms import FormStream
+from ludic.web.fragments import Fragments
 from ludic.web.parsers import BaseParser
+from ludic.web.rendering import RenderPolicy, get_render_policy
 
 __all__ = (
     "LudicResponse",
@@ -69,11 +85,112 @@ def extract_response_status_headers[T](
     return raw_response, status_code, headers
 
 
+def extract_response_background[T](
+    raw_response: T,
+) -> tuple[T, BackgroundTask | None]:
+    """Extracts a background task from response if it is a tuple ending with one.
+
+    Example:
+
+        @app.post("/contacts")
+        async def create_contact(data: Parser[ContactAttrs]) -> ...:
+            contact = await db.create_contact(data.validate())
+            return ContactRow(**contact), 201, BackgroundTask(notify, contact)
+    """
+    if (
+        isinstance(raw_response, tuple)
+        and len(raw_response) >= 2
+        and isinstance(raw_response[-1], BackgroundTask)
+    ):
+        *rest, background = raw_response
+        return rest[0] if len(rest) == 1 else tuple(rest), background  # type: ignore[return-value]
+    return raw_response, None
+
+
+def attach_background(response: Response, *tasks: BackgroundTask | None) -> None:
+    """Run the given tasks after the response is sent.
+
+    Background tasks already attached to the response run first.
+    """
+    scheduled = [task for task in (response.background, *tasks) if task is not None]
+    if len(scheduled) == 1:
+        response.background = scheduled[0]
+    elif scheduled:
+        response.background = BackgroundTasks(scheduled)
+
+
+def get_partial_swap(
+    handler: Callable[..., Any], request: Request
+) -> Literal["innerHTML", "outerHTML"] | None:
+    """Get how the element targeted by htmx is swapped, if partially rendered.
+
+    The ``partial_rendering`` attribute of an endpoint class takes precedence
+    over the option of the application. ``True`` stands for ``"innerHTML"``,
+    the default swap style of htmx.
+    """
+    enabled = getattr(getattr(handler, "__self__", None), "partial_rendering", None)
+    if enabled is None:
+        enabled = getattr(request.scope.get("app"), "partial_rendering", False)
+    if not enabled or "HX-Request" not in request.headers:
+        return None
+    return "innerHTML" if enabled is True else enabled
+
+
+def iter_until_deadline(chunks: Iterator[str], deadline: float) -> Iterator[str]:
+    """Abort a streamed body with :class:`TimeoutError` at a deadline.
+
+    The status and headers are already sent, so instead of a
+    :class:`GatewayTimeoutError` response, the client sees an aborted one.
+    A chunk being rendered when the deadline expires is finished and sent,
+    no further chunk is rendered.
+
+    Args:
+        chunks (Iterator[str]): The streamed body.
+        deadline (float): The :func:`time.monotonic` time of the deadline.
+
+    Yields:
+        str: The chunks started before the deadline.
+    """
+    while time.monotonic() < deadline:
+        try:
+            yield next(chunks)
+        except StopIteration:
+            return
+    raise TimeoutError("Streamed response exceeded the route's timeout")
+
+
+def select_target(
+    element: BaseElement, target: str, swap: Literal["innerHTML", "outerHTML"]
+) -> BaseElement | None:
+    """Select the part of an element tree swapped into an htmx target.
+
+    Args:
+        element (BaseElement): The element tree.
+        target (str): The id of the target element.
+        swap (Literal["innerHTML", "outerHTML"]): How the target is swapped.
+
+    Returns:
+        BaseElement | None: The target element with ``"outerHTML"``, or its
+            children, or :obj:`None` if the tree has no such element.
+    """
+    if (found := element.get_element_by_id(target)) is None:
+        return None
+    if isinstance(found, BaseComponent):
+        found = found.render_dom()
+    if swap == "outerHTML":
+        return found
+
+    children = Fragments(*found.children)
+    children.context.update(found.context)
+    return children
+
+
 async def prepare_response(
     handler: Callable[..., Any],
     request: Request,
     status_code: int | None = None,
     headers: Headers | None = None,
+    render_policy: RenderPolicy | None = None,
 ) -> Response:
     """Prepares response for the given handler and request.
 
@@ -82,27 +199,55 @@ async def prepare_response(
         request: The request to prepare the response for.
         status_code: The status code to use for the response.
         headers: The headers to use for the response.
+        render_policy: The render policy of the route, see
+            :func:`ludic.web.rendering.get_render_policy`.
 
     Returns:
         The prepared response.
     """
-    handler_kw = await extract_from_request(handler, request)
     is_async = is_async_callable(handler)
+    policy = get_render_policy(handler, request, render_policy)
 
-    if is_async:
-        raw_response = await handler(**handler_kw)
-    else:
-        raw_response = await run_in_threadpool_safe(handler, **handler_kw)
+    # Parsers close their uploaded files once the handler returns or raises.
+    async with AsyncExitStack() as exit_stack:
+        handler_kw = await extract_from_request(handler, request, exit_stack)
+        if is_async:
+            raw_response = await handler(**handler_kw)
+        elif policy.limiter is not None:
+            raw_response = await policy.run_sync(handler, **handler_kw)
+        else:
+            raw_response = await run_in_threadpool_safe(handler, **handler_kw)
 
+    raw_response, background = extract_response_background(raw_response)
     raw_response, status_code, headers = extract_response_status_headers(
         raw_response, status_code, headers
     )
 
     response: Response
-    if isinstance(raw_response, BaseElement):
+    if isinstance(raw_response, Fragments):
         raw_response.context["request"] = request
+        chunks = raw_response.iter_html()
+        if (deadline := request.scope.get("ludic.deadline")) is not None:
+            chunks = iter_until_deadline(chunks, deadline)
+        response = StreamingResponse(
+            chunks,
+            status_code=status_code or 200,
+            headers=headers,
+            media_type=LudicResponse.media_type,
+        )
+    elif isinstance(raw_response, BaseElement):
+        raw_response.context["request"] = request
+        if (swap := get_partial_swap(handler, request)) and (
+            target := request.headers.get("HX-Target")
+        ):
+            # Components rendered by the search are reused in the response.
+            with reuse_rendered_components():
+                selected = select_target(raw_response, target, swap)
+                content = await policy.render(selected or raw_response)
+        else:
+            content = await policy.render(raw_response)
         response = LudicResponse(
-            raw_response, status_code=status_code or 200, headers=headers
+            content, status_code=status_code or 200, headers=headers
         )
     elif isinstance(raw_response, str | bool | int | float):
         response = PlainTextResponse(
@@ -115,18 +260,23 @@ async def prepare_response(
     else:
         raise ValueError(f"Invalid response type: {type(raw_response)}")
 
+    attach_background(response, request.scope.get("ludic.background"), background)
     return response
 
 
 async def extract_from_request(  # noqa
     handler: Callable[..., Any],
     request: Request | WebSocket,
+    exit_stack: AsyncExitStack | None = None,
 ) -> dict[str, Any]:
     """Extracts parameters for given handler from the request.
 
     This function scans the signature of the handler and tries to extract
     the parameters from the request. It passes them to the handler as
     keyword arguments.
+
+    Parsers are closed, together with their uploaded files, when the
+    ``exit_stack`` is closed, or after the response is sent without it.
     """
     parameters = inspect.signature(handler).parameters
     handler_kwargs: dict[str, Any] = {}
@@ -150,8 +300,14 @@ async def extract_from_request(  # noqa
                 and isinstance(origin, type)
                 and issubclass(origin, BaseParser)
             ):
-                async with request.form() as form:
-                    handler_kwargs[name] = annotation(form)
+                parser = annotation(FormStream(request, limits=origin.limits))
+                if exit_stack is not None:
+                    exit_stack.push_async_callback(parser.aclose)
+                else:
+                    request.scope.setdefault("ludic.background", BackgroundTasks())
+                    request.scope["ludic.background"].add_task(parser.aclose)
+                await parser.load()
+                handler_kwargs[name] = parser
             elif isinstance(annotation, UnionType):
                 args = get_args(annotation)
                 # Defensive: Only allow Optional[X] (X | NoneType)
@@ -169,6 +325,14 @@ async def extract_from_request(  # noqa
                 handler_kwargs[name] = request.query_params
             elif isinstance(annotation, type) and issubclass(annotation, Headers):
                 handler_kwargs[name] = request.headers
+            elif isinstance(annotation, type) and issubclass(
+                annotation, BackgroundTasks
+            ):
+                handler_kwargs[name] = request.scope.setdefault(
+                    "ludic.background", annotation()
+                )
+        except HTTPException:
+            raise
         except Exception as exc:
             raise TypeError(
                 f"Error extracting parameter '{name}' "
@@ -179,7 +343,13 @@ async def extract_from_request(  # noqa
 
 
 class LudicResponse(HTMLResponse):
-    """Response class for Ludic components."""
+    """Response class for Ludic components.
+
+    The content can also be HTML already rendered from a component, e.g. by
+    :meth:`ludic.web.rendering.RenderPolicy.render`.
+    """
 
-    def render(self, content: BaseElement) -> bytes:
-        return content.to_html().encode("utf-8")
+    def render(self, content: BaseElement | str | bytes) -> bytes:
+        if isinstance(content, BaseElement):
+            return content.to_html().encode("utf-8")
+        return super().render(content)
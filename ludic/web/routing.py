@@ -1,16 +1,28 @@
 import inspect
-from collections.abc import Callable, Collection
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Collection
+from contextlib import nullcontext
 from typing import Any
 
+import anyio
 from starlette import routing
 from starlette.exceptions import HTTPException
+from starlette.requests import ClientDisconnect
 from starlette.responses import PlainTextResponse, Response
 from starlette.routing import Host
-from starlette.types import Receive, Scope, Send
+from starlette.types import Message, Receive, Scope, Send
 
 from ludic.attrs import Attrs
 
+from .caching import get_cache_policy, get_response_cache
+from .coalescing import CoalescePolicy, get_coalesce_policy, get_single_flight
+from .concurrency import AdaptiveConcurrencyLimiter
+from .degradation import get_load_monitor
 from .endpoints import Endpoint
+from .exceptions import GatewayTimeoutError
+from .ratelimit import RateLimit, get_rate_limit
+from .rendering import RenderPolicy
 from .requests import Request
 from .responses import prepare_response
 
@@ -19,9 +31,35 @@ __all__ = (
     "Mount",
     "Route",
     "Router",
+    "cancel_on_disconnect",
 )
 
 
+def cancel_on_disconnect[T](handler: T) -> T:
+    """Cancel the handler and rendering when the client disconnects.
+
+    Useful for expensive routes whose requests htmx supersedes, e.g. search
+    as you type. Watching for the disconnect costs a task per request, so
+    routes have to opt in. Works on functions, endpoint classes and their
+    methods. The ``cancelled_requests`` counter of the application holds
+    the number of requests cancelled before the response started.
+
+    Example:
+
+        @app.get("/search")
+        @cancel_on_disconnect
+        async def search(q: str) -> SearchResults:
+            return SearchResults(...)
+    """
+    handler.__ludic_cancel_on_disconnect__ = True  # type: ignore[attr-defined]
+    return handler
+
+
+def is_cancelled_on_disconnect(handler: Any) -> bool:
+    """Check whether a handler or an endpoint opted in to disconnect watching."""
+    return getattr(handler, "__ludic_cancel_on_disconnect__", False)
+
+
 class Mount(routing.Mount):
     """Mount class for Ludic components."""
 
@@ -35,19 +73,179 @@ class Mount(routing.Mount):
         return match, scope
 
 
+async def _prepare_cached_response(
+    handler: Callable[..., Any],
+    name: str,
+    request: Request,
+    policy_source: Any,
+    render_policy: RenderPolicy | None = None,
+    rate_limit: RateLimit | None = None,
+    timeout: float | None = None,
+    coalesce_policy: CoalescePolicy | None = None,
+) -> Response:
+    if rate_limit is not None:
+        rate_limit.check(name, request)
+
+    async def prepare() -> Response:
+        return await prepare_response(handler, request, render_policy=render_policy)
+
+    async def call_next() -> Response:
+        if coalesce_policy is None:
+            return await prepare()
+        return await get_single_flight(request.scope.get("app")).respond(
+            coalesce_policy, name, request, prepare
+        )
+
+    async def respond() -> Response:
+        if (policy := get_cache_policy(policy_source)) is None:
+            return await call_next()
+        return await get_response_cache(request.scope.get("app")).respond(
+            policy, name, request, call_next
+        )
+
+    if timeout is None:
+        return await respond()
+
+    # The deadline covers extraction of parameters, the handler and rendering,
+    # work running in a thread pool is finished before the cancellation.
+    request.scope["ludic.deadline"] = time.monotonic() + timeout
+    with anyio.move_on_after(timeout):
+        return await respond()
+    raise GatewayTimeoutError()
+
+
+class _DisconnectWatcher:
+    """Cancel handling of a request when the client disconnects.
+
+    The watcher is the only consumer of the ASGI ``receive`` callable, it
+    forwards the request body to :meth:`receive` one message at a time, so
+    body streaming keeps its backpressure, and watches for
+    ``http.disconnect`` in the meantime.
+    """
+
+    def __init__(self, receive: Receive) -> None:
+        self.cancel_scope = anyio.CancelScope()
+        self.disconnected = False
+        self.started = False
+        self.completed = False
+        self._receive = receive
+        self._send_stream, self._receive_stream = anyio.create_memory_object_stream[
+            Message
+        ](1)
+
+    async def receive(self) -> Message:
+        try:
+            return await self._receive_stream.receive()
+        except anyio.EndOfStream:
+            return {"type": "http.disconnect"}
+
+    def wrap_send(self, send: Send) -> Send:
+        async def wrapped_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.started = True
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # Background tasks run after the body is sent, a disconnect
+                # must not cancel them.
+                self.completed = True
+
+        return wrapped_send
+
+    async def watch(self) -> None:
+        async with self._send_stream:
+            while True:
+                message = await self._receive()
+                if message["type"] == "http.disconnect":
+                    self.disconnected = True
+                    if not self.completed:
+                        self.cancel_scope.cancel()
+                    return
+                await self._send_stream.send(message)
+
+
+async def _respond_until_disconnect(
+    name: str,
+    respond: Callable[[Request], Awaitable[Response]],
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+) -> None:
+    watcher = _DisconnectWatcher(receive)
+    error: Exception | None = None
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(watcher.watch)
+        try:
+            with watcher.cancel_scope:
+                request = Request(scope, watcher.receive)
+                response = await respond(request)
+                await response(scope, watcher.receive, watcher.wrap_send(send))
+        except Exception as exc:
+            # Raised after the task group exits, so it is not wrapped
+            # in an exception group.
+            error = exc
+        finally:
+            task_group.cancel_scope.cancel()
+
+    if error is not None and not isinstance(error, ClientDisconnect):
+        raise error
+    # Streamed responses cancelled after they started were not superseded.
+    if watcher.cancel_scope.cancel_called and not watcher.started:
+        cancelled = getattr(scope.get("app"), "cancelled_requests", None)
+        if isinstance(cancelled, Counter):
+            cancelled[name] += 1
+
+
 class _FunctionHandler:
-    def __init__(self, handler: Callable[..., Any]) -> None:
+    def __init__(
+        self,
+        handler: Callable[..., Any],
+        name: str | None = None,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
+    ) -> None:
         self.handler = handler
+        self.name = name or routing.get_name(handler)
+        self.render_policy = render_policy
+        self.rate_limit = rate_limit or get_rate_limit(handler)
+        self.timeout = timeout
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = Request(scope, receive)
-        response = await prepare_response(self.handler, request)
-        await response(scope, receive, send)
+        if not is_cancelled_on_disconnect(self.handler):
+            response = await self.respond(Request(scope, receive))
+            await response(scope, receive, send)
+            return
+        await _respond_until_disconnect(self.name, self.respond, scope, receive, send)
+
+    async def respond(self, request: Request) -> Response:
+        return await _prepare_cached_response(
+            self.handler,
+            self.name,
+            request,
+            self.handler,
+            self.render_policy,
+            self.rate_limit,
+            self.timeout,
+            get_coalesce_policy(self.handler),
+        )
 
 
 class _EndpointHandler:
-    def __init__(self, handler: type[Endpoint[Attrs]]) -> None:
+    def __init__(
+        self,
+        handler: type[Endpoint[Attrs]],
+        name: str | None = None,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
+    ) -> None:
         self.handler = handler
+        self.name = name or routing.get_name(handler)
+        self.render_policy = render_policy
+        self.rate_limit = rate_limit or get_rate_limit(handler)
+        self.timeout = timeout if timeout is not None else handler.timeout
         self._allowed_methods = [
             method
             for method in ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
@@ -55,17 +253,41 @@ class _EndpointHandler:
         ]
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = Request(scope, receive)
+        method = getattr(self.handler, scope["method"].lower(), None)
+        if not (
+            is_cancelled_on_disconnect(self.handler)
+            or is_cancelled_on_disconnect(method)
+        ):
+            response = await self.respond(Request(scope, receive))
+            await response(scope, receive, send)
+            return
+        await _respond_until_disconnect(self.name, self.respond, scope, receive, send)
+
+    async def respond(self, request: Request) -> Response:
         handler_name = (
             "get"
             if request.method == "HEAD" and not hasattr(self, "head")
             else request.method.lower()
         )
         handler: Callable[..., Any] = getattr(
-            self.handler, handler_name, self.method_not_allowed(scope)
+            self.handler, handler_name, self.method_not_allowed(request.scope)
+        )
+        policy_source = handler
+        if handler_name == "get" and get_cache_policy(handler) is None:
+            policy_source = self.handler
+        coalesce_policy = get_coalesce_policy(handler)
+        if handler_name == "get" and coalesce_policy is None:
+            coalesce_policy = get_coalesce_policy(self.handler)
+        return await _prepare_cached_response(
+            handler,
+            self.name,
+            request,
+            policy_source,
+            self.render_policy,
+            get_rate_limit(handler) or self.rate_limit,
+            self.timeout,
+            coalesce_policy,
         )
-        response = await prepare_response(handler, request)
-        await response(scope, receive, send)
 
     def method_not_allowed(self, scope: Scope) -> Callable[..., Any]:
         # If we're running inside a starlette application then raise an
@@ -90,18 +312,52 @@ class Route(routing.Route):
         endpoint: Callable[..., Any],
         *,
         name: str | None = None,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
         **kwargs: Any,
     ) -> None:
         name = routing.get_name(endpoint) if name is None else name
         wrapped_route = endpoint
         if inspect.isfunction(endpoint) or inspect.ismethod(endpoint):
-            wrapped_route = _FunctionHandler(endpoint)
+            wrapped_route = _FunctionHandler(
+                endpoint,
+                name=name,
+                render_policy=render_policy,
+                rate_limit=rate_limit,
+                timeout=timeout,
+            )
         elif inspect.isclass(endpoint) and issubclass(endpoint, Endpoint):
-            wrapped_route = _EndpointHandler(endpoint)
+            wrapped_route = _EndpointHandler(
+                endpoint,
+                name=name,
+                render_policy=render_policy,
+                rate_limit=rate_limit,
+                timeout=timeout,
+            )
         if getattr(endpoint, "route", None) is None:
             endpoint.route = self  # type: ignore
         super().__init__(path, wrapped_route, name=name, **kwargs)
 
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        monitor = get_load_monitor(scope.get("app"))
+        with monitor.track() if monitor is not None else nullcontext():
+            limiter = getattr(scope.get("app"), "concurrency_limiter", None)
+            if not isinstance(limiter, AdaptiveConcurrencyLimiter):
+                await super().handle(scope, receive, send)
+                return
+
+            async with limiter.limit(self.name) as release:
+
+                async def send_wrapper(message: Message) -> None:
+                    # Streamed responses (e.g. SSE) keep the connection open,
+                    # the slot is released as soon as the response starts.
+                    if message["type"] == "http.response.start":
+                        release()
+                    await send(message)
+
+                await super().handle(scope, receive, send_wrapper)
+
 
 class Router(routing.Router):
     def add_route(
@@ -111,6 +367,9 @@ class Router(routing.Router):
         methods: Collection[str] | None = None,
         name: str | None = None,
         include_in_schema: bool = True,
+        render_policy: RenderPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
     ) -> None:
         route = Route(
             path,
@@ -118,5 +377,8 @@ class Router(routing.Router):
             methods=methods,
             name=name,
             include_in_schema=include_in_schema,
+            render_policy=render_policy,
+            rate_limit=rate_limit,
+            timeout=timeout,
         )
         self.routes.append(route)
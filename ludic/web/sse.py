@@ -0,0 +1,172 @@
+from collections.abc import AsyncIterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from ludic.base import BaseElement
+from ludic.format import format_element
+
+
+@dataclass
+class ServerSentEvent:
+    """A message sent to the client by :class:`EventSourceResponse`.
+
+    Args:
+        data (BaseElement | str): The content of the message, elements are
+            rendered to HTML.
+        event (str | None): The name of the event, e.g. the value of the
+            ``sse-swap`` attribute in the htmx SSE extension.
+        id (str | None): The id of the event.
+        retry (int | None): The reconnection time in milliseconds.
+    """
+
+    data: BaseElement | str
+    event: str | None = None
+    id: str | None = None
+    retry: int | None = None
+
+    def encode(self, context: Mapping[str, Any] | None = None) -> bytes:
+        """Render and frame the message.
+
+        Args:
+            context (Mapping[str, Any] | None): Context passed to the element.
+
+        Returns:
+            bytes: The framed message.
+        """
+        if context and isinstance(self.data, BaseElement):
+            self.data.context.update(context)
+
+        lines = []
+        if self.event is not None:
+            lines.append(f"event: {self.event}")
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        if self.retry is not None:
+            lines.append(f"retry: {self.retry}")
+        for line in format_element(self.data).splitlines() or [""]:
+            lines.append(f"data: {line}")
+        return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+SSEContent = ServerSentEvent | BaseElement | str | tuple[str, BaseElement | str]
+
+
+def _to_event(item: SSEContent) -> ServerSentEvent:
+    if isinstance(item, ServerSentEvent):
+        return item
+    elif isinstance(item, tuple):
+        event, data = item
+        return ServerSentEvent(data, event=event)
+    return ServerSentEvent(item)
+
+
+class EventSourceResponse(Response):
+    """Response streaming rendered elements as Server-Sent Events.
+
+    The content is an async iterable yielding elements, strings,
+    ``(event name, element)`` tuples or :class:`ServerSentEvent` instances.
+
+    The iterable is consumed only as fast as the client receives the messages,
+    at most ``buffer_size`` rendered messages are waiting to be sent. A comment
+    is sent every ``heartbeat`` seconds when there is nothing else to send, and
+    the iteration is cancelled as soon as the client disconnects.
+
+    Args:
+        content (AsyncIterable[SSEContent]): The messages to send.
+        heartbeat (float | None): Seconds between heartbeats, None disables them.
+        buffer_size (int): Maximum number of rendered messages waiting to be sent.
+        context (Mapping[str, Any] | None): Context passed to rendered elements.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        content: AsyncIterable[SSEContent],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        heartbeat: float | None = 15.0,
+        buffer_size: int = 1,
+        context: Mapping[str, Any] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.heartbeat = heartbeat
+        self.buffer_size = buffer_size
+        self.context = context or {}
+        self.background = background
+        self.init_headers(
+            {
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+                **(headers or {}),
+            }
+        )
+
+    async def _produce(self, stream: MemoryObjectSendStream[bytes]) -> None:
+        async with stream:
+            async for item in self.content:
+                await stream.send(_to_event(item).encode(self.context))
+
+    async def _listen_for_disconnect(
+        self, receive: Receive, scope: anyio.CancelScope
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                scope.cancel()
+                return
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        send_stream, receive_stream = anyio.create_memory_object_stream[bytes](
+            self.buffer_size
+        )
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(self._produce, send_stream)
+            task_group.start_soon(
+                self._listen_for_disconnect, receive, task_group.cancel_scope
+            )
+
+            async with receive_stream:
+                while True:
+                    with anyio.move_on_after(self.heartbeat) as timeout:
+                        try:
+                            message = await receive_stream.receive()
+                        except anyio.EndOfStream:
+                            break
+                    if timeout.cancelled_caught:
+                        message = b": heartbeat\n\n"
+
+                    try:
+                        await send(
+                            {
+                                "type": "http.response.body",
+                                "body": message,
+                                "more_body": True,
+                            }
+                        )
+                    except OSError:
+                        # The client is gone and the server noticed first.
+                        task_group.cancel_scope.cancel()
+                        return
+
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            task_group.cancel_scope.cancel()
+
+        if self.background is not None:
+            await self.background()
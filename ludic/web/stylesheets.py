@@ -0,0 +1,235 @@
+import hashlib
+import json
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ludic.components import COMPONENT_REGISTRY
+from ludic.styles import (
+    Theme,
+    format_styles,
+    format_variables,
+    from_loaded,
+    get_default_theme,
+    variables_theme,
+)
+
+from .exceptions import NotFoundError
+
+STYLESHEET_PATH = "/_ludic/styles-{digest}.css"
+STYLESHEET_ROUTE_NAME = "ludic:stylesheet"
+STYLESHEET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Number of stylesheets replaced by changed styles which are still served to
+# pages linking them.
+RETIRED_STYLESHEETS = 64
+
+_VARIABLE_PATTERN = re.compile(r"var\(--([\w-]+)\)")
+
+
+@dataclass(frozen=True)
+class Stylesheet:
+    """Collected styles of the loaded components for one theme."""
+
+    theme: str
+    content: bytes
+    digest: str
+    variables: tuple[str, ...] = ()
+
+    @classmethod
+    def from_theme(cls, theme: Theme) -> Self:
+        """Collect and format the styles of the loaded components.
+
+        Args:
+            theme (Theme): The theme to format the styles with.
+
+        Returns:
+            Stylesheet: The stylesheet.
+        """
+        styles = format_styles(from_loaded(cache=True, theme=theme))
+        content = styles.encode("utf-8")
+        return cls(
+            theme=theme.name,
+            content=content,
+            digest=hashlib.sha256(content).hexdigest()[:16],
+            variables=tuple(sorted(set(_VARIABLE_PATTERN.findall(styles)))),
+        )
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+class Stylesheets:
+    """Serves the global stylesheet of each theme as a static asset.
+
+    The URL of a stylesheet contains the hash of its content, so browsers can
+    cache it forever, a change of the styles results in a new URL. The
+    :class:`ludic.catalog.pages.Head` component links the stylesheet when
+    rendered in a response of :class:`LudicApp` created with ``serve_styles``,
+    which mounts the route.
+
+    The stylesheet of a theme is collected once, like ``style.load(cache=True)``,
+    and again when a component with styles is registered or removed. The
+    replaced stylesheets remain available, so pages which link them still
+    load them.
+
+    A worker serving a stylesheet it has not linked itself collects the
+    stylesheets of the default theme and of the configured ``themes`` to find
+    it, so pages rendered with other themes should list them.
+
+    With ``css_variables``, the stylesheet references custom properties
+    instead of the values of the theme, so all themes share it, and only the
+    block setting the properties is inlined in each page.
+
+    The stylesheets can also be built ahead of time with
+    ``python -m ludic.styles build``, the ``manifest`` written by the command
+    maps themes to the built files, which are served as they are. Themes
+    missing in the manifest are collected at runtime, the manifest is not
+    used together with ``css_variables``.
+
+    Args:
+        css_variables (bool): Whether the stylesheet uses custom properties.
+        manifest (str | Path | None): Path to the manifest of built stylesheets.
+        themes (Sequence[Theme]): Themes besides the default one pages use.
+    """
+
+    def __init__(
+        self,
+        css_variables: bool = False,
+        manifest: str | Path | None = None,
+        themes: Sequence[Theme] = (),
+    ) -> None:
+        self.css_variables = css_variables
+        self.themes = tuple(themes)
+        self._by_theme: dict[str, Stylesheet] = {}
+        self._by_digest: dict[str, Stylesheet] = {}
+        self._variables: dict[tuple[str, str], str] = {}
+        self._generation = COMPONENT_REGISTRY.styled_generation
+        self._built: dict[str, Stylesheet] = {}
+        if manifest is not None and not css_variables:
+            self._built = self._load_manifest(Path(manifest))
+
+    @staticmethod
+    def _load_manifest(path: Path) -> dict[str, Stylesheet]:
+        entries = json.loads(path.read_text())
+        return {
+            content_hash: Stylesheet(
+                theme=entry["theme"],
+                content=(path.parent / entry["path"]).read_bytes(),
+                digest=entry["digest"],
+            )
+            for content_hash, entry in entries.items()
+        }
+
+    def _invalidate(self) -> None:
+        # Components without styles, e.g. created by factories, do not change
+        # the stylesheets.
+        if self._generation != COMPONENT_REGISTRY.styled_generation:
+            self._generation = COMPONENT_REGISTRY.styled_generation
+            self._by_theme.clear()
+            self._variables.clear()
+
+    def get(self, theme: Theme | None = None) -> Stylesheet:
+        """Get the stylesheet of a theme.
+
+        Args:
+            theme (Theme | None): The theme, defaults to the default theme.
+
+        Returns:
+            Stylesheet: The stylesheet.
+        """
+        theme = theme or get_default_theme()
+        if (stylesheet := self._built.get(theme.content_hash)) is not None:
+            return stylesheet
+
+        self._invalidate()
+        if (stylesheet := self._by_theme.get(theme.content_hash)) is None:
+            stylesheet = Stylesheet.from_theme(
+                variables_theme(theme) if self.css_variables else theme
+            )
+            self._by_theme[theme.content_hash] = stylesheet
+            self._retain(stylesheet)
+        return stylesheet
+
+    def _retain(self, stylesheet: Stylesheet) -> None:
+        self._by_digest.pop(stylesheet.digest, None)
+        self._by_digest[stylesheet.digest] = stylesheet
+        current = {entry.digest for entry in self._by_theme.values()}
+        retired = [digest for digest in self._by_digest if digest not in current]
+        for digest in retired[: max(0, len(retired) - RETIRED_STYLESHEETS)]:
+            del self._by_digest[digest]
+
+    def find(self, digest: str) -> Stylesheet | None:
+        """Find a stylesheet by the hash of its content.
+
+        Unknown hashes are looked up in the stylesheets of the default and
+        the configured themes, which are collected if needed.
+
+        Args:
+            digest (str): The hash of the stylesheet.
+
+        Returns:
+            Stylesheet | None: The stylesheet, if it is known.
+        """
+        for stylesheet in self._built.values():
+            if stylesheet.digest == digest:
+                return stylesheet
+
+        self._invalidate()
+        if digest not in self._by_digest:
+            for theme in (get_default_theme(), *self.themes):
+                if self.get(theme).digest == digest:
+                    return self._by_digest[digest]
+        return self._by_digest.get(digest)
+
+    def format_variables(self, theme: Theme | None = None) -> str | None:
+        """Format the custom properties of a theme, if the stylesheet uses them.
+
+        Only the properties referenced by the stylesheet are included, the
+        result is cached for each theme and stylesheet.
+
+        Args:
+            theme (Theme | None): The theme, defaults to the default theme.
+
+        Returns:
+            str | None: The formatted custom properties.
+        """
+        if not self.css_variables:
+            return None
+        theme = theme or get_default_theme()
+        stylesheet = self.get(theme)
+        key = (theme.content_hash, stylesheet.digest)
+        if (variables := self._variables.get(key)) is None:
+            variables = format_variables(theme, names=stylesheet.variables)
+            self._variables[key] = variables
+        return variables
+
+    def url_path(self, request: Request, theme: Theme | None = None) -> str:
+        """Get the URL path of the stylesheet of a theme.
+
+        Args:
+            request (Request): The current request.
+            theme (Theme | None): The theme, defaults to the default theme.
+
+        Returns:
+            str: The URL path of the stylesheet.
+        """
+        digest = self.get(theme).digest
+        return request.url_for(STYLESHEET_ROUTE_NAME, digest=digest).path
+
+    async def endpoint(self, request: Request) -> Response:
+        """Serve a stylesheet, the route is mounted by :class:`LudicApp`."""
+        stylesheet = self.find(request.path_params["digest"])
+        if stylesheet is None:
+            raise NotFoundError("Stylesheet not found.")
+
+        headers = {"ETag": stylesheet.etag, "Cache-Control": STYLESHEET_CACHE_CONTROL}
+        if stylesheet.etag in request.headers.get("If-None-Match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(stylesheet.content, media_type="text/css", headers=headers)
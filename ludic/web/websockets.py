@@ -0,0 +1,195 @@
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
+import anyio
+from starlette.types import Message
+from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+
+from ludic.base import BaseElement
+from ludic.format import format_element
+
+__all__ = (
+    "BroadcastHub",
+    "Subscription",
+    "WebSocket",
+    "send_element",
+)
+
+# "Try Again Later" close code sent to evicted slow consumers.
+WS_1013_TRY_AGAIN_LATER = 1013
+
+
+async def send_element(websocket: WebSocket, element: BaseElement | str) -> None:
+    """Render an element and send it as a text message."""
+    await websocket.send_text(format_element(element))
+
+
+class Subscription:
+    """Subscription of one client to a channel of a :class:`BroadcastHub`.
+
+    Messages are buffered in a bounded queue. When the queue is full,
+    the subscription is evicted and iterating over it stops. The messages
+    are ASGI ``websocket.send`` events shared by all subscribers.
+    """
+
+    def __init__(self, channel: str, queue_size: int) -> None:
+        self.channel = channel
+        self.evicted = False
+        self._send, self._receive = anyio.create_memory_object_stream[Message](
+            queue_size
+        )
+
+    def __aiter__(self) -> AsyncIterator[Message]:
+        return self
+
+    async def __anext__(self) -> Message:
+        try:
+            return await self._receive.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            raise StopAsyncIteration
+
+    def put(self, message: Message) -> bool:
+        """Queue a message without waiting.
+
+        Returns:
+            bool: Whether the message was queued.
+        """
+        try:
+            self._send.send_nowait(message)
+        except anyio.WouldBlock:
+            self.evicted = True
+            self._send.close()
+            return False
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            return False
+        return True
+
+    def close(self) -> None:
+        self._send.close()
+        self._receive.close()
+
+
+class BroadcastHub:
+    """Publish rendered elements to all clients subscribed to a channel.
+
+    An element is rendered and encoded exactly once per :meth:`publish` call
+    and the same message is queued for every subscriber. With
+    ``binary=True``, the message is sent as UTF-8 encoded binary frames,
+    so servers do not encode it again for every client. Each subscriber has a queue of
+    at most ``queue_size`` messages, clients that cannot keep up are evicted
+    instead of slowing down the publisher or buffering without a limit.
+
+    Usage:
+
+        hub = BroadcastHub()
+
+        @app.ws("/ws/prices")
+        async def prices(websocket: WebSocket) -> None:
+            await hub.serve(websocket, "prices")
+
+        @app.post("/prices")
+        async def update_prices(data: Parser[PriceAttrs]) -> None:
+            hub.publish("prices", PriceTable(**data.validate()))
+
+    Args:
+        queue_size (int): Maximum number of messages queued for one subscriber.
+        binary (bool): Whether to send binary instead of text frames.
+    """
+
+    def __init__(self, queue_size: int = 16, binary: bool = False) -> None:
+        self.queue_size = queue_size
+        self.binary = binary
+        self.evicted_count = 0
+        self._channels: dict[str, set[Subscription]] = {}
+
+    def subscribers(self, channel: str) -> int:
+        """Get the number of subscribers of a channel."""
+        return len(self._channels.get(channel, ()))
+
+    @contextmanager
+    def subscribe(self, channel: str) -> Iterator[Subscription]:
+        """Subscribe to a channel for the duration of the context.
+
+        Args:
+            channel (str): The channel to subscribe to.
+
+        Yields:
+            Subscription: The subscription yielding published messages.
+        """
+        subscription = Subscription(channel, self.queue_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._unsubscribe(subscription)
+
+    def publish(self, channel: str, element: BaseElement | str) -> int:
+        """Render an element once and queue it for all subscribers of a channel.
+
+        This method has to be called from the event loop thread.
+
+        Args:
+            channel (str): The channel to publish to.
+            element (BaseElement | str): The element to publish.
+
+        Returns:
+            int: The number of subscribers the message was queued for.
+        """
+        if not (subscriptions := self._channels.get(channel)):
+            return 0
+
+        content = format_element(element)
+        message: Message = (
+            {"type": "websocket.send", "bytes": content.encode()}
+            if self.binary
+            else {"type": "websocket.send", "text": content}
+        )
+        delivered = 0
+        for subscription in tuple(subscriptions):
+            if subscription.put(message):
+                delivered += 1
+            elif subscription.evicted:
+                self.evicted_count += 1
+                self._unsubscribe(subscription)
+        return delivered
+
+    async def serve(self, websocket: WebSocket, channel: str) -> None:
+        """Forward messages published to a channel to a connected websocket.
+
+        Returns when the client disconnects. Evicted clients are disconnected
+        with the 1013 (Try Again Later) close code.
+
+        Args:
+            websocket (WebSocket): The accepted websocket.
+            channel (str): The channel to forward.
+        """
+        with self.subscribe(channel) as subscription:
+            async with anyio.create_task_group() as task_group:
+
+                async def listen_for_disconnect() -> None:
+                    while True:
+                        message = await websocket.receive()
+                        if message["type"] == "websocket.disconnect":
+                            task_group.cancel_scope.cancel()
+                            return
+
+                task_group.start_soon(listen_for_disconnect)
+                try:
+                    async for message in subscription:
+                        await websocket.send(message)
+                except WebSocketDisconnect:
+                    pass
+                task_group.cancel_scope.cancel()
+
+            if (
+                subscription.evicted
+                and websocket.application_state == WebSocketState.CONNECTED
+            ):
+                await websocket.close(code=WS_1013_TRY_AGAIN_LATER)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        if subscriptions := self._channels.get(subscription.channel):
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._channels[subscription.channel]
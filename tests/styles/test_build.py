@@ -0,0 +1,68 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ludic.components import COMPONENT_REGISTRY
+from ludic.styles import format_styles, from_loaded, themes
+from ludic.styles.build import MANIFEST_NAME, build_stylesheets, main
+
+
+def test_build_stylesheets(tmp_path: Path) -> None:
+    light, dark = themes.LightTheme(), themes.DarkTheme()
+    manifest = build_stylesheets([light, dark], tmp_path)
+
+    assert set(manifest) == {light.content_hash, dark.content_hash}
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text()) == manifest
+
+    entry = manifest[dark.content_hash]
+    assert entry["theme"] == "dark"
+    assert entry["path"] == f"styles-{entry['digest']}.css"
+    assert (tmp_path / entry["path"]).read_text() == format_styles(
+        from_loaded(theme=dark), minify=True
+    )
+
+
+def test_build_command(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    (tmp_path / "build_app.py").write_text(
+        "from ludic.components import Component\n"
+        "from ludic.html import b\n"
+        "\n"
+        "class Badge(Component):\n"
+        "    styles = {'.build-badge': {'color': 'red'}}\n"
+        "\n"
+        "    def render(self):\n"
+        "        return b(*self.children, classes=['build-badge'])\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delitem(sys.modules, "build_app", raising=False)
+    path = list(sys.path)
+
+    with COMPONENT_REGISTRY.scope():
+        main(
+            [
+                "build",
+                "build_app",
+                "--theme",
+                "ludic.styles.themes:DarkTheme",
+                "--output",
+                "styles",
+                "--no-minify",
+            ]
+        )
+        del sys.modules["build_app"]
+
+    manifest = json.loads((tmp_path / "styles" / MANIFEST_NAME).read_text())
+    entry = manifest[themes.DarkTheme().content_hash]
+    content = (tmp_path / "styles" / entry["path"]).read_text()
+    assert ".build-badge { color: red; }" in content
+    assert entry["path"] in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(["build", "ludic.catalog", "--theme", "ludic.styles.themes"])
+    assert sys.path == path
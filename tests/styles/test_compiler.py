@@ -0,0 +1,71 @@
+from ludic.styles.compiler import Rule, compile_styles, flatten_styles, merge_rules
+
+
+def test_flatten_styles() -> None:
+    assert flatten_styles(
+        {
+            "p": {
+                "color": "red",
+                "a": {"color": "blue"},
+                "@media (min-width: 40rem)": {"padding": 0},
+            },
+            ("b", "i"): {"margin": 0},
+        }
+    ) == [
+        Rule(("p",), (("color", "red"),)),
+        Rule(("b",), (("margin", "0"),)),
+        Rule(("i",), (("margin", "0"),)),
+        Rule(("p a",), (("color", "blue"),)),
+        Rule(("p",), (("padding", "0"),), ("@media (min-width: 40rem)",)),
+    ]
+
+
+def test_merge_identical_selectors_and_declarations() -> None:
+    rules = merge_rules(
+        [
+            Rule(("a",), (("color", "red"),)),
+            Rule(("b",), (("margin", "0"),)),
+            Rule(("a",), (("padding", "0"), ("color", "red"))),
+            Rule(("i",), (("margin", "0"),)),
+        ]
+    )
+    assert rules == [
+        Rule(("a",), (("padding", "0"), ("color", "red"))),
+        Rule(("b", "i"), (("margin", "0"),)),
+    ]
+
+
+def test_merge_keeps_cascade() -> None:
+    rules = [
+        Rule(("a",), (("margin-top", "1px"),)),
+        Rule(("b",), (("margin", "0"),)),
+        Rule(("a",), (("margin-top", "2px"),)),
+        Rule(("p::-moz-selection",), (("color", "red"),)),
+        Rule(("p::selection",), (("color", "red"),)),
+        Rule(("",), (("font-family", "X"),), ("@font-face",)),
+        Rule(("",), (("font-family", "Y"),), ("@font-face",)),
+    ]
+    assert merge_rules(rules) == rules
+
+
+def test_compile_styles() -> None:
+    styles = {
+        "a": {"color": "red", "span": {"margin": 0}},
+        "b": {"color": "red"},
+        "@media (min-width: 40rem)": {"a": {"color": "blue"}, "b": {"margin": 0}},
+        "@font-face": {"font-family": "Mono", "src": "url(mono.woff2)"},
+    }
+
+    assert compile_styles(styles, merge=True) == (
+        "a, b { color: red; }\n"
+        "@media (min-width: 40rem) { a { color: blue; } b { margin: 0; } }\n"
+        "@font-face { font-family: Mono; src: url(mono.woff2); }\n"
+        "a span { margin: 0; }"
+    )
+    assert compile_styles(styles, minify=True, merge=True) == (
+        "a,b{color:red}"
+        "@media (min-width: 40rem){a{color:blue}b{margin:0}}"
+        "@font-face{font-family:Mono;src:url(mono.woff2)}"
+        "a span{margin:0}"
+    )
+    assert compile_styles(styles).startswith("a { color: red; }\nb { color: red; }\n")
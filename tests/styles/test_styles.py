@@ -1,6 +1,10 @@
+import re
+from typing import override
+
 from ludic.attrs import Attrs
 from ludic.components import Component
-from ludic.html import style
+from ludic.html import b, body, head, html, style, td, tr
+from ludic.styles import collect
 from ludic.types import AnyChildren
 
 from . import FooTheme
@@ -116,3 +120,94 @@ def test_styles_collection() -> None:
         "a.test { color: blue; }\n"
         "</style>"
     )
+
+
+def test_critical_styles() -> None:
+    class Bold(Component[AnyChildren, Attrs]):
+        styles = {"b": {"color": "red"}}
+
+        @override
+        def render(self) -> b:
+            return b(*self.children)
+
+    class Unused(Component[AnyChildren, Attrs]):
+        styles = {"i": {"color": "blue"}}
+
+        @override
+        def render(self) -> b:
+            return b(*self.children)
+
+    class Page(Component[AnyChildren, Attrs]):
+        styles = {"body": {"margin": "0"}}
+
+        @override
+        def render(self) -> html:
+            return html(head(style.critical(B)), body(*self.children))
+
+    expected = (
+        "<!doctype html>\n"
+        "<html>"
+        "<head>"
+        '<style type="text/css">\n'
+        "a.test { color: blue; }\n"
+        "b { color: red; }\n"
+        "body { margin: 0; }\n"
+        "</style>"
+        "</head>"
+        "<body><b>Hello</b></body>"
+        "</html>"
+    )
+    assert Page(Bold("Hello")).to_html() == expected
+    assert Page(Bold("Hello")).to_html() == expected
+    assert len(collect.CRITICAL_STYLES_CACHE) >= 1
+
+    page = html(head(style.critical()), body(Bold("Hello")))
+    assert "b { color: red; }" in page.to_html()
+    assert "i { color: blue; }" not in page.to_html()
+    assert "i { color: blue; }" in style.critical().to_html()
+
+
+def test_pages_without_placeholders_are_not_filled_in() -> None:
+    page = html(head(style("b { color: red; }")), body(collect.CRITICAL_STYLES_MARKER))
+    assert collect.CRITICAL_STYLES_MARKER in page.to_html()
+
+
+def test_inline_style_classes() -> None:
+    cell_style = {"color": "red", "padding": "0"}
+    page = html(
+        head(style.inline_classes()),
+        body(
+            tr(
+                td("A", style=cell_style),
+                td("B", style=cell_style, class_="cell"),
+                td("C", style={"content": "'</style>'"}),
+            )
+        ),
+    )
+
+    result = page.to_html()
+    match = re.search(r'class="(s-[0-9a-f]{12})"', result)
+    assert match is not None
+
+    class_name = match.group(1)
+    assert result == (
+        "<!doctype html>\n"
+        "<html>"
+        "<head>"
+        '<style type="text/css">\n'
+        f".{class_name} {{ color: red; padding: 0; }}\n"
+        "</style>"
+        "</head>"
+        "<body>"
+        "<tr>"
+        f'<td class="{class_name}">A</td>'
+        f'<td class="{class_name} cell">B</td>'
+        "<td style=\"content:'&lt;/style&gt;'\">C</td>"
+        "</tr>"
+        "</body>"
+        "</html>"
+    )
+    assert td("A", style=cell_style).to_html() == (
+        '<td style="color:red;padding:0">A</td>'
+    )
+    assert style.inline_classes().to_html() == '<style type="text/css">\n\n</style>'
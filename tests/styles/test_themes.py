@@ -3,9 +3,14 @@ from typing import override
 from ludic.attrs import GlobalAttrs
 from ludic.components import Component
 from ludic.html import a, b, div, style
+from ludic.styles import from_loaded
+from ludic.styles.highlight import LudicDark, LudicLight
 from ludic.styles.themes import (
+    CodeBlock,
     Colors,
+    DarkTheme,
     Fonts,
+    LightTheme,
     Sizes,
     get_default_theme,
     set_default_theme,
@@ -138,3 +143,63 @@ def test_element_theme_switching() -> None:
           f"#c2 a {{ color: {foo.colors.danger}; }}\n"
         "</style>"
     )  # fmt: skip
+
+
+def test_theme_content_hash() -> None:
+    assert LightTheme().content_hash == LightTheme().content_hash
+    assert LightTheme().content_hash != FooTheme().content_hash
+    assert (
+        LightTheme().content_hash
+        != LightTheme(colors=Colors(primary=Color("#c2e7fd"))).content_hash
+    )
+
+    theme = LightTheme()
+    content_hash = theme.content_hash
+    theme.colors = Colors(primary=Color("#c2e7fd"))
+    assert theme.content_hash != content_hash
+
+
+def test_style_callable_evaluated_once_per_theme() -> None:
+    calls: list[str] = []
+
+    def styles(theme: LightTheme) -> dict[str, dict[str, str]]:
+        calls.append(theme.colors.primary)
+        return {"a": {"color": theme.colors.primary}, "b": {"color": "red"}}
+
+    element = style.use(styles)
+    custom = LightTheme(colors=Colors(primary=Color("#c2e7fd")))
+
+    for theme in (LightTheme(), LightTheme(), custom, custom):
+        element.context["theme"] = theme
+        assert element["a"] == {"color": theme.colors.primary}
+        assert list(element) == ["a", "b"]
+
+    assert calls == [LightTheme().colors.primary, custom.colors.primary]
+
+
+def test_global_styles_cache_per_theme_configuration() -> None:
+    class C(Component[str, GlobalAttrs]):  # type: ignore
+        styles = style.use(lambda theme: {".c": {"color": theme.colors.primary}})
+
+        @override
+        def render(self) -> div:
+            return div(*self.children)
+
+    first = LightTheme(colors=Colors(primary=Color("#010203")))
+    second = LightTheme(colors=Colors(primary=Color("#040506")))
+
+    styles = from_loaded(cache=True, theme=first)
+    assert styles[".c"] == {"color": "#010203"}
+    assert from_loaded(cache=True, theme=second)[".c"] == {"color": "#040506"}
+    assert from_loaded(cache=True, theme=first) is styles
+
+
+def test_code_style_resolved_on_demand() -> None:
+    assert LightTheme().code.style == "ludic-light"
+    assert LightTheme().code.resolve_style() is LudicLight
+    assert DarkTheme().code.resolve_style() is LudicDark
+    assert CodeBlock(style="monokai").resolve_style() == "monokai"
+
+    code_block = CodeBlock()
+    code_block.style = LudicDark
+    assert code_block.resolve_style() is LudicDark
@@ -0,0 +1,55 @@
+from typing import override
+
+from ludic.attrs import GlobalAttrs
+from ludic.components import Component
+from ludic.html import div, style
+from ludic.styles import format_variables, from_components, variables_theme
+from ludic.styles.themes import DarkTheme, LightTheme
+
+
+class Box(Component[str, GlobalAttrs]):
+    styles = style.use(
+        lambda theme: {
+            ".box": {
+                "color": theme.colors.primary.darken(1),
+                "padding": theme.sizes.m * 2,
+                "font-family": theme.fonts.primary,
+                "line-height": theme.line_height,
+            }
+        }
+    )
+
+    @override
+    def render(self) -> div:
+        return div(*self.children, classes=["box"])
+
+
+def test_styles_reference_custom_properties() -> None:
+    styles = from_components(Box, theme=variables_theme(LightTheme()))
+
+    assert styles[".box"] == {
+        "color": "var(--color-primary-darken-1)",
+        "padding": "var(--size-m-mul-2)",
+        "font-family": "var(--font-primary)",
+        "line-height": LightTheme().line_height,
+    }
+
+
+def test_format_variables() -> None:
+    from_components(Box, theme=variables_theme())
+
+    for theme in (LightTheme(), DarkTheme()):
+        variables = format_variables(theme)
+        assert variables.startswith(":root { --color-primary: ")
+        assert f"--color-primary: {theme.colors.primary};" in variables
+        assert (
+            f"--color-primary-darken-1: {theme.colors.primary.darken(1)};" in variables
+        )
+        assert f"--size-m-mul-2: {theme.sizes.m * 2};" in variables
+        assert f"--rounding-normal: {theme.rounding.normal};" in variables
+
+    assert (
+        style.variables(DarkTheme())
+        .to_html()
+        .startswith('<style type="text/css">\n:root { ')
+    )
@@ -12,7 +12,13 @@ from ludic.catalog.messages import (
 )
 from ludic.catalog.navigation import Navigation, NavItem
 from ludic.catalog.tables import Table, TableHead, TableRow
-from ludic.catalog.typography import Link, Paragraph
+from ludic.catalog.typography import (
+    CodeBlock,
+    Link,
+    Paragraph,
+    highlight_code,
+    precompute_highlighting,
+)
 from ludic.html import b
 from ludic.styles import themes
 
@@ -260,3 +266,19 @@ def test_items() -> None:
           "<li>E</li>"
         "</ol>"
     )  # fmt: skip
+
+
+def test_code_block_highlighting_is_cached() -> None:
+    highlight_code.cache_clear()
+    block = CodeBlock("print('Hello, World!')", language="python")
+    precompute_highlighting(block)
+    assert highlight_code.cache_info().currsize == 1
+
+    html = block.to_html()
+    assert "print" in html and "user-select:none" in html
+    assert "#007020" in html  # resolved LudicLight code style
+    assert highlight_code.cache_info().currsize == 1
+
+    CodeBlock("print('Hello, World!')", language="python", line_numbers=False).render()
+    CodeBlock("print('Hello!')", language="python").render()
+    assert highlight_code.cache_info().currsize == 3
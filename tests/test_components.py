@@ -1,8 +1,10 @@
+import gc
 from typing import override
 
-from ludic.attrs import Attrs
-from ludic.components import Component
-from ludic.html import div
+from ludic.attrs import Attrs, NoAttrs
+from ludic.components import COMPONENT_REGISTRY, Component
+from ludic.html import div, span
+from ludic.styles import from_loaded
 from ludic.types import AnyChildren
 
 
@@ -26,3 +28,78 @@ def test_component_classes() -> None:
             '<div class="class-f">content</div>'
         '</div>'
     )  # fmt: skip
+
+
+def test_component_get_element_by_id() -> None:
+    dom = div(
+        ClassesComponent(div(span("text", id="inner"), id="outer"), class_="c"),
+        ClassesComponent("content", class_="c", id="component"),  # type: ignore[call-arg]
+    )
+
+    assert dom.get_element_by_id("inner") == span("text", id="inner")
+    assert dom.get_element_by_id("outer") == div(span("text", id="inner"), id="outer")
+    assert dom.get_element_by_id("missing") is None
+
+    component = dom.get_element_by_id("component")
+    assert isinstance(component, ClassesComponent)
+    assert component.to_html() == (
+        '<div class="class-b class-a c" id="component">content</div>'
+    )
+
+
+def test_component_registry_scope() -> None:
+    generation = COMPONENT_REGISTRY.generation
+    assert COMPONENT_REGISTRY["ClassesComponent"] == [ClassesComponent]
+
+    with COMPONENT_REGISTRY.scope():
+
+        class ScopedComponent(Component[AnyChildren, NoAttrs]):
+            styles = {".scoped": {"color": "red"}}
+
+            @override
+            def render(self) -> div:
+                return div(*self.children)
+
+        assert COMPONENT_REGISTRY["ScopedComponent"] == [ScopedComponent]
+        assert ".scoped" in from_loaded(cache=True)
+        assert COMPONENT_REGISTRY.generation > generation
+
+    assert "ScopedComponent" not in COMPONENT_REGISTRY
+    assert ".scoped" not in from_loaded(cache=True)
+
+    COMPONENT_REGISTRY.register(ScopedComponent)
+    assert ".scoped" in from_loaded(cache=True)
+    COMPONENT_REGISTRY.unregister(ScopedComponent)
+    assert ".scoped" not in from_loaded(cache=True)
+
+
+def test_component_registry_is_weak() -> None:
+    class TemporaryComponent(Component[AnyChildren, NoAttrs]):
+        @override
+        def render(self) -> div:
+            return div(*self.children)
+
+    assert "TemporaryComponent" in COMPONENT_REGISTRY
+    generation = COMPONENT_REGISTRY.generation
+
+    del TemporaryComponent
+    gc.collect()
+
+    assert "TemporaryComponent" not in COMPONENT_REGISTRY
+    assert COMPONENT_REGISTRY.generation > generation
+
+
+def test_unstyled_components_keep_styles_cache() -> None:
+    styles = from_loaded(cache=True)
+    generation = COMPONENT_REGISTRY.styled_generation
+
+    class UnstyledComponent(Component[AnyChildren, NoAttrs]):
+        @override
+        def render(self) -> div:
+            return div(*self.children)
+
+    del UnstyledComponent
+    gc.collect()
+
+    assert COMPONENT_REGISTRY.styled_generation == generation
+    assert from_loaded(cache=True) is styles
@@ -1,7 +1,11 @@
+from typing import override
+
 import pytest
 from starlette.testclient import TestClient
 
-from ludic.html import div
+from ludic.attrs import GlobalAttrs
+from ludic.components import Component
+from ludic.html import b, div
 from ludic.web import LudicApp
 
 
@@ -59,3 +63,58 @@ def test_lifespan_and_on_startup_cannot_be_combined() -> None:
 
     with pytest.raises(AssertionError):
         LudicApp(on_startup=[lambda: None], lifespan=lifespan)
+
+
+def test_partial_rendering_of_htmx_target() -> None:
+    app = LudicApp(partial_rendering=True)
+
+    @app.get("/")
+    def index() -> div:
+        return div(div("header"), div("results", id="results"))
+
+    with TestClient(app) as client:
+        assert client.get("/").text == (
+            '<div><div>header</div><div id="results">results</div></div>'
+        )
+        response = client.get(
+            "/", headers={"HX-Request": "true", "HX-Target": "results"}
+        )
+        assert response.text == "results"
+        response = client.get("/", headers={"HX-Request": "true", "HX-Target": "other"})
+        assert response.text.startswith("<div><div>header</div>")
+
+
+def test_partial_rendering_of_htmx_target_outer_html() -> None:
+    app = LudicApp(partial_rendering="outerHTML")
+
+    @app.get("/")
+    def index() -> div:
+        return div(div("header"), div(b("results"), id="results"))
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/", headers={"HX-Request": "true", "HX-Target": "results"}
+        )
+        assert response.text == '<div id="results"><b>results</b></div>'
+
+
+def test_partial_rendering_renders_components_once() -> None:
+    app = LudicApp(partial_rendering=True)
+    renders = []
+
+    class Results(Component[str, GlobalAttrs]):
+        @override
+        def render(self) -> div:
+            renders.append(self)
+            return div(*self.children, id="results")
+
+    @app.get("/")
+    def index() -> div:
+        return div(div("header"), Results(b("results")))
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/", headers={"HX-Request": "true", "HX-Target": "results"}
+        )
+        assert response.text == "<b>results</b>"
+        assert len(renders) == 1
@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import override
+
+from starlette.background import BackgroundTasks
+from starlette.testclient import TestClient
+
+from ludic.attrs import NoAttrs
+from ludic.html import div
+from ludic.web import Endpoint, LudicApp
+from ludic.web.caching import FileCache, MemoryCache, cache
+
+
+def test_cached_handler_varies_by_htmx_headers() -> None:
+    app = LudicApp()
+    calls: list[str] = []
+
+    @app.get("/items/{id}")
+    @cache(ttl=60)
+    def item(id: str) -> div:
+        calls.append(id)
+        return div(f"item {id} #{len(calls)}")
+
+    client = TestClient(app)
+    assert client.get("/items/1").text == "<div>item 1 #1</div>"
+    assert client.get("/items/1").text == "<div>item 1 #1</div>"
+    assert client.get("/items/2").text == "<div>item 2 #2</div>"
+
+    response = client.get("/items/1", headers={"HX-Request": "true"})
+    assert response.text == "<div>item 1 #3</div>"
+    assert "HX-Request" in response.headers["Vary"]
+    assert client.get("/items/1?page=2").text == "<div>item 1 #4</div>"
+    assert calls == ["1", "2", "1", "1"]
+
+
+def test_cached_handler_stale_while_revalidate() -> None:
+    app = LudicApp(cache_backend=MemoryCache(max_entries=1))
+    calls: list[int] = []
+    tasks_run: list[int] = []
+
+    @app.get("/")
+    @cache(ttl=0, stale_while_revalidate=60)
+    def index(tasks: BackgroundTasks) -> div:
+        calls.append(1)
+        tasks.add_task(tasks_run.append, len(calls))
+        return div(f"#{len(calls)}")
+
+    client = TestClient(app)
+    assert client.get("/").text == "<div>#1</div>"
+    assert client.get("/").text == "<div>#1</div>"
+    assert len(calls) == 2
+    assert tasks_run == [1, 2]
+    assert client.get("/").text == "<div>#2</div>"
+
+
+def test_apps_do_not_share_cached_responses() -> None:
+    def create_app(name: str) -> LudicApp:
+        app = LudicApp()
+
+        @app.get("/")
+        @cache(ttl=60)
+        def index() -> div:
+            return div(name)
+
+        return app
+
+    assert TestClient(create_app("first")).get("/").text == "<div>first</div>"
+    assert TestClient(create_app("second")).get("/").text == "<div>second</div>"
+
+
+def test_cached_endpoint_with_file_backend(tmp_path: Path) -> None:
+    app = LudicApp()
+    calls: list[int] = []
+
+    @app.endpoint("/")
+    @cache(ttl=60, backend=FileCache(tmp_path))
+    class Index(Endpoint[NoAttrs]):
+        @classmethod
+        def get(cls) -> Endpoint[NoAttrs]:
+            calls.append(1)
+            return cls()
+
+        @override
+        def render(self) -> div:
+            return div(f"#{len(calls)}")
+
+    client = TestClient(app)
+    assert client.get("/").text == "<div>#1</div>"
+    assert client.get("/").text == "<div>#1</div>"
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
@@ -0,0 +1,112 @@
+import anyio
+import httpx
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ludic.html import div
+from ludic.web import LudicApp
+from ludic.web.coalescing import CoalescePolicy, SingleFlight, coalesce
+
+
+def make_request(query: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "path_params": {},
+            "query_string": query.encode(),
+            "headers": [],
+        }
+    )
+
+
+def test_concurrent_requests_share_response() -> None:
+    single_flight = SingleFlight()
+    calls: list[str] = []
+
+    async def call_next() -> Response:
+        calls.append("call")
+        await anyio.sleep(0.05)
+        return Response(b"<p>page</p>", media_type="text/html")
+
+    async def main() -> list[Response]:
+        responses: list[Response] = []
+
+        async def request(query: str) -> None:
+            responses.append(
+                await single_flight.respond(
+                    CoalescePolicy(), "page", make_request(query), call_next
+                )
+            )
+
+        async with anyio.create_task_group() as tg:
+            for query in ("", "", "", "page=2"):
+                tg.start_soon(request, query)
+        return responses
+
+    responses = anyio.run(main)
+
+    assert len(calls) == 2
+    assert all(response.body == b"<p>page</p>" for response in responses)
+    assert len(single_flight) == 0
+
+
+def test_waiting_request_takes_over_after_failure() -> None:
+    single_flight = SingleFlight()
+    calls: list[str] = []
+    results: list[str] = []
+
+    async def call_next() -> Response:
+        calls.append("call")
+        await anyio.sleep(0.05)
+        if len(calls) == 1:
+            raise RuntimeError("leader failed")
+        return Response(b"ok")
+
+    async def request() -> None:
+        try:
+            response = await single_flight.respond(
+                CoalescePolicy(), "page", make_request(), call_next
+            )
+            results.append(response.body.decode())
+        except RuntimeError as exc:
+            results.append(str(exc))
+
+    async def main() -> None:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(request)
+
+    anyio.run(main)
+
+    assert len(calls) == 2
+    assert sorted(results) == ["leader failed", "ok", "ok"]
+
+
+def test_coalesce_decorator() -> None:
+    app = LudicApp()
+    calls: list[str] = []
+
+    @app.get("/")
+    @coalesce()
+    async def index() -> div:
+        calls.append("call")
+        await anyio.sleep(0.05)
+        return div("index")
+
+    async def main() -> list[str]:
+        transport = httpx.ASGITransport(app=app)
+        texts: list[str] = []
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+
+            async def get() -> None:
+                texts.append((await c.get("/")).text)
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(get)
+        return texts
+
+    assert anyio.run(main) == ["<div>index</div>"] * 5
+    assert calls == ["call"]
@@ -0,0 +1,149 @@
+from collections.abc import AsyncIterator
+
+import anyio
+import httpx
+import pytest
+
+from ludic.html import div
+from ludic.web import LudicApp
+from ludic.web.concurrency import AdaptiveConcurrencyLimiter
+from ludic.web.exceptions import (
+    ServiceUnavailableError,
+    TooManyRequestsError,
+)
+
+
+def test_excess_requests_are_shed() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=2, queue_size=1, queue_timeout=0.05
+    )
+    errors: list[int] = []
+
+    async def request() -> None:
+        try:
+            async with limiter.limit("route"):
+                await anyio.sleep(0.2)
+        except (TooManyRequestsError, ServiceUnavailableError) as exc:
+            errors.append(exc.status_code)
+
+    async def main() -> None:
+        async with anyio.create_task_group() as tg:
+            for _ in range(4):
+                tg.start_soon(request)
+
+    anyio.run(main)
+
+    assert sorted(errors) == [429, 503]
+    stats = limiter.stats()["route"]
+    assert stats.shed_count == limiter.shed_count == 2
+    assert stats.in_flight == stats.queue_depth == limiter.queue_depth == 0
+
+
+def test_queued_request_gets_released_slot() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout=1)
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        async with limiter.limit("route"):
+            order.append(name)
+            await anyio.sleep(0.05)
+
+    async def main() -> None:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(request, "first")
+            await anyio.sleep(0.01)
+            assert limiter.queue_depth == 0
+            tg.start_soon(request, "second")
+            await anyio.sleep(0.01)
+            assert limiter.queue_depth == 1
+
+    anyio.run(main)
+
+    assert order == ["first", "second"]
+    assert limiter.shed_count == 0
+
+
+def test_limit_adapts_to_latency() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, smoothing=1.0)
+
+    async def request(duration: float) -> None:
+        async with limiter.limit("route"):
+            await anyio.sleep(duration)
+
+    anyio.run(request, 0.01)
+    assert limiter.stats()["route"].limit == 10
+
+    anyio.run(request, 0.2)
+    assert limiter.stats()["route"].limit == 5
+
+
+def test_shed_requests_are_rendered_by_exception_handlers() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_size=0)
+    app = LudicApp(concurrency_limiter=limiter)
+    started = anyio.Event()
+    finish = anyio.Event()
+
+    @app.get("/")
+    async def index() -> div:
+        started.set()
+        await finish.wait()
+        return div("done")
+
+    @app.exception_handler(429)
+    async def too_many_requests(exc: TooManyRequestsError) -> div:
+        return div(exc.detail)
+
+    async def main() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        responses: list[httpx.Response] = []
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+
+            async def get() -> None:
+                responses.append(await c.get("/"))
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(get)
+                await started.wait()
+                await get()
+                finish.set()
+        return responses
+
+    rejected, accepted = anyio.run(main)
+
+    assert rejected.status_code == 429
+    assert rejected.text == "<div>Too Many Requests</div>"
+    assert rejected.headers["Retry-After"] == "1"
+    assert accepted.text == "<div>done</div>"
+    assert limiter.stats()["index"].shed_count == 1
+
+
+def test_streamed_responses_release_the_slot() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_size=0)
+    app = LudicApp(concurrency_limiter=limiter)
+    streaming = anyio.Event()
+    finish = anyio.Event()
+
+    @app.sse("/events", heartbeat=None)
+    async def events() -> AsyncIterator[div]:
+        yield div("first")
+        streaming.set()
+        await finish.wait()
+
+    async def main() -> int:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(c.get, "/events")
+                await streaming.wait()
+                in_flight = limiter.stats()["events"].in_flight
+                finish.set()
+        return in_flight
+
+    assert anyio.run(main) == 0
+    assert limiter.stats()["events"].in_flight == 0
+
+
+@pytest.mark.parametrize("queue_timeout", [0.2, 1.5])
+def test_retry_after(queue_timeout: float) -> None:
+    limiter = AdaptiveConcurrencyLimiter(queue_timeout=queue_timeout)
+    assert limiter.retry_after == ("1" if queue_timeout < 1 else "2")
@@ -0,0 +1,76 @@
+import time
+
+import anyio
+from starlette.testclient import TestClient
+
+from ludic.attrs import Attrs
+from ludic.html import div
+from ludic.web import Endpoint, LudicApp
+from ludic.web.degradation import Degradable, DegradePolicy, LoadMonitor
+
+
+class WidgetAttrs(Attrs):
+    id: str
+
+
+def test_degrade_policy() -> None:
+    monitor = LoadMonitor()
+    policy = DegradePolicy(max_loop_lag=0.1, max_in_flight=1)
+    assert not policy.is_overloaded(monitor)
+
+    monitor.loop_lag = 0.2
+    assert policy.is_overloaded(monitor)
+
+    monitor.loop_lag = 0
+    with monitor.track(), monitor.track():
+        assert policy.is_overloaded(monitor)
+    assert monitor.in_flight == 0
+
+    assert DegradePolicy(signal=lambda: True).is_overloaded(None)
+
+
+def test_load_monitor_measures_loop_lag() -> None:
+    monitor = LoadMonitor(interval=0.01, smoothing=1.0)
+
+    async def main() -> None:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(monitor.run)
+            await anyio.sleep(0.001)
+            time.sleep(0.05)  # blocks the event loop
+            # Stop at the first measurement after the block, the next one
+            # would replace the lag with a smoothing of 1.0.
+            with anyio.fail_after(1):
+                while monitor.loop_lag == 0:
+                    await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+    anyio.run(main)
+    assert monitor.loop_lag > 0.02
+
+
+def test_degradable_renders_lazy_loader_under_load() -> None:
+    overloaded = False
+    app = LudicApp(load_monitor=LoadMonitor())
+    policy = DegradePolicy(signal=lambda: overloaded)
+
+    @app.endpoint("/widgets/{id}")
+    class Widget(Endpoint[WidgetAttrs]):
+        @classmethod
+        async def get(cls, id: str) -> Endpoint[WidgetAttrs]:
+            return cls(id=id)
+
+        def render(self) -> div:
+            return div(f"widget {self.attrs['id']}")
+
+    @app.get("/")
+    async def index() -> div:
+        return div(Degradable(Widget(id="1"), policy=policy, placeholder="..."))
+
+    with TestClient(app) as client:
+        assert client.get("/").text == "<div><div>widget 1</div></div>"
+
+        overloaded = True
+        response = client.get("/")
+        assert 'hx-get="/widgets/1"' in response.text
+        assert "..." in response.text
+        assert client.get("/widgets/1").text == "<div>widget 1</div>"
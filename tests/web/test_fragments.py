@@ -0,0 +1,53 @@
+from typing import override
+
+from starlette.testclient import TestClient
+
+from ludic.attrs import GlobalAttrs
+from ludic.components import Component
+from ludic.html import b, div, span
+from ludic.types import AnyChildren
+from ludic.web import LudicApp
+from ludic.web.fragments import Fragments, Oob
+
+
+class Counter(Component[AnyChildren, GlobalAttrs]):
+    classes = ["counter"]
+
+    @override
+    def render(self) -> span:
+        return span(*self.children, id="counter")
+
+
+def test_oob_element() -> None:
+    assert Oob(div("row", id="row")).to_html() == (
+        '<div id="row" hx-swap-oob="true">row</div>'
+    )
+    assert Oob(Counter("10"), swap="outerHTML").to_html() == (
+        '<span id="counter" class="counter" hx-swap-oob="outerHTML">10</span>'
+    )
+
+    row = div("row", id="row")
+    Oob(row).to_html()
+    assert row.to_html() == '<div id="row">row</div>'
+
+
+def test_fragments_response() -> None:
+    app = LudicApp()
+
+    @app.delete("/")
+    def delete() -> Fragments:
+        return Fragments(
+            b("Deleted"),
+            Oob(Counter("9")),
+            Oob(div("Done", id="toast"), swap="afterbegin:#messages"),
+        )
+
+    with TestClient(app) as client:
+        response = client.delete("/")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.text == (
+            "<b>Deleted</b>"
+            '<span id="counter" class="counter" hx-swap-oob="true">9</span>'
+            '<div id="toast" hx-swap-oob="afterbegin:#messages">Done</div>'
+        )
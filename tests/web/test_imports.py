@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_load_pygments() -> None:
+    code = (
+        "import sys\n"
+        "import ludic.web\n"
+        "from ludic.styles.themes import DarkTheme\n"
+        "DarkTheme().content_hash\n"
+        "print('pygments' in sys.modules)\n"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from ludic.web.loaders import DataLoader
+from ludic.web.requests import Request
+
+
+def test_loader_batches_concurrent_loads() -> None:
+    calls: list[list[int]] = []
+
+    async def load_squares(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return [key * key for key in keys]
+
+    async def main() -> None:
+        loader = DataLoader(load_squares)
+        assert await asyncio.gather(
+            loader.load(1), loader.load(2), loader.load(1), loader.load(3)
+        ) == [1, 4, 1, 9]
+        assert await loader.load(2) == 4
+        assert await loader.load_many([3, 4]) == [9, 16]
+        assert loader.get(4) == 16
+        assert loader.get(5) is None
+
+    asyncio.run(main())
+    assert calls == [[1, 2, 3], [4]]
+
+
+def test_loader_mapping_and_errors() -> None:
+    calls: list[list[str]] = []
+
+    def load_names(keys: list[str]) -> dict[str, str]:
+        calls.append(keys)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    async def main() -> None:
+        loader = DataLoader(load_names, max_batch_size=2)
+        assert await loader.load_many(["a", "b", "c"]) == ["A", "B", "C"]
+        with pytest.raises(KeyError):
+            await loader.load("missing")
+        assert "missing" not in loader
+
+    asyncio.run(main())
+    assert calls == [["a", "b"], ["c"], ["missing"]]
+
+
+def test_request_loader_is_request_scoped() -> None:
+    async def load(keys: list[int]) -> list[int]:
+        return keys
+
+    request = Request({"type": "http"})
+    assert request.loader(load) is request.loader(load)
+    assert Request({"type": "http"}).loader(load) is not request.loader(load)
@@ -3,9 +3,13 @@ import sys
 from typing import Annotated, Any, Literal, TypedDict
 
 import pytest
-from starlette.datastructures import FormData
+from starlette.datastructures import FormData, UploadFile
+from starlette.testclient import TestClient
 
 from ludic.catalog.forms import FieldMeta
+from ludic.types import TAttrs
+from ludic.web import LudicApp
+from ludic.web.forms import FormLimits
 from ludic.web.parsers import ListParser, Parser, ValidationError
 
 
@@ -107,6 +111,107 @@ def test_parse_list_empty_valid() -> None:
     assert ListParser[ExampleOptional](data).validate() == []
 
 
+class SmallParser(Parser[TAttrs]):
+    limits = FormLimits(max_field_size=8, max_total_size=1024)
+
+
+def test_parse_streamed_form_data() -> None:
+    app = LudicApp()
+
+    @app.post("/")
+    def handler(data: Parser[Example]) -> str:
+        attrs = data.validate()
+        return f"{attrs['sample_str']}:{attrs['sample_int'] + 1}"
+
+    @app.post("/list")
+    def list_handler(data: ListParser[Example]) -> str:
+        return ",".join(attrs["sample_str"] for attrs in data.validate())
+
+    client = TestClient(app)
+    response = client.post(
+        "/", data={"sample_str": "test", "sample_int": "10", "sample_bool": "on"}
+    )
+    assert response.text == "test:11"
+
+    response = client.post(
+        "/", data={"sample_str": "test", "sample_int": "10a", "sample_bool": "on"}
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        "/list",
+        data={
+            "sample_str:_index:0": "a",
+            "sample_int:_index:0": "1",
+            "sample_bool:_index:0": "on",
+            "sample_str:_index:1": "b",
+            "sample_int:_index:1": "2",
+            "sample_bool:_index:1": "off",
+        },
+    )
+    assert response.text == "a,b"
+
+
+def test_parse_streamed_form_data_keeps_uploads_open() -> None:
+    app = LudicApp()
+    uploads: list[UploadFile] = []
+
+    @app.post("/")
+    async def handler(data: Parser[ExampleOptional]) -> str:
+        upload = data.form_data["upload"]
+        assert isinstance(upload, UploadFile)
+        uploads.append(upload)
+        return f"{data.form_data['sample_optional']}:{(await upload.read()).decode()}"
+
+    client = TestClient(app)
+    response = client.post(
+        "/", data={"sample_optional": "a"}, files={"upload": ("a.txt", b"content")}
+    )
+    assert response.text == "a:content"
+    assert uploads[0].file.closed
+
+
+def test_parse_streamed_form_data_closes_uploads_on_error() -> None:
+    app = LudicApp()
+    uploads: list[UploadFile] = []
+
+    @app.post("/")
+    async def handler(data: Parser[ExampleOptional]) -> str:
+        upload = data.form_data["upload"]
+        assert isinstance(upload, UploadFile)
+        uploads.append(upload)
+        raise RuntimeError("handler failed")
+
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.post("/", files={"upload": ("a.txt", b"content")})
+    assert response.status_code == 500
+    assert uploads[0].file.closed
+
+
+def test_parse_streamed_form_data_limits() -> None:
+    app = LudicApp()
+
+    @app.post("/")
+    def handler(data: SmallParser[Example]) -> str:
+        return data.validate()["sample_str"]
+
+    client = TestClient(app)
+    response = client.post(
+        "/", data={"sample_str": "test", "sample_int": "1", "sample_bool": "on"}
+    )
+    assert response.text == "test"
+
+    response = client.post(
+        "/", data={"sample_str": "x" * 9, "sample_int": "1", "sample_bool": "on"}
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        "/", data={"sample_str": "test"}, files={"upload": ("a.txt", b"x" * 2048)}
+    )
+    assert response.status_code == 400
+
+
 def test_module_can_be_imported_without_typeguard(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -0,0 +1,131 @@
+import sys
+import uuid
+
+import pytest
+from starlette.testclient import TestClient
+
+from ludic.attrs import NoAttrs
+from ludic.html import div
+from ludic.web import Endpoint, LudicApp
+from ludic.web.ratelimit import (
+    MemoryBuckets,
+    RateLimit,
+    SharedMemoryBuckets,
+    header,
+    rate_limit,
+)
+
+
+def test_token_bucket() -> None:
+    buckets = MemoryBuckets(shards=4)
+
+    assert buckets.consume("key", rate=1, burst=2, now=0) == 0
+    assert buckets.consume("key", rate=1, burst=2, now=0) == 0
+    assert buckets.consume("key", rate=1, burst=2, now=0) == 1
+    assert buckets.consume("other", rate=1, burst=2, now=0) == 0
+    assert buckets.consume("key", rate=1, burst=2, now=0.5) == 0.5
+    assert buckets.consume("key", rate=1, burst=2, now=1) == 0
+
+
+def test_idle_keys_are_evicted() -> None:
+    buckets = MemoryBuckets(shards=1)
+    buckets.consume("idle", rate=1, burst=2, now=0)
+    buckets.consume("busy", rate=1, burst=2, now=1)
+    buckets.consume("busy", rate=1, burst=2, now=1)
+
+    buckets.evict(0, now=2)
+
+    assert len(buckets) == 1
+    assert buckets.consume("busy", rate=1, burst=2, now=2) == 0
+    assert buckets.consume("busy", rate=1, burst=2, now=2) == 1
+
+
+def test_rate_limit_decorator() -> None:
+    app = LudicApp()
+    backend = MemoryBuckets()
+
+    @app.get("/search")
+    @rate_limit(rate=0.1, burst=2, backend=backend)
+    async def search() -> div:
+        return div("results")
+
+    with TestClient(app) as client:
+        assert client.get("/search").status_code == 200
+        assert client.get("/search").status_code == 200
+        response = client.get("/search")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "10"
+
+
+def test_rate_limit_by_header_in_register_route() -> None:
+    app = LudicApp()
+    limit = RateLimit(rate=0.1, key=header("X-API-Key"), backend=MemoryBuckets())
+
+    @app.get("/", rate_limit=limit)
+    def index() -> div:
+        return div("index")
+
+    with TestClient(app) as client:
+        assert client.get("/", headers={"X-API-Key": "a"}).status_code == 200
+        assert client.get("/", headers={"X-API-Key": "a"}).status_code == 429
+        assert client.get("/", headers={"X-API-Key": "b"}).status_code == 200
+
+
+def test_rate_limit_endpoint() -> None:
+    app = LudicApp()
+
+    @app.endpoint("/items")
+    @rate_limit(rate=0.1, backend=MemoryBuckets())
+    class Items(Endpoint[NoAttrs]):
+        @classmethod
+        async def get(cls) -> Endpoint[NoAttrs]:
+            return cls()
+
+        def render(self) -> div:
+            return div("items")
+
+    with TestClient(app) as client:
+        assert client.get("/items").status_code == 200
+        assert client.get("/items").status_code == 429
+
+
+def test_apps_do_not_share_buckets() -> None:
+    def create_app() -> LudicApp:
+        app = LudicApp()
+
+        @app.get("/")
+        @rate_limit(rate=0.1)
+        def index() -> div:
+            return div("index")
+
+        return app
+
+    first, second = create_app(), create_app()
+
+    with TestClient(first) as client:
+        assert client.get("/").status_code == 200
+        assert client.get("/").status_code == 429
+    with TestClient(second) as client:
+        assert client.get("/").status_code == 200
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_rate_limit(rate: float, burst: float) -> None:
+    with pytest.raises(ValueError):
+        rate_limit(rate=rate, burst=burst)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX")
+def test_shared_memory_buckets(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    name = f"ludic-test-{uuid.uuid4().hex[:8]}"
+    lock_path = tmp_path / "buckets.lock"
+    first = SharedMemoryBuckets(name, slots=16, lock_path=lock_path)
+    second = SharedMemoryBuckets(name, slots=16, lock_path=lock_path)
+    try:
+        assert first.consume("key", rate=1, burst=1, now=100) == 0
+        assert second.consume("key", rate=1, burst=1, now=100) == 1
+        assert second.consume("key", rate=1, burst=1, now=101) == 0
+    finally:
+        second.close()
+        first.close()
+        first.unlink()
@@ -0,0 +1,118 @@
+import threading
+
+import anyio
+from starlette.testclient import TestClient
+
+from ludic.attrs import NoAttrs
+from ludic.catalog.pages import Body, Head, HtmlPage
+from ludic.components import Component
+from ludic.html import body, div, head, html, li, style, td, ul
+from ludic.types import NoChildren
+from ludic.web import Endpoint, LudicApp, Request
+from ludic.web.rendering import RenderPolicy, count_elements
+
+RENDER_THREADS: list[str] = []
+
+
+class ThreadName(Component[NoChildren, NoAttrs]):
+    def render(self) -> div:
+        RENDER_THREADS.append(threading.current_thread().name)
+        return div("thread")
+
+
+def test_count_elements() -> None:
+    tree = ul(*(li(str(i)) for i in range(10)))
+    assert count_elements(tree, limit=100) == 11
+    assert count_elements(tree, limit=5) == 5
+
+
+def test_choose_mode() -> None:
+    small, large = div("small"), ul(*(li(str(i)) for i in range(20)))
+
+    policy = RenderPolicy("auto", thread_threshold=10)
+    assert policy.choose_mode(small) == "inline"
+    assert policy.choose_mode(large) == "thread"
+
+    policy = RenderPolicy("auto", thread_threshold=5, process_threshold=10)
+    assert policy.choose_mode(large) == "process"
+    assert RenderPolicy("thread").choose_mode(small) == "thread"
+
+
+def test_render_in_process() -> None:
+    element = ul(*(li(str(i)) for i in range(3)))
+    element.context["request"] = object()
+
+    html = anyio.run(RenderPolicy("process").render, element)
+
+    assert html == "<ul><li>0</li><li>1</li><li>2</li></ul>"
+    assert "request" in element.context
+
+
+def test_render_critical_styles_in_process() -> None:
+    policy = RenderPolicy("process")
+    page = HtmlPage(Head(critical_styles=True), Body(div("content")))
+    result = anyio.run(policy.render, page)
+    assert "ludic-critical-styles" not in result
+    assert "box-sizing: border-box;" in result
+
+    page = html(
+        head(style.critical(), style.inline_classes()),
+        body(td("cell", style={"color": "red"})),
+    )
+    result = anyio.run(policy.render, page)
+    assert "ludic-" not in result
+    assert "{ color: red; }" in result
+
+
+def test_render_policy_per_route() -> None:
+    app = LudicApp()
+
+    @app.get("/inline")
+    async def inline() -> ThreadName:
+        return ThreadName()
+
+    @app.get("/thread", render_policy=RenderPolicy("thread", max_concurrency=1))
+    async def thread() -> ThreadName:
+        return ThreadName()
+
+    with TestClient(app) as client:
+        RENDER_THREADS.clear()
+        assert client.get("/inline").text == "<div>thread</div>"
+        assert client.get("/thread").text == "<div>thread</div>"
+        assert RENDER_THREADS[0] != RENDER_THREADS[1]
+
+
+def test_render_policy_of_endpoint_and_app() -> None:
+    app = LudicApp(render_policy=RenderPolicy("thread"))
+
+    @app.get("/")
+    async def index(request: Request) -> div:
+        return div(request.url.path)
+
+    @app.endpoint("/endpoint")
+    class Index(Endpoint[NoAttrs]):
+        render_policy = RenderPolicy("inline")
+
+        @classmethod
+        async def get(cls) -> Endpoint[NoAttrs]:
+            return cls()
+
+        def render(self) -> div:
+            return div("endpoint")
+
+    with TestClient(app) as client:
+        assert client.get("/").text == "<div>/</div>"
+        assert client.get("/endpoint").text == "<div>endpoint</div>"
+
+
+def test_limiter_is_used_for_sync_handlers() -> None:
+    policy = RenderPolicy(max_concurrency=2)
+    app = LudicApp()
+
+    @app.get("/", render_policy=policy)
+    def index() -> div:
+        assert policy.limiter is not None
+        return div(str(policy.limiter.borrowed_tokens))
+
+    with TestClient(app) as client:
+        assert client.get("/").text == "<div>1</div>"
@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 from starlette._utils import AwaitableOrContextManager, AwaitableOrContextManagerWrapper
 from starlette.applications import Starlette
+from starlette.background import BackgroundTask, BackgroundTasks
 from starlette.datastructures import FormData, Headers, QueryParams
 from starlette.requests import Request
 from starlette.responses import Response
@@ -14,10 +15,13 @@ from starlette.testclient import TestClient
 from starlette.websockets import WebSocket
 
 from ludic.base import BaseElement
+from ludic.html import div
+from ludic.web import LudicApp
 from ludic.web.parsers import BaseParser
 from ludic.web.responses import (
     LudicResponse,
     extract_from_request,
+    extract_response_background,
     extract_response_status_headers,
     prepare_response,
 )
@@ -249,3 +253,38 @@ def test_prepare_response_handler_exception() -> None:
 
     with pytest.raises(RuntimeError):
         client.get("/fail")
+
+
+def test_extract_response_background() -> None:
+    task = BackgroundTask(print)
+
+    assert extract_response_background(("hello", task)) == ("hello", task)
+    assert extract_response_background(("hello", 201, task)) == (
+        ("hello", 201),
+        task,
+    )
+    assert extract_response_background(("hello", 201)) == (("hello", 201), None)
+    assert extract_response_background("hello") == ("hello", None)
+
+
+def test_background_tasks_run_after_response() -> None:
+    app = LudicApp()
+    calls: list[str] = []
+
+    @app.post("/returned")
+    async def returned() -> tuple[div, int, BackgroundTask]:
+        return div("created"), 201, BackgroundTask(calls.append, "returned")
+
+    @app.post("/injected")
+    def injected(tasks: BackgroundTasks, other: BackgroundTasks) -> div:
+        assert tasks is other
+        tasks.add_task(calls.append, "injected")
+        return div("done")
+
+    with TestClient(app) as client:
+        response = client.post("/returned")
+        assert response.status_code == 201
+        assert response.text == "<div>created</div>"
+        assert client.post("/injected").text == "<div>done</div>"
+
+    assert calls == ["returned", "injected"]
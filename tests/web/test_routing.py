@@ -1,9 +1,19 @@
+import time
+from collections.abc import AsyncIterator
+
+import anyio
 import pytest
+from starlette.responses import StreamingResponse
 from starlette.testclient import TestClient
+from starlette.types import Message
 
+from ludic.attrs import NoAttrs
 from ludic.html import div
-from ludic.web import LudicApp
+from ludic.web import Endpoint, LudicApp, Request
 from ludic.web.datastructures import Headers
+from ludic.web.exceptions import GatewayTimeoutError
+from ludic.web.fragments import Fragments
+from ludic.web.routing import cancel_on_disconnect
 
 app = LudicApp()
 
@@ -51,3 +61,146 @@ def test_kw_only_params() -> None:
 def test_invalid_signature() -> None:
     with TestClient(app) as client, pytest.raises(TypeError):
         client.get("/invalid-signature?bar=something")
+
+
+def test_route_timeout() -> None:
+    timeout_app = LudicApp()
+    cancelled: list[bool] = []
+
+    @timeout_app.get("/slow", timeout=0.05)
+    async def slow() -> div:
+        try:
+            await anyio.sleep(1)
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(True)
+            raise
+        return div("slow")
+
+    @timeout_app.get("/fast", timeout=1)
+    async def fast(request: Request) -> div:
+        assert request.time_remaining is not None
+        return div("degraded" if request.time_remaining < 0.5 else "full")
+
+    @timeout_app.exception_handler(504)
+    async def gateway_timeout(exc: GatewayTimeoutError) -> div:
+        return div(exc.detail)
+
+    with TestClient(timeout_app) as client:
+        response = client.get("/slow")
+        assert response.status_code == 504
+        assert response.text == "<div>Gateway Timeout</div>"
+        assert cancelled == [True]
+        assert client.get("/fast").text == "<div>full</div>"
+
+
+def test_endpoint_timeout() -> None:
+    timeout_app = LudicApp()
+
+    @timeout_app.endpoint("/endpoint")
+    class Slow(Endpoint[NoAttrs]):
+        timeout = 0.05
+
+        @classmethod
+        async def get(cls) -> Endpoint[NoAttrs]:
+            await anyio.sleep(1)
+            return cls()
+
+        def render(self) -> div:
+            return div("slow")
+
+    with TestClient(timeout_app) as client:
+        assert client.get("/endpoint").status_code == 504
+
+
+def test_route_timeout_aborts_streamed_fragments() -> None:
+    timeout_app = LudicApp()
+    rendered: list[str] = []
+
+    class SlowDiv(div):
+        def to_html(self) -> str:
+            time.sleep(0.05)
+            rendered.append(self.text)
+            return super().to_html()
+
+    @timeout_app.get("/stream", timeout=0.03)
+    def stream() -> Fragments:
+        return Fragments(SlowDiv("one"), SlowDiv("two"), SlowDiv("three"))
+
+    with TestClient(timeout_app) as client, pytest.raises(TimeoutError):
+        client.get("/stream")
+    assert rendered == ["one"]
+
+
+def disconnect_after(app: LudicApp, path: str, delay: float) -> list[Message]:
+    async def main() -> list[Message]:
+        messages: list[Message] = [{"type": "http.request", "body": b""}]
+        sent: list[Message] = []
+
+        async def receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            await anyio.sleep(delay)
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "headers": [],
+            "query_string": b"",
+        }
+        with anyio.fail_after(0.5):
+            await app(scope, receive, send)
+        return sent
+
+    return anyio.run(main)
+
+
+def test_handler_is_cancelled_on_disconnect() -> None:
+    disconnect_app = LudicApp()
+    cancelled: list[bool] = []
+
+    @disconnect_app.get("/search")
+    @cancel_on_disconnect
+    async def search() -> div:
+        try:
+            await anyio.sleep(1)
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(True)
+            raise
+        return div("results")
+
+    @disconnect_app.get("/slow")
+    async def slow() -> div:
+        await anyio.sleep(0.1)
+        return div("slow")
+
+    assert disconnect_after(disconnect_app, "/search", 0.05) == []
+    assert cancelled == [True]
+    assert disconnect_app.cancelled_requests["search"] == 1
+
+    # Routes which did not opt in are not watched.
+    sent = disconnect_after(disconnect_app, "/slow", 0.05)
+    assert sent[-1]["body"] == b"<div>slow</div>"
+    assert "slow" not in disconnect_app.cancelled_requests
+
+
+def test_started_responses_are_not_counted_as_cancelled() -> None:
+    disconnect_app = LudicApp()
+
+    @disconnect_app.get("/feed")
+    @cancel_on_disconnect
+    async def feed() -> StreamingResponse:
+        async def events() -> AsyncIterator[str]:
+            yield "first"
+            await anyio.sleep(1)
+            yield "second"
+
+        return StreamingResponse(events())
+
+    sent = disconnect_after(disconnect_app, "/feed", 0.05)
+    assert [message.get("body") for message in sent[1:]] == [b"first"]
+    assert "feed" not in disconnect_app.cancelled_requests
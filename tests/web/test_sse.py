@@ -0,0 +1,33 @@
+from collections.abc import AsyncIterator
+
+from starlette.testclient import TestClient
+
+from ludic.html import b, div
+from ludic.web import LudicApp
+from ludic.web.sse import ServerSentEvent
+
+
+def test_server_sent_event_encode() -> None:
+    event = ServerSentEvent(div(b("a"), "\nb"), event="update", id="1")
+    assert event.encode() == (
+        b"event: update\nid: 1\ndata: <div><b>a</b>\ndata: b</div>\n\n"
+    )
+
+
+def test_sse_endpoint_streams_rendered_elements() -> None:
+    app = LudicApp()
+
+    @app.sse("/events/{count:int}")
+    async def events(count: int) -> AsyncIterator[div | tuple[str, b]]:
+        for index in range(count):
+            yield div(f"item {index}")
+        yield "done", b("done")
+
+    with TestClient(app) as client:
+        response = client.get(app.url_path_for("events", count=2))
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            "data: <div>item 0</div>\n\n"
+            "data: <div>item 1</div>\n\n"
+            "event: done\ndata: <b>done</b>\n\n"
+        )
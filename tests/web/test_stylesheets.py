@@ -0,0 +1,149 @@
+import re
+from pathlib import Path
+
+from starlette.testclient import TestClient
+
+from ludic.attrs import NoAttrs
+from ludic.catalog.pages import Body, Head, HtmlPage
+from ludic.components import COMPONENT_REGISTRY, Component
+from ludic.html import b, p, style
+from ludic.styles import themes
+from ludic.styles.build import MANIFEST_NAME, build_stylesheets
+from ludic.styles.types import Color
+from ludic.web import LudicApp
+from ludic.web.stylesheets import Stylesheet, Stylesheets
+
+
+def test_stylesheet_per_theme() -> None:
+    stylesheets = Stylesheets()
+    light = stylesheets.get(themes.LightTheme())
+    dark = stylesheets.get(themes.DarkTheme())
+
+    assert light.digest != dark.digest
+    assert stylesheets.get(themes.LightTheme()) is light
+    assert stylesheets.find(dark.digest) is dark
+    assert stylesheets.find("unknown") is None
+    assert light == Stylesheet.from_theme(themes.LightTheme())
+
+
+def test_stylesheets_of_configured_themes_are_found_by_any_worker() -> None:
+    linked = Stylesheets(themes=[themes.DarkTheme()]).get(themes.DarkTheme())
+
+    # Another worker has not rendered a page with the dark theme yet.
+    assert Stylesheets(themes=[themes.DarkTheme()]).find(linked.digest) == linked
+    assert Stylesheets().find(linked.digest) is None
+
+
+def test_stylesheets_follow_styled_components() -> None:
+    stylesheets = Stylesheets()
+    dark = stylesheets.get(themes.DarkTheme())
+
+    with COMPONENT_REGISTRY.scope():
+
+        class Plain(Component[str, NoAttrs]):
+            def render(self) -> b:
+                return b(*self.children)
+
+        assert stylesheets.get(themes.DarkTheme()) is dark
+
+        class Styled(Plain):
+            styles = style.use(lambda theme: {"b.styled": {"color": "red"}})
+
+        styled = stylesheets.get(themes.DarkTheme())
+        assert styled.digest != dark.digest
+
+    # Pages rendered earlier still link the replaced stylesheets.
+    assert stylesheets.get(themes.DarkTheme()).digest == dark.digest
+    assert stylesheets.find(styled.digest) is styled
+
+
+def test_head_links_cacheable_stylesheet() -> None:
+    app = LudicApp(serve_styles=True)
+
+    @app.get("/")
+    def index() -> HtmlPage:
+        return HtmlPage(Head(title="Page"), Body(p("content")))
+
+    with TestClient(app) as client:
+        page = client.get("/").text
+        assert "<style" not in page
+        match = re.search(r'<link rel="stylesheet" href="([^"]+)">', page)
+        assert match is not None
+
+        path = match.group(1)
+        assert re.fullmatch(r"/_ludic/styles-[0-9a-f]{16}\.css", path)
+
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/css")
+        assert "immutable" in response.headers["cache-control"]
+        assert response.content == app.stylesheets.get().content
+
+        etag = response.headers["etag"]
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        assert client.get("/_ludic/styles-0000000000000000.css").status_code == 404
+
+
+def test_head_inlines_styles_without_app() -> None:
+    assert "<style" in Head(title="Page").to_html()
+
+
+def test_app_inlines_styles_by_default() -> None:
+    app = LudicApp()
+
+    @app.get("/")
+    def index() -> HtmlPage:
+        return HtmlPage(Head(title="Page"), Body(p("content")))
+
+    with TestClient(app) as client:
+        page = client.get("/").text
+        assert "<style" in page
+        assert 'rel="stylesheet"' not in page
+    assert app.stylesheets is None
+
+
+def test_stylesheet_shared_by_themes_with_css_variables() -> None:
+    stylesheets = Stylesheets(css_variables=True)
+    light = stylesheets.get(themes.LightTheme())
+    custom = stylesheets.get(
+        themes.LightTheme(colors=themes.Colors(primary=Color("#c2e7fd")))
+    )
+
+    assert light.digest == custom.digest
+    assert b"var(--color-" in light.content
+
+    variables = stylesheets.format_variables(themes.DarkTheme())
+    assert variables is not None
+    assert f"--color-dark: {themes.DarkTheme().colors.dark};" in variables
+    assert stylesheets.format_variables(themes.DarkTheme()) is variables
+
+    # Only the custom properties referenced by the stylesheet are set.
+    referenced = set(re.findall(r"var\(--([\w-]+)\)", light.content.decode()))
+    assert set(re.findall(r"--([\w-]+):", variables)) == referenced
+    assert Stylesheets().format_variables() is None
+
+
+def test_stylesheets_from_manifest(tmp_path: Path) -> None:
+    manifest = build_stylesheets([themes.DarkTheme()], tmp_path)
+    entry = manifest[themes.DarkTheme().content_hash]
+    app = LudicApp(styles_manifest=tmp_path / MANIFEST_NAME)
+
+    stylesheet = app.stylesheets.get(themes.DarkTheme())
+    assert stylesheet.digest == entry["digest"]
+    assert stylesheet.content == (tmp_path / entry["path"]).read_bytes()
+    assert app.stylesheets.get(themes.LightTheme()).digest != entry["digest"]
+
+    @app.get("/")
+    def index() -> HtmlPage:
+        return themes.DarkTheme().use(HtmlPage(Head(title="Page"), Body(p("content"))))
+
+    with TestClient(app) as client:
+        page = client.get("/").text
+        assert f'href="/_ludic/styles-{entry["digest"]}.css"' in page
+
+        response = client.get(f"/_ludic/styles-{entry['digest']}.css")
+        assert response.status_code == 200
+        assert response.content == stylesheet.content
@@ -0,0 +1,83 @@
+from collections.abc import AsyncIterator
+
+import anyio
+from starlette.testclient import TestClient
+
+from ludic.html import b, div
+from ludic.web import LudicApp
+from ludic.web.websockets import BroadcastHub, WebSocket
+
+
+def test_ws_endpoint_sends_rendered_elements() -> None:
+    app = LudicApp()
+
+    @app.ws("/ws/{name}")
+    async def greet(name: str) -> AsyncIterator[b]:
+        yield b(f"Hello {name}")
+        yield b("Bye")
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/John") as websocket:
+            assert websocket.receive_text() == "<b>Hello John</b>"
+            assert websocket.receive_text() == "<b>Bye</b>"
+
+
+def test_broadcast_hub_renders_once_for_all_subscribers() -> None:
+    hub = BroadcastHub(queue_size=1)
+    rendered: list[str] = []
+
+    class CountingDiv(div):
+        def to_html(self) -> str:
+            rendered.append("div")
+            return super().to_html()
+
+    async def main() -> None:
+        with hub.subscribe("news") as first, hub.subscribe("news") as second:
+            assert hub.subscribers("news") == 2
+            assert hub.publish("news", CountingDiv("one")) == 2
+            assert (await anext(first))["text"] == "<div>one</div>"
+
+            # The second subscriber did not consume its message and is evicted.
+            assert hub.publish("news", CountingDiv("two")) == 1
+            assert second.evicted
+            assert hub.evicted_count == 1
+            assert (await anext(first))["text"] == "<div>two</div>"
+
+        assert hub.subscribers("news") == 0
+        assert hub.publish("news", "nobody") == 0
+
+    anyio.run(main)
+    assert rendered == ["div", "div"]
+
+
+def test_broadcast_hub_serves_websocket() -> None:
+    app = LudicApp()
+    hub = BroadcastHub()
+
+    @app.ws("/ws")
+    async def feed(websocket: WebSocket) -> None:
+        await hub.serve(websocket, "feed")
+
+    @app.post("/publish")
+    async def publish() -> None:
+        hub.publish("feed", b("update"))
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws") as websocket:
+            while hub.subscribers("feed") == 0:
+                anyio.run(anyio.sleep, 0.01)
+            client.post("/publish")
+            assert websocket.receive_text() == "<b>update</b>"
+
+
+def test_broadcast_hub_encodes_binary_frames_once() -> None:
+    hub = BroadcastHub(binary=True)
+
+    async def main() -> None:
+        with hub.subscribe("news") as first, hub.subscribe("news") as second:
+            assert hub.publish("news", b("caf\u00e9")) == 2
+            message = await anext(first)
+            assert message["bytes"] == "<b>caf\u00e9</b>".encode()
+            assert await anext(second) is message
+
+    anyio.run(main)